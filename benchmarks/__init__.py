@@ -0,0 +1,33 @@
+"""Measures the speed of the Narcotics Tracker.
+
+The benchmarks run common operations against generated databases of different
+sizes and report how many operations complete each second along with the
+median (p50) and 95th percentile (p95) time of a single operation.
+
+Modules:
+
+    datasets: Generates and reuses the databases used by the benchmarks.
+
+    scenarios: Defines the operations which are measured.
+
+    runner: Runs the scenarios and reports the results.
+
+    compare: Compares benchmark results to a stored baseline.
+
+How To Use:
+
+    Run the benchmarks from the root of the repository. The databases are
+    generated in the data directory the first time each size is used.
+
+    ```
+    python -m benchmarks.runner --sizes small medium --json results.json
+    ```
+
+    Compare the results of a change to a stored baseline. The command exits 
+    with a non-zero status when any benchmark regressed.
+
+    ```
+    python -m benchmarks.compare --baseline baseline.json --update
+    python -m benchmarks.compare --baseline baseline.json --tolerance 0.3
+    ```
+"""
@@ -0,0 +1,313 @@
+"""Compares benchmark results to a stored baseline.
+
+The comparison fails when a benchmark's time grows by more than its tolerance.
+The exit status is non-zero when any benchmark regressed so the comparison
+can be used as a gate before merging changes.
+
+Baseline Format:
+
+    The baseline is a JSON file. Each benchmark stores its p50 and p95 times
+    in seconds and its throughput. A benchmark may store its own tolerance,
+    otherwise the default tolerance is used. A tolerance of 0.25 allows the
+    time to grow by 25%.
+
+    ```json
+    {
+        "version": 1,
+        "metric": "p50",
+        "default_tolerance": 0.25,
+        "benchmarks": {
+            "sqlite_read/small": {
+                "p50": 0.00016,
+                "p95": 0.00089,
+                "throughput": 2976.5,
+                "tolerance": 0.5
+            }
+        }
+    }
+    ```
+
+Usage:
+
+    Create or update the baseline, keeping the stored tolerances:
+
+        python -m benchmarks.compare --baseline baseline.json --update
+
+    Run the benchmarks and compare them to the baseline:
+
+        python -m benchmarks.compare --baseline baseline.json
+
+Classes:
+
+    Comparison: The result of comparing one benchmark to the baseline.
+
+Functions:
+
+    main: Parses the arguments, compares the results and returns the exit
+        status.
+
+    create_baseline: Returns a baseline built from benchmark results.
+
+    compare_results: Compares benchmark results to a baseline.
+
+    format_comparisons: Returns the comparisons as a table.
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import dataclass
+
+from benchmarks.datasets import DATASET_SIZES
+from benchmarks.runner import run_suite
+
+BASELINE_VERSION = 1
+
+
+@dataclass
+class Comparison:
+    """The result of comparing one benchmark to the baseline.
+
+    Attributes:
+        name (str): The name of the benchmark.
+
+        baseline (float): The time stored in the baseline. None for new
+            benchmarks.
+
+        current (float): The time measured now. None for missing benchmarks.
+
+        tolerance (float): The allowed growth as a fraction of the baseline.
+
+        status (str): One of 'ok', 'faster', 'regressed', 'new' or 'missing'.
+    """
+
+    name: str
+    baseline: float
+    current: float
+    tolerance: float
+    status: str
+
+    @property
+    def change(self) -> float:
+        """Returns the change in time as a fraction of the baseline."""
+        if not self.baseline or self.current is None:
+            return None
+
+        return self.current / self.baseline - 1
+
+
+def main(arguments: list[str] = None) -> int:
+    """Parses the arguments, compares the results and returns the exit status.
+
+    Args:
+        arguments (list[str], optional): The command line arguments. Defaults
+            to the arguments passed to the script.
+
+    Returns:
+        int: 1 if any benchmark regressed, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(
+        description="Compares benchmark results to a stored baseline."
+    )
+    parser.add_argument("--baseline", required=True, help="Baseline JSON file.")
+    parser.add_argument(
+        "--results", help="Compare this results file instead of running."
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", default=["small"], choices=list(DATASET_SIZES)
+    )
+    parser.add_argument("--samples", type=int, default=30)
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--metric", choices=("p50", "p95"))
+    parser.add_argument(
+        "--tolerance", type=float, help="Overrides the default tolerance."
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="Write the results as the baseline."
+    )
+    settings = parser.parse_args(arguments)
+
+    results = _load_results(settings)
+    baseline = None
+    if os.path.exists(settings.baseline):
+        with open(settings.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    if settings.update:
+        baseline = create_baseline(results, baseline, settings.metric)
+        with open(settings.baseline, "w") as baseline_file:
+            json.dump(baseline, baseline_file, indent=4)
+        print(f"Baseline written to {settings.baseline}.")
+        return 0
+
+    if baseline is None:
+        print(f"Baseline {settings.baseline} does not exist. Use --update.")
+        return 1
+
+    comparisons = compare_results(
+        baseline, results, settings.metric, settings.tolerance
+    )
+    print(format_comparisons(comparisons))
+
+    regressions = [item for item in comparisons if item.status == "regressed"]
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed.")
+        return 1
+
+    return 0
+
+
+def create_baseline(
+    results: dict[str, dict], previous: dict = None, metric: str = None
+) -> dict:
+    """Returns a baseline built from benchmark results.
+
+    Tolerances, the metric and the default tolerance are kept from the
+    previous baseline.
+
+    Args:
+        results (dict[str, dict]): Maps benchmark names to their results.
+
+        previous (dict, optional): The baseline being replaced.
+
+        metric (str, optional): The time compared by default. Either 'p50' or
+            'p95'. Defaults to the previous metric or 'p50'.
+    """
+    previous = previous or {}
+    previous_benchmarks = previous.get("benchmarks", {})
+    benchmarks = {}
+
+    for name, result in sorted(results.items()):
+        entry = {
+            "p50": result["p50"],
+            "p95": result["p95"],
+            "throughput": result["throughput"],
+        }
+        if "tolerance" in previous_benchmarks.get(name, {}):
+            entry["tolerance"] = previous_benchmarks[name]["tolerance"]
+        benchmarks[name] = entry
+
+    return {
+        "version": BASELINE_VERSION,
+        "metric": metric or previous.get("metric", "p50"),
+        "default_tolerance": previous.get("default_tolerance", 0.25),
+        "benchmarks": benchmarks,
+    }
+
+
+def compare_results(
+    baseline: dict,
+    results: dict[str, dict],
+    metric: str = None,
+    tolerance: float = None,
+) -> list[Comparison]:
+    """Compares benchmark results to a baseline.
+
+    Args:
+        baseline (dict): The baseline loaded from its JSON file.
+
+        results (dict[str, dict]): Maps benchmark names to their results.
+
+        metric (str, optional): The time compared. Either 'p50' or 'p95'.
+            Defaults to the metric of the baseline.
+
+        tolerance (float, optional): Replaces the default tolerance of the
+            baseline. Tolerances of individual benchmarks are still used.
+
+    Raises:
+        ValueError: The baseline version is not supported.
+    """
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Baseline version {baseline.get('version')} not supported.")
+
+    metric = metric or baseline.get("metric", "p50")
+    default_tolerance = (
+        tolerance if tolerance is not None else baseline["default_tolerance"]
+    )
+    benchmarks = baseline["benchmarks"]
+    comparisons = []
+
+    for name in sorted(set(benchmarks) | set(results)):
+        entry = benchmarks.get(name)
+        allowed = default_tolerance
+        if entry:
+            allowed = entry.get("tolerance", default_tolerance)
+
+        if entry is None:
+            current = results[name][metric]
+            comparisons.append(Comparison(name, None, current, allowed, "new"))
+            continue
+
+        if name not in results:
+            comparisons.append(
+                Comparison(name, entry[metric], None, allowed, "missing")
+            )
+            continue
+
+        previous, current = entry[metric], results[name][metric]
+        if current > previous * (1 + allowed):
+            status = "regressed"
+        elif current < previous * (1 - allowed):
+            status = "faster"
+        else:
+            status = "ok"
+        comparisons.append(Comparison(name, previous, current, allowed, status))
+
+    return comparisons
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    """Returns the comparisons as a table.
+
+    Args:
+        comparisons (list[Comparison]): The results of compare_results.
+    """
+    width = max([len(comparison.name) for comparison in comparisons] + [9])
+    lines = [
+        f"{'Benchmark':<{width}}  {'baseline (ms)':>13}  {'current (ms)':>12}  "
+        f"{'change':>8}  {'allowed':>8}  status"
+    ]
+
+    for comparison in comparisons:
+        baseline = _format_milliseconds(comparison.baseline)
+        current = _format_milliseconds(comparison.current)
+        change = comparison.change
+        change = "-" if change is None else f"{change:+.1%}"
+
+        lines.append(
+            f"{comparison.name:<{width}}  {baseline:>13}  {current:>12}  "
+            f"{change:>8}  {comparison.tolerance:>8.0%}  {comparison.status}"
+        )
+
+    return "\n".join(lines)
+
+
+def _format_milliseconds(seconds: float) -> str:
+    """Returns a time in seconds as milliseconds, or '-' if missing."""
+    if seconds is None:
+        return "-"
+
+    return f"{seconds * 1000:.3f}"
+
+
+def _load_results(settings: argparse.Namespace) -> dict[str, dict]:
+    """Returns the results from a file or by running the benchmarks."""
+    if settings.results:
+        with open(settings.results) as results_file:
+            return json.load(results_file)["results"]
+
+    results = run_suite(settings.sizes, settings.samples, name_filter=settings.filter)
+
+    return {
+        result.name: {
+            "p50": result.p50,
+            "p95": result.p95,
+            "throughput": result.throughput,
+        }
+        for result in results
+    }
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Generates and reuses the databases used by the benchmarks.
+
+Classes:
+
+    DatasetSize: The settings used to generate a benchmark database.
+
+Functions:
+
+    prepare_dataset: Returns the filename of the database for a size,
+        generating it if needed.
+"""
+
+import os
+from dataclasses import dataclass
+
+from narcotics_tracker.scripts import generate_load_data
+
+
+@dataclass(frozen=True)
+class DatasetSize:
+    """The settings used to generate a benchmark database.
+
+    Attributes:
+        medications (int): The number of medications.
+
+        years (int): The number of years of reporting periods.
+
+        adjustments (int): The number of adjustments.
+    """
+
+    medications: int
+    years: int
+    adjustments: int
+
+
+DATASET_SIZES = {
+    "small": DatasetSize(medications=3, years=1, adjustments=2_000),
+    "medium": DatasetSize(medications=5, years=3, adjustments=100_000),
+    "large": DatasetSize(medications=8, years=5, adjustments=1_000_000),
+}
+
+
+def prepare_dataset(size: str, regenerate: bool = False) -> str:
+    """Returns the filename of the database for a size, generating it if needed.
+
+    Args:
+        size (str): The name of the size. Either 'small', 'medium' or 'large'.
+
+        regenerate (bool, optional): Whether an existing database is
+            replaced. Defaults to False.
+    """
+    settings = DATASET_SIZES[size]
+    prefix = f"benchmark_{size}"
+    filename = f"{prefix}_01.db"
+
+    if regenerate or not os.path.exists(f"data/{filename}"):
+        arguments = [
+            "--prefix",
+            prefix,
+            "--medications",
+            str(settings.medications),
+            "--years",
+            str(settings.years),
+            "--adjustments",
+            str(settings.adjustments),
+        ]
+        generate_load_data.main(arguments)
+
+    return filename
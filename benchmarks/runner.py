@@ -0,0 +1,262 @@
+"""Runs the scenarios and reports the results.
+
+Classes:
+
+    BenchmarkResult: The measurements of a scenario at a dataset size.
+
+Functions:
+
+    main: Parses the arguments, runs the benchmarks and prints the results.
+
+    run_suite: Runs every scenario against each dataset size.
+
+    run_scenario: Times a scenario and returns its result.
+
+    percentile: Returns a percentile of a list of samples.
+
+    format_results: Returns the results as a table.
+
+    save_results: Writes the results to a JSON file.
+"""
+
+import argparse
+import json
+import math
+import platform
+import time
+from dataclasses import asdict, dataclass
+
+from benchmarks.datasets import DATASET_SIZES, prepare_dataset
+from benchmarks.scenarios import Scenario, return_scenarios
+from narcotics_tracker.services.memory_sqlite_manager import MemorySQLiteManager
+from narcotics_tracker.services.service_manager import ServiceManager
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+
+@dataclass
+class BenchmarkResult:
+    """The measurements of a scenario at a dataset size.
+
+    Attributes:
+        name (str): The name of the benchmark, the scenario and size joined
+            by a slash.
+
+        samples (int): The number of samples taken.
+
+        operations (int): The number of operations performed.
+
+        mean (float): The mean time of one operation in seconds.
+
+        p50 (float): The median time of one operation in seconds.
+
+        p95 (float): The 95th percentile time of one operation in seconds.
+
+        throughput (float): The number of operations per second.
+    """
+
+    name: str
+    samples: int
+    operations: int
+    mean: float
+    p50: float
+    p95: float
+    throughput: float
+
+
+def main(arguments: list[str] = None) -> list[BenchmarkResult]:
+    """Parses the arguments, runs the benchmarks and prints the results.
+
+    Args:
+        arguments (list[str], optional): The command line arguments. Defaults
+            to the arguments passed to the script.
+    """
+    parser = argparse.ArgumentParser(description="Runs the benchmark suite.")
+    parser.add_argument(
+        "--sizes", nargs="+", default=["small"], choices=list(DATASET_SIZES)
+    )
+    parser.add_argument("--samples", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument(
+        "--filter", default="", help="Only run scenarios containing this text."
+    )
+    parser.add_argument("--json", help="Write the results to this file.")
+    parser.add_argument("--regenerate", action="store_true")
+    parser.add_argument(
+        "--in-memory",
+        action="store_true",
+        help="Copy each dataset into an in-memory database before running.",
+    )
+    settings = parser.parse_args(arguments)
+
+    results = run_suite(
+        settings.sizes,
+        settings.samples,
+        settings.warmup,
+        settings.filter,
+        settings.regenerate,
+        settings.in_memory,
+    )
+
+    print(format_results(results))
+    if settings.json:
+        save_results(results, settings.json)
+
+    return results
+
+
+def run_suite(
+    sizes: list[str],
+    samples: int = 30,
+    warmup: int = 3,
+    name_filter: str = "",
+    regenerate: bool = False,
+    in_memory: bool = False,
+) -> list[BenchmarkResult]:
+    """Runs every scenario against each dataset size.
+
+    The ServiceManager uses the database of each dataset while its scenarios
+    run and is restored afterwards.
+
+    Args:
+        sizes (list[str]): The names of the dataset sizes.
+
+        samples (int, optional): The number of samples taken for each
+            scenario. Defaults to 30.
+
+        warmup (int, optional): The number of untimed samples taken first.
+            Defaults to 3.
+
+        name_filter (str, optional): Only run scenarios containing this text.
+            Defaults to running all scenarios.
+
+        regenerate (bool, optional): Whether the databases are generated
+            again. Defaults to False.
+
+        in_memory (bool, optional): Whether each dataset is copied into an
+            in-memory database so that no time is spent on file access.
+            Defaults to False.
+    """
+    results = []
+    default_database = ServiceManager._database
+
+    try:
+        for size in sizes:
+            filename = prepare_dataset(size, regenerate)
+            ServiceManager._database = filename
+            receiver = SQLiteManager(filename)
+            if in_memory:
+                memory_receiver = MemorySQLiteManager(f"benchmark_{size}")
+                receiver.connection.backup(memory_receiver.connection)
+                receiver = memory_receiver
+
+            for scenario in return_scenarios(receiver):
+                if name_filter not in scenario.name:
+                    continue
+                results.append(run_scenario(scenario, size, samples, warmup))
+
+            receiver.connection.execute("DROP TABLE IF EXISTS benchmark_rows")
+            if in_memory:
+                receiver.delete_database()
+    finally:
+        ServiceManager._database = default_database
+
+    return results
+
+
+def run_scenario(
+    scenario: Scenario, size: str, samples: int = 30, warmup: int = 3
+) -> BenchmarkResult:
+    """Times a scenario and returns its result.
+
+    Args:
+        scenario (Scenario): The scenario to be timed.
+
+        size (str): The name of the dataset size.
+
+        samples (int, optional): The number of samples taken. Defaults to 30.
+
+        warmup (int, optional): The number of untimed samples taken first.
+            Defaults to 3.
+    """
+    function = scenario.function
+    calls = range(scenario.number)
+
+    for _ in range(warmup):
+        for _ in calls:
+            function()
+
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in calls:
+            function()
+        timings.append((time.perf_counter() - start) / scenario.number)
+
+    total_time = sum(timings) * scenario.number
+    operations = samples * scenario.number
+
+    return BenchmarkResult(
+        name=f"{scenario.name}/{size}",
+        samples=samples,
+        operations=operations,
+        mean=total_time / operations,
+        p50=percentile(timings, 50),
+        p95=percentile(timings, 95),
+        throughput=operations / total_time if total_time else math.inf,
+    )
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """Returns a percentile of a list of samples using the nearest rank.
+
+    Args:
+        samples (list[float]): The samples.
+
+        percent (float): The percentile between 0 and 100.
+    """
+    ordered = sorted(samples)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+
+    return ordered[rank - 1]
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    """Returns the results as a table.
+
+    Args:
+        results (list[BenchmarkResult]): The results of the benchmarks.
+    """
+    width = max([len(result.name) for result in results] + [9])
+    lines = [
+        f"{'Benchmark':<{width}}  {'ops/s':>12}  {'p50 (ms)':>10}  {'p95 (ms)':>10}"
+    ]
+
+    for result in results:
+        lines.append(
+            f"{result.name:<{width}}  {result.throughput:>12,.1f}  "
+            f"{result.p50 * 1000:>10.3f}  {result.p95 * 1000:>10.3f}"
+        )
+
+    return "\n".join(lines)
+
+
+def save_results(results: list[BenchmarkResult], filename: str) -> None:
+    """Writes the results to a JSON file.
+
+    Args:
+        results (list[BenchmarkResult]): The results of the benchmarks.
+
+        filename (str): The path of the JSON file.
+    """
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+    with open(filename, "w") as results_file:
+        json.dump(data, results_file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Defines the operations which are measured.
+
+Each scenario is a function without arguments which performs one operation,
+such as adding a row or running a report, against a benchmark database.
+
+Classes:
+
+    Scenario: An operation which is measured by the benchmarks.
+
+Functions:
+
+    return_scenarios: Returns the scenarios for a benchmark database.
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Callable
+
+from narcotics_tracker import commands, reports
+from narcotics_tracker.builders.adjustment_builder import AdjustmentBuilder
+from narcotics_tracker.services.conversion_manager import ConversionManager
+from narcotics_tracker.services.datetime_manager import DateTimeManager
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+
+@dataclass
+class Scenario:
+    """An operation which is measured by the benchmarks.
+
+    Attributes:
+        name (str): The unique name of the scenario.
+
+        function (Callable): Performs the operation once.
+
+        number (int): The number of operations timed together as one sample.
+            Used for operations which are too fast to time individually.
+    """
+
+    name: str
+    function: Callable[[], any]
+    number: int = 1
+
+
+def return_scenarios(receiver: SQLiteManager) -> list[Scenario]:
+    """Returns the scenarios for a benchmark database.
+
+    The AdjustmentBuilder looks up medications and events in the database of
+    the ServiceManager, which must hold the same medications as the
+    benchmark database. The run_suite function points the ServiceManager at
+    the benchmark database while the scenarios run.
+
+    Args:
+        receiver (SQLiteManager): The connection to the benchmark database.
+    """
+    medication_codes = [row[1] for row in commands.ListMedications(receiver).execute()]
+    period_ids = [row[0] for row in commands.ListReportingPeriods(receiver).execute()]
+    medication_cycle = itertools.cycle(medication_codes)
+    criteria_cycle = itertools.cycle(
+        itertools.product(medication_codes, period_ids, ("USE", "WASTE", "ORDER"))
+    )
+
+    receiver.create_table(
+        "benchmark_rows",
+        {"id": "INTEGER PRIMARY KEY", "number": "INTEGER", "word": "TEXT"},
+    )
+    row_numbers = itertools.count()
+
+    def sqlite_add() -> None:
+        receiver.add("benchmark_rows", {"number": next(row_numbers), "word": "Cow"})
+
+    def sqlite_read() -> list[tuple]:
+        medication_code, period_id, event_code = next(criteria_cycle)
+        criteria = {
+            "event_code": event_code,
+            "medication_code": medication_code,
+            "reporting_period_id": period_id,
+        }
+        return receiver.read("inventory", criteria).fetchall()
+
+    builder_medication_cycle = itertools.cycle(medication_codes)
+
+    def build_adjustment() -> None:
+        (
+            AdjustmentBuilder()
+            .set_table("inventory")
+            .set_id()
+            .set_created_date()
+            .set_modified_date()
+            .set_modified_by("Benchmark")
+            .set_adjustment_date("01-15-2021 12:00:00")
+            .set_event_code("USE")
+            .set_medication_code(next(builder_medication_cycle))
+            .set_adjustment_amount(5)
+            .set_reporting_period_id(1)
+            .set_reference_id("Benchmark")
+            .build()
+        )
+
+    converter = ConversionManager()
+
+    def convert_amounts() -> None:
+        standard_amount = converter.to_standard(50, "mcg")
+        converter.to_preferred(standard_amount, "mg")
+        converter.to_milliliters(standard_amount, "mcg", 50)
+
+    dt_manager = DateTimeManager()
+
+    def parse_datetime() -> int:
+        return dt_manager.convert_to_timestamp("07-22-2022 17:00:00")
+
+    def current_inventory() -> list[dict]:
+        return reports.ReturnCurrentInventory(receiver).run()
+
+    def medication_stock() -> float:
+        return reports.ReturnMedicationStock(receiver).run(next(medication_cycle))
+
+    def biannual_inventory() -> dict:
+        return reports.BiAnnualNarcoticsInventory(receiver).run()
+
+    return [
+        Scenario("sqlite_add", sqlite_add, number=10),
+        Scenario("sqlite_read", sqlite_read),
+        Scenario("adjustment_builder", build_adjustment, number=10),
+        Scenario("conversion", convert_amounts, number=1000),
+        Scenario("datetime_parse", parse_datetime, number=100),
+        Scenario("report_current_inventory", current_inventory),
+        Scenario("report_medication_stock", medication_stock),
+        Scenario("report_biannual_inventory", biannual_inventory),
+    ]
@@ -14,12 +14,29 @@ Modules:
 
     Adjustment Commands: Contains the commands for Adjustments.
 
+    Async Commands: Contains the async variants of the Add and List commands.
+
+    Backup Commands: Contains the commands which back up the database and 
+        verify the backups.
+
+    Batch Commands: Contains the command which runs many commands in a single 
+        transaction.
+
+    Change Log Commands: Contains the commands which keep running totals of 
+        the inventory.
+
     Event Commands: Contains the commands for Events.
 
     Medication Commands: Contains the commands for Medications.
 
+    Partition Commands: Contains the command which moves closed periods into 
+        partition files.
+
     Reporting Period Commands: Contains the commands for Reporting Periods.
 
+    Rollup Commands: Contains the commands which roll up the adjustments of 
+        closed periods.
+
     Status Commands: Contains the commands for Statuses.
 
     Table Commands: Contains commands which created and modify tables in the 
@@ -43,18 +60,64 @@ How To Use:
     ```python
     modifier = command.ReturnEventModifier("LOSS")
     ```
+
+    Commands can be queued in a CommandBatch which runs them against one 
+    receiver in a single transaction and returns their results.
+
+    ```python
+    results = (
+        commands.CommandBatch(receiver)
+        .add(commands.AddEvent, event)
+        .add(commands.AddUnit, unit)
+        .execute()
+    )
+    ```
+
+    Async commands are created with an AsyncSQLiteManager and awaited from 
+    an event loop.
+
+    ```python
+    adjustments = await commands.AsyncListAdjustments(receiver).execute()
+    ```
 """
 
 from narcotics_tracker.commands.adjustment_commands import (
     AddAdjustment,
+    AddAdjustments,
     DeleteAdjustment,
     ListAdjustments,
+    ListAdjustmentTotals,
+    LoadAdjustmentFrame,
+    LoadAdjustments,
     UpdateAdjustment,
 )
+from narcotics_tracker.commands.async_commands import (
+    AsyncAddAdjustment,
+    AsyncAddAdjustments,
+    AsyncAddEvent,
+    AsyncAddMedication,
+    AsyncAddReportingPeriod,
+    AsyncAddStatus,
+    AsyncAddUnit,
+    AsyncCommand,
+    AsyncListAdjustments,
+    AsyncListEvents,
+    AsyncListMedications,
+    AsyncListReportingPeriods,
+    AsyncListStatuses,
+    AsyncListUnits,
+)
+from narcotics_tracker.commands.backup_commands import BackupDatabase, VerifyBackup
+from narcotics_tracker.commands.batch_commands import CommandBatch
+from narcotics_tracker.commands.change_log_commands import (
+    ApplyChangeLog,
+    EnableChangeLog,
+)
 from narcotics_tracker.commands.event_commands import (
     AddEvent,
     DeleteEvent,
     ListEvents,
+    LoadEvents,
     ReturnEventModifier,
     UpdateEvent,
 )
@@ -63,16 +126,24 @@ from narcotics_tracker.commands.medication_commands import (
     DeleteMedication,
     ListMedications,
     LoadMedication,
+    LoadMedications,
     ReturnPreferredUnit,
     UpdateMedication,
 )
+from narcotics_tracker.commands.partition_commands import MovePeriodToPartition
 from narcotics_tracker.commands.reporting_period_commands import (
     AddReportingPeriod,
     DeleteReportingPeriod,
     ListReportingPeriods,
     LoadReportingPeriod,
+    LoadReportingPeriods,
     UpdateReportingPeriod,
 )
+from narcotics_tracker.commands.rollup_commands import (
+    ListArchivedAdjustments,
+    RestoreReportingPeriod,
+    RollupReportingPeriod,
+)
 from narcotics_tracker.commands.status_commands import (
     AddStatus,
     DeleteStatus,
@@ -81,11 +152,13 @@ from narcotics_tracker.commands.status_commands import (
 )
 from narcotics_tracker.commands.table_commands import (
     CreateEventsTable,
+    CreateInventoryArchiveTable,
     CreateInventoryTable,
     CreateMedicationsTable,
     CreateReportingPeriodsTable,
     CreateStatusesTable,
     CreateUnitsTable,
+    MigrateInventoryKeys,
 )
 from narcotics_tracker.commands.unit_commands import (
     AddUnit,
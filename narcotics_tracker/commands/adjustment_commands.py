@@ -6,19 +6,37 @@ Classes:
 
     AddAdjustment: Adds an Adjustment to the database.
 
+    AddAdjustments: Adds many Adjustments to the database.
+
     DeleteAdjustment: Deletes a Adjustment from the database by its ID or code.
 
     ListAdjustments: Returns a list of Adjustments.
 
+    ListAdjustmentTotals: Returns the total amount of the Adjustments in each 
+        group.
+
+    LoadAdjustmentFrame: Returns the selected Adjustments as an 
+        AdjustmentFrame.
+
+    LoadAdjustments: Returns a list of Adjustment Objects from the database.
+
     UpdateAdjustment: Updates a Event with the given data and criteria.
+
+Adjustments reference events and medications by their codes. When the 
+inventory table stores integer keys instead, these commands translate the 
+codes using the CodeLookup service.
 """
-from typing import TYPE_CHECKING
+from itertools import groupby
+from typing import TYPE_CHECKING, Iterable
 
 from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.items.adjustment_frame import AdjustmentFrame
+from narcotics_tracker.items.adjustments import Adjustment, CompactAdjustment
+from narcotics_tracker.services.code_lookup import CodeLookup
+from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
 from narcotics_tracker.services.service_manager import ServiceManager
 
 if TYPE_CHECKING:
-    from narcotics_tracker.items.adjustments import Adjustment
     from narcotics_tracker.services.interfaces.persistence import PersistenceService
 
 
@@ -48,12 +66,63 @@ class AddAdjustment(Command):
             adjustment (Adjustment): The Adjustment object to be added to the
                 database.
         """
-        adjustment_info = vars(adjustment)
-        table_name = adjustment_info.pop("table")
+        serializer = DataItemSerializer.for_item(adjustment)
+        values = serializer.return_values(adjustment)
+
+        lookup = CodeLookup.for_receiver(self._receiver)
+        if lookup.uses_integer_keys():
+            values = lookup.translate_values(serializer.columns, values)
+            serializer = lookup.translate_serializer(serializer)
+
+        self._receiver.insert(serializer, values)
+
+        return f"Adjustment added to {serializer.table_name} table."
+
+
+class AddAdjustments(Command):
+    """Adds many Adjustments to the database.
+
+    Adjustments are inserted in groups sharing the same class and table, each
+    group in a single transaction.
+
+    Methods:
+        execute: Executes the add rows operation, returns a success message.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(self, adjustments: Iterable["Adjustment"]) -> str:
+        """Executes the add rows operation, returns a success message.
+
+        Args:
+            adjustments (Iterable[Adjustment]): The Adjustment objects to be
+                added to the database.
+        """
+        lookup = CodeLookup.for_receiver(self._receiver)
+        integer_keys = lookup.uses_integer_keys()
+        count = 0
+
+        for serializer, group in groupby(adjustments, DataItemSerializer.for_item):
+            rows = serializer.return_rows(group)
+
+            if integer_keys:
+                columns = serializer.columns
+                rows = (lookup.translate_values(columns, row) for row in rows)
+                serializer = lookup.translate_serializer(serializer)
 
-        self._receiver.add(table_name, adjustment_info)
+            count += self._receiver.insert_many(serializer, rows)
 
-        return f"Adjustment added to {table_name} table."
+        return f"{count} Adjustments added to the inventory table."
 
 
 class DeleteAdjustment(Command):
@@ -111,8 +180,193 @@ class ListAdjustments(Command):
             order_by (str): The column name by which the results will be
                 sorted.
         """
+        lookup = CodeLookup.for_receiver(self._receiver)
+        if not lookup.uses_integer_keys():
+            cursor = self._receiver.read("inventory", criteria, order_by)
+            return cursor.fetchall()
+
+        criteria = lookup.translate_criteria(criteria)
+        if order_by:
+            order_by = lookup.translate_column_name(order_by)
+
         cursor = self._receiver.read("inventory", criteria, order_by)
-        return cursor.fetchall()
+        return [lookup.translate_row(row) for row in cursor.fetchall()]
+
+
+class ListAdjustmentTotals(Command):
+    """Returns the total amount of the Adjustments in each group.
+
+    The Adjustments are grouped and totalled by a single query.
+
+    Methods:
+        execute: Executes the command and returns the totals.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(
+        self,
+        group_by: tuple[str] = ("reporting_period_id", "event_code", "medication_code"),
+        criteria: dict[str] = {},
+    ) -> list[tuple]:
+        """Executes the command and returns the totals.
+
+        Args:
+            group_by (tuple[str], optional): The names of the columns whose
+                values form the groups. Defaults to the reporting period,
+                event and medication.
+
+            criteria (dict[str, any]): The criteria of Adjustments to be
+                totalled as a dictionary mapping column names to their values.
+
+        Returns:
+            list[tuple]: The values of the group columns followed by the total
+                amount of each group.
+        """
+        group_by = tuple(group_by)
+
+        lookup = CodeLookup.for_receiver(self._receiver)
+        if not lookup.uses_integer_keys():
+            cursor = self._receiver.read_totals("inventory", group_by, "amount", criteria)
+            return cursor.fetchall()
+
+        criteria = lookup.translate_criteria(criteria)
+        key_columns = tuple(lookup.translate_column_name(column) for column in group_by)
+        code_positions = [
+            (position, lookup.code_columns[column][1])
+            for position, column in enumerate(group_by)
+            if column in lookup.code_columns
+        ]
+
+        cursor = self._receiver.read_totals("inventory", key_columns, "amount", criteria)
+        totals = []
+        for row in cursor.fetchall():
+            row = list(row)
+            for position, table_name in code_positions:
+                row[position] = lookup.to_code(table_name, row[position])
+            totals.append(tuple(row))
+
+        return totals
+
+
+class LoadAdjustmentFrame(Command):
+    """Returns the selected Adjustments as an AdjustmentFrame.
+
+    Methods:
+        execute: Executes the command and returns an AdjustmentFrame.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(
+        self, criteria: dict[str, any] = {}, order_by: str = None
+    ) -> AdjustmentFrame:
+        """Executes the command and returns an AdjustmentFrame.
+
+        Args:
+            criteria (dict[str, any]): The criteria of Adjustments to be
+                returned as a dictionary mapping column names to their values.
+
+            order_by (str): The column name by which the results will be
+                sorted.
+        """
+        lookup = CodeLookup.for_receiver(self._receiver)
+        if not lookup.uses_integer_keys():
+            cursor = self._receiver.read("inventory", criteria, order_by)
+            return AdjustmentFrame.from_cursor(cursor)
+
+        criteria = lookup.translate_criteria(criteria)
+        if order_by:
+            order_by = lookup.translate_column_name(order_by)
+
+        cursor = self._receiver.read("inventory", criteria, order_by)
+        frame = AdjustmentFrame.from_cursor(cursor)
+        frame.relabel("event_code", lambda key: lookup.to_code("events", key))
+        frame.relabel("medication_code", lambda key: lookup.to_code("medications", key))
+
+        return frame
+
+
+class LoadAdjustments(Command):
+    """Returns a list of Adjustment Objects from the database.
+
+    Builds the Objects directly from the selected rows. Use this command
+    instead of loading rows one at a time when listing many Adjustment.
+
+    Methods:
+        execute: Executes the command and returns a list of Adjustment.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(
+        self,
+        criteria: dict[str, any] = {},
+        order_by: str = None,
+        compact: bool = False,
+    ) -> list["Adjustment"]:
+        """Executes the command and returns a list of Adjustment.
+
+        Args:
+            criteria (dict[str, any]): The criteria of Adjustment to be
+                returned as a dictionary mapping column names to their values.
+
+            order_by (str): The column name by which the results will be
+                sorted.
+
+            compact (bool, optional): Returns CompactAdjustment Objects when
+                True. Defaults to False.
+        """
+        item_class = CompactAdjustment if compact else Adjustment
+
+        lookup = CodeLookup.for_receiver(self._receiver)
+        if not lookup.uses_integer_keys():
+            return self._receiver.read_items(
+                "inventory", item_class, criteria, order_by
+            )
+
+        criteria = lookup.translate_criteria(criteria)
+        if order_by:
+            order_by = lookup.translate_column_name(order_by)
+
+        cursor = self._receiver.read("inventory", criteria, order_by)
+        columns = [
+            lookup.return_code_column_name(description[0])
+            for description in cursor.description
+        ]
+        build = self._receiver.return_row_factory(item_class, "inventory", columns)
+
+        return [build(cursor, lookup.translate_row(row)) for row in cursor.fetchall()]
 
 
 class UpdateAdjustment(Command):
@@ -145,6 +399,11 @@ class UpdateAdjustment(Command):
                 Adjustments are to be updated as a dictionary mapping the
                 column name to its value.
         """
+        lookup = CodeLookup.for_receiver(self._receiver)
+        if lookup.uses_integer_keys():
+            data = lookup.translate_columns(data)
+            criteria = lookup.translate_columns(criteria)
+
         self._receiver.update("inventory", data, criteria)
 
         return f"Adjustment data updated."
@@ -0,0 +1,172 @@
+"""Contains the async variants of the Add and List commands.
+
+Please see the package documentation for more information.
+
+Each async command runs its synchronous command on a connection's thread of
+an AsyncSQLiteManager, so awaiting it does not block the event loop.
+
+Classes:
+
+    AsyncCommand: Runs a synchronous command without blocking the event loop.
+
+    AsyncAddAdjustment: Adds an Adjustment to the database.
+
+    AsyncAddAdjustments: Adds many Adjustments to the database.
+
+    AsyncListAdjustments: Returns a list of Adjustments.
+
+    AsyncAddEvent: Adds an Event to the database.
+
+    AsyncListEvents: Returns a list of Events.
+
+    AsyncAddMedication: Adds a Medication to the database.
+
+    AsyncListMedications: Returns a list of Medications.
+
+    AsyncAddReportingPeriod: Adds a Reporting Period to the database.
+
+    AsyncListReportingPeriods: Returns a list of Reporting Periods.
+
+    AsyncAddStatus: Adds a Status to the database.
+
+    AsyncListStatuses: Returns a list of Statuses.
+
+    AsyncAddUnit: Adds a Unit to the database.
+
+    AsyncListUnits: Returns a list of Units.
+"""
+
+from typing import TYPE_CHECKING
+
+from narcotics_tracker.commands.adjustment_commands import (
+    AddAdjustment,
+    AddAdjustments,
+    ListAdjustments,
+)
+from narcotics_tracker.commands.event_commands import AddEvent, ListEvents
+from narcotics_tracker.commands.medication_commands import (
+    AddMedication,
+    ListMedications,
+)
+from narcotics_tracker.commands.reporting_period_commands import (
+    AddReportingPeriod,
+    ListReportingPeriods,
+)
+from narcotics_tracker.commands.status_commands import AddStatus, ListStatuses
+from narcotics_tracker.commands.unit_commands import AddUnit, ListUnits
+
+if TYPE_CHECKING:
+    from narcotics_tracker.commands.interfaces.command import Command
+    from narcotics_tracker.services.async_sqlite_manager import AsyncSQLiteManager
+
+
+class AsyncCommand:
+    """Runs a synchronous command without blocking the event loop.
+
+    Subclasses set the command attribute to the class of the synchronous
+    command. It is created with the synchronous manager of the connection.
+
+    Methods:
+        execute: Executes the command, returns its result.
+    """
+
+    command: type["Command"]
+
+    def __init__(self, receiver: "AsyncSQLiteManager") -> None:
+        """Initializes the command. Sets the receiver.
+
+        Args:
+            receiver (AsyncSQLiteManager): Object which communicates with the
+                data repository.
+        """
+        self._receiver = receiver
+
+    async def execute(self, *args, **kwargs) -> any:
+        """Executes the command, returns its result.
+
+        Accepts the parameters of the synchronous command's execute method.
+        """
+        return await self._receiver.run(_execute, self.command, args, kwargs)
+
+
+def _execute(receiver, command: type["Command"], args: tuple, kwargs: dict) -> any:
+    """Executes the command with the receiver on the connection's thread."""
+    return command(receiver).execute(*args, **kwargs)
+
+
+class AsyncAddAdjustment(AsyncCommand):
+    """Adds an Adjustment to the database."""
+
+    command = AddAdjustment
+
+
+class AsyncAddAdjustments(AsyncCommand):
+    """Adds many Adjustments to the database."""
+
+    command = AddAdjustments
+
+
+class AsyncListAdjustments(AsyncCommand):
+    """Returns a list of Adjustments."""
+
+    command = ListAdjustments
+
+
+class AsyncAddEvent(AsyncCommand):
+    """Adds an Event to the database."""
+
+    command = AddEvent
+
+
+class AsyncListEvents(AsyncCommand):
+    """Returns a list of Events."""
+
+    command = ListEvents
+
+
+class AsyncAddMedication(AsyncCommand):
+    """Adds a Medication to the database."""
+
+    command = AddMedication
+
+
+class AsyncListMedications(AsyncCommand):
+    """Returns a list of Medications."""
+
+    command = ListMedications
+
+
+class AsyncAddReportingPeriod(AsyncCommand):
+    """Adds a Reporting Period to the database."""
+
+    command = AddReportingPeriod
+
+
+class AsyncListReportingPeriods(AsyncCommand):
+    """Returns a list of Reporting Periods."""
+
+    command = ListReportingPeriods
+
+
+class AsyncAddStatus(AsyncCommand):
+    """Adds a Status to the database."""
+
+    command = AddStatus
+
+
+class AsyncListStatuses(AsyncCommand):
+    """Returns a list of Statuses."""
+
+    command = ListStatuses
+
+
+class AsyncAddUnit(AsyncCommand):
+    """Adds a Unit to the database."""
+
+    command = AddUnit
+
+
+class AsyncListUnits(AsyncCommand):
+    """Returns a list of Units."""
+
+    command = ListUnits
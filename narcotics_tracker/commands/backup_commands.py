@@ -0,0 +1,178 @@
+"""Contains the commands which back up the database and verify the backups.
+
+Please see the package documentation for more information.
+
+The backup copies the database while it remains in use. Pages are copied in
+steps with a pause between them so that stations can keep writing during a
+nightly backup of a large database.
+
+The verification compares the backup with the database it was copied from.
+Changes saved to the database after the backup was taken are reported as
+differences, so verify the backup straight after taking it.
+
+Classes:
+
+    BackupDatabase: Copies the database to a backup file.
+
+    VerifyBackup: Compares the row counts and stock totals of a backup with
+        the database.
+"""
+
+import math
+from typing import TYPE_CHECKING, Callable
+
+from narcotics_tracker.commands.adjustment_commands import ListAdjustments
+from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.commands.medication_commands import ListMedications
+from narcotics_tracker.services.read_only_sqlite_manager import ReadOnlySQLiteManager
+from narcotics_tracker.services.service_manager import ServiceManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.services.interfaces.persistence import PersistenceService
+
+
+class BackupDatabase(Command):
+    """Copies the database to a backup file.
+
+    Methods:
+        execute: Executes the command, returns a success message.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(
+        self,
+        target_filename: str,
+        pages: int = 1024,
+        sleep: float = 0.05,
+        progress: Callable[[int, int, int], None] = None,
+    ) -> str:
+        """Executes the command, returns a success message.
+
+        Args:
+            target_filename (str): The filename of the backup in the data
+                directory.
+
+            pages (int, optional): The number of pages copied in each step.
+                Defaults to 1024.
+
+            sleep (float, optional): The number of seconds waited between the
+                steps. Defaults to 0.05.
+
+            progress (Callable, optional): Called after each step with the
+                status, the number of pages remaining and the total number of
+                pages.
+        """
+        self._receiver.backup(target_filename, pages, sleep, progress)
+
+        return f"Database backed up to {target_filename}."
+
+
+class VerifyBackup(Command):
+    """Compares the row counts and stock totals of a backup with the database.
+
+    Methods:
+        execute: Executes the command, returns the comparison.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(self, backup_filename: str) -> dict[str, any]:
+        """Executes the command, returns the comparison.
+
+        Args:
+            backup_filename (str): The filename of the backup in the data
+                directory.
+
+        Returns:
+            dict: Maps 'row_counts' to the row count of each table and
+                'stock_totals' to the stock of each medication, both as
+                (database, backup) tuples, and 'verified' to True when all of
+                them match.
+        """
+        backup = ReadOnlySQLiteManager(backup_filename)
+        try:
+            row_counts = self._compare_row_counts(backup)
+            stock_totals = self._compare_stock_totals(backup)
+        finally:
+            backup.close()
+
+        counts_match = all(source == copy for source, copy in row_counts.values())
+        totals_match = all(
+            math.isclose(source, copy) for source, copy in stock_totals.values()
+        )
+
+        return {
+            "row_counts": row_counts,
+            "stock_totals": stock_totals,
+            "verified": counts_match and totals_match,
+        }
+
+    def _compare_row_counts(
+        self, backup: "PersistenceService"
+    ) -> dict[str, tuple[int, int]]:
+        """Returns the row count of each table in the database and backup."""
+        table_names = set(self._receiver.return_table_names())
+        table_names.update(backup.return_table_names())
+
+        return {
+            table_name: (
+                self._count_rows(self._receiver, table_name),
+                self._count_rows(backup, table_name),
+            )
+            for table_name in sorted(table_names)
+        }
+
+    def _compare_stock_totals(
+        self, backup: "PersistenceService"
+    ) -> dict[str, tuple[float, float]]:
+        """Returns the stock of each medication in the database and backup."""
+        if "medications" not in self._receiver.return_table_names():
+            return {}
+
+        medications = ListMedications(self._receiver).execute()
+        medication_codes = [medication[1] for medication in medications]
+
+        return {
+            code: (
+                self._return_stock(self._receiver, code),
+                self._return_stock(backup, code),
+            )
+            for code in medication_codes
+        }
+
+    @staticmethod
+    def _return_stock(receiver: "PersistenceService", medication_code: str) -> float:
+        """Returns the total of the adjustment amounts of a medication."""
+        criteria = {"medication_code": medication_code}
+        adjustments = ListAdjustments(receiver).execute(criteria)
+
+        return sum(adjustment[4] for adjustment in adjustments)
+
+    @staticmethod
+    def _count_rows(receiver: "PersistenceService", table_name: str) -> int:
+        """Returns the number of rows in a table, or -1 if it is missing."""
+        if table_name not in receiver.return_table_names():
+            return -1
+
+        return receiver.count_rows(table_name)
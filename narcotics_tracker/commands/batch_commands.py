@@ -0,0 +1,143 @@
+"""Contains the command which runs many commands in a single transaction.
+
+Adding standard items or importing adjustments one command at a time commits
+every row separately. The CommandBatch queues commands with their arguments
+and runs them against one shared receiver in a single transaction.
+Consecutive commands which insert the same kind of DataItem are saved
+together using the receiver's insert_many method.
+
+Classes:
+
+    CommandBatch: Runs queued commands in a single transaction.
+"""
+
+from typing import TYPE_CHECKING, Iterable
+
+from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.services.code_lookup import CodeLookup
+from narcotics_tracker.services.service_manager import ServiceManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
+    from narcotics_tracker.services.interfaces.persistence import PersistenceService
+
+
+class CommandBatch(Command):
+    """Runs queued commands in a single transaction.
+
+    The batch is atomic. If any command fails, the changes made by all
+    commands in the batch are rolled back and the exception is raised.
+
+    Methods:
+        add: Queues a command with its arguments.
+
+        execute: Runs the queued commands, returns their results.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Shared by all queued commands.
+                Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+        self._queue = []
+
+    def add(self, command: type[Command], *args, **kwargs) -> "CommandBatch":
+        """Queues a command with its arguments.
+
+        Args:
+            command (type[Command]): The class of the command. It is created
+                with the batch's receiver.
+
+            *args, **kwargs: The arguments passed to the command's execute
+                method.
+
+        Returns:
+            self: The instance of the batch.
+        """
+        self._queue.append((command, args, kwargs))
+        return self
+
+    def execute(self, queued_commands: Iterable[tuple] = ()) -> list:
+        """Runs the queued commands, returns their results.
+
+        Args:
+            queued_commands (Iterable[tuple], optional): Additional commands
+                to run, each as a tuple of the command class followed by the
+                arguments of its execute method.
+
+        Returns:
+            list: The result of each command, in the order they were queued.
+        """
+        for command, *args in queued_commands:
+            self.add(command, *args)
+
+        queue, self._queue = self._queue, []
+        batch_receiver = _BatchReceiver(self._receiver)
+        results = []
+
+        try:
+            with self._receiver.transaction():
+                for command, args, kwargs in queue:
+                    results.append(command(batch_receiver).execute(*args, **kwargs))
+                batch_receiver.flush()
+        except Exception:
+            CodeLookup.for_receiver(self._receiver).clear()
+            raise
+
+        return results
+
+
+class _BatchReceiver:
+    """Collects consecutive inserts so they can be saved together.
+
+    Inserts using the same serializer are held until a different serializer
+    is used, another method of the receiver is called or the batch ends. All
+    other calls are passed to the receiver.
+    """
+
+    def __init__(self, receiver: "PersistenceService") -> None:
+        self._receiver = receiver
+        self._serializer = None
+        self._rows = []
+
+    @property
+    def batched_receiver(self) -> "PersistenceService":
+        """Returns the receiver the batch runs against."""
+        return self._receiver
+
+    def insert(self, serializer: "DataItemSerializer", values: tuple) -> None:
+        """Holds the values until the inserts are flushed."""
+        if serializer is not self._serializer:
+            self.flush()
+            self._serializer = serializer
+
+        self._rows.append(values)
+
+    def flush(self) -> None:
+        """Saves the held inserts using the receiver's insert_many method."""
+        if self._rows:
+            self._receiver.insert_many(self._serializer, self._rows)
+
+        self._serializer = None
+        self._rows = []
+
+    def __getattr__(self, name: str) -> any:
+        """Returns the receiver's attribute, flushing before method calls."""
+        attribute = getattr(self._receiver, name)
+
+        if not callable(attribute):
+            return attribute
+
+        def flushed_method(*args, **kwargs):
+            self.flush()
+            return attribute(*args, **kwargs)
+
+        return flushed_method
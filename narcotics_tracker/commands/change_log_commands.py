@@ -0,0 +1,208 @@
+"""Contains the commands which keep running totals of the inventory.
+
+Please see the package documentation for more information.
+
+The BiAnnualNarcoticsInventory reads every adjustment of the reporting period
+each time it runs. Once the change log is enabled the database keeps the
+total amount of each medication and event for every reporting period in the
+'inventory_totals' table. Triggers on the 'inventory' table record the amount
+of every adjustment added, updated or deleted in the 'inventory_changes'
+table. The IncrementalBiAnnualNarcoticsInventory adds the recorded changes to
+the totals, so its cost depends on the number of changes rather than the
+number of adjustments.
+
+Applying the change log folds the recorded changes into the totals and
+empties the log. Apply it regularly to keep the log short.
+
+Classes:
+
+    EnableChangeLog: Creates the change log and calculates the totals.
+
+    ApplyChangeLog: Adds the recorded changes to the totals.
+
+Functions:
+
+    return_trigger_statements: Returns the statements which create the change
+        log triggers.
+"""
+
+from typing import TYPE_CHECKING
+
+from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.services.code_lookup import CodeLookup
+from narcotics_tracker.services.interfaces.persistence import require_sql_scripts
+from narcotics_tracker.services.service_manager import ServiceManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.services.interfaces.persistence import PersistenceService
+
+CHANGES_TABLE = "inventory_changes"
+TOTALS_TABLE = "inventory_totals"
+
+
+class EnableChangeLog(Command):
+    """Creates the change log and calculates the totals.
+
+    The totals are calculated from the adjustments in the inventory. Enabling
+    the change log again recalculates them.
+
+    Methods:
+        execute: Executes the command, returns a success message.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(self) -> str:
+        """Executes the command, returns a success message."""
+        require_sql_scripts(self._receiver, type(self).__name__)
+        integer_keys = CodeLookup.for_receiver(self._receiver).uses_integer_keys()
+        event_code, medication_code, joins = _return_code_columns(integer_keys)
+
+        self._receiver.execute_script(
+            [
+                f"CREATE TABLE IF NOT EXISTS {CHANGES_TABLE} ("
+                "id INTEGER PRIMARY KEY, reporting_period_id INTEGER, "
+                "event_code TEXT, medication_code TEXT, amount REAL);",
+                f"CREATE TABLE IF NOT EXISTS {TOTALS_TABLE} ("
+                "reporting_period_id INTEGER, event_code TEXT, "
+                "medication_code TEXT, amount REAL, "
+                "PRIMARY KEY (reporting_period_id, event_code, medication_code));",
+                *return_trigger_statements(integer_keys),
+                f"DELETE FROM {CHANGES_TABLE};",
+                f"DELETE FROM {TOTALS_TABLE};",
+                f"INSERT INTO {TOTALS_TABLE} "
+                "(reporting_period_id, event_code, medication_code, amount) "
+                f"SELECT inventory.reporting_period_id, {event_code}, "
+                f"{medication_code}, SUM(inventory.amount) FROM inventory {joins} "
+                f"GROUP BY inventory.reporting_period_id, {event_code}, "
+                f"{medication_code};",
+            ]
+        )
+
+        return "Change log enabled."
+
+
+class ApplyChangeLog(Command):
+    """Adds the recorded changes to the totals and empties the change log.
+
+    Methods:
+        execute: Executes the command, returns a success message.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(self) -> str:
+        """Executes the command, returns a success message."""
+        require_sql_scripts(self._receiver, type(self).__name__)
+        count = self._receiver.count_rows(CHANGES_TABLE)
+
+        self._receiver.execute_script(
+            [
+                f"INSERT INTO {TOTALS_TABLE} "
+                "(reporting_period_id, event_code, medication_code, amount) "
+                "SELECT reporting_period_id, event_code, medication_code, "
+                f"SUM(amount) FROM {CHANGES_TABLE} WHERE true "
+                "GROUP BY reporting_period_id, event_code, medication_code "
+                "ON CONFLICT (reporting_period_id, event_code, medication_code) "
+                "DO UPDATE SET amount = amount + excluded.amount;",
+                f"DELETE FROM {CHANGES_TABLE};",
+            ]
+        )
+
+        return f"{count} changes applied."
+
+
+def _return_code_columns(integer_keys: bool) -> tuple[str, str, str]:
+    """Returns the expressions selecting the codes of inventory rows.
+
+    Returns:
+        tuple[str, str, str]: The event code and medication code expressions
+            and the joins they need.
+    """
+    if not integer_keys:
+        return "inventory.event_code", "inventory.medication_code", ""
+
+    return (
+        "events.event_code",
+        "medications.medication_code",
+        "LEFT JOIN events ON events.id = inventory.event_id "
+        "LEFT JOIN medications ON medications.id = inventory.medication_id",
+    )
+
+
+def return_trigger_statements(integer_keys: bool) -> list[str]:
+    """Returns the statements which create the change log triggers.
+
+    Existing triggers are replaced, so the statements can be run again after
+    the inventory table was rebuilt with different keys.
+
+    Args:
+        integer_keys (bool): True if the inventory table stores integer keys.
+    """
+    if integer_keys:
+        key_columns = "event_id, medication_id"
+    else:
+        key_columns = "event_code, medication_code"
+
+    statements = []
+    events = {
+        "insert": "INSERT",
+        "update": f"UPDATE OF amount, reporting_period_id, {key_columns}",
+        "delete": "DELETE",
+    }
+    changes = {
+        "insert": [("NEW", "")],
+        "update": [("OLD", "-"), ("NEW", "")],
+        "delete": [("OLD", "-")],
+    }
+
+    for operation, rows in changes.items():
+        inserts = []
+        for row, sign in rows:
+            if integer_keys:
+                event_code = (
+                    f"(SELECT event_code FROM events WHERE id = {row}.event_id)"
+                )
+                medication_code = (
+                    "(SELECT medication_code FROM medications "
+                    f"WHERE id = {row}.medication_id)"
+                )
+            else:
+                event_code = f"{row}.event_code"
+                medication_code = f"{row}.medication_code"
+
+            inserts.append(
+                f"INSERT INTO {CHANGES_TABLE} "
+                "(reporting_period_id, event_code, medication_code, amount) "
+                f"VALUES ({row}.reporting_period_id, {event_code}, "
+                f"{medication_code}, {sign}{row}.amount);"
+            )
+
+        statements += [
+            f"DROP TRIGGER IF EXISTS {CHANGES_TABLE}_{operation};",
+            f"CREATE TRIGGER {CHANGES_TABLE}_{operation} "
+            f"AFTER {events[operation]} ON inventory "
+            f"BEGIN {' '.join(inserts)} END;",
+        ]
+
+    return statements
@@ -13,14 +13,18 @@ Classes:
     UpdateEvent: Updates a Event with the given data and criteria.
 
     ReturnEventModifier: Returns an Event's modifier.
+
+    LoadEvents: Returns a list of Event Objects from the database.
 """
 from typing import TYPE_CHECKING, Union
 
 from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.items.events import CompactEvent, Event
+from narcotics_tracker.services.code_lookup import CodeLookup
+from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
 from narcotics_tracker.services.service_manager import ServiceManager
 
 if TYPE_CHECKING:
-    from narcotics_tracker.items.events import Event
     from narcotics_tracker.services.interfaces.persistence import PersistenceService
 
 
@@ -50,12 +54,11 @@ class AddEvent(Command):
             event (Event): The Event object to be added to the
                 database.
         """
-        event_info = vars(event)
-        table_name = event_info.pop("table")
+        serializer = DataItemSerializer.for_item(event)
 
-        self._receiver.add(table_name, event_info)
+        self._receiver.insert(serializer, serializer.return_values(event))
 
-        return f"Event added to {table_name} table."
+        return f"Event added to {serializer.table_name} table."
 
 
 class DeleteEvent(Command):
@@ -91,6 +94,7 @@ class DeleteEvent(Command):
             criteria = {"event_code": event_identifier}
 
         self._receiver.remove("events", criteria)
+        CodeLookup.for_receiver(self._receiver).clear()
 
         return f"Event {event_identifier} deleted."
 
@@ -161,6 +165,7 @@ class UpdateEvent(Command):
                 column name to its value.
         """
         self._receiver.update("events", data, criteria)
+        CodeLookup.for_receiver(self._receiver).clear()
 
         return f"Event data updated."
 
@@ -189,3 +194,48 @@ class ReturnEventModifier(Command):
         criteria = {"event_code": code}
         cursor = self._receiver.read("events", criteria)
         return cursor.fetchall()[0][4]
+
+
+class LoadEvents(Command):
+    """Returns a list of Event Objects from the database.
+
+    Builds the Objects directly from the selected rows. Use this command
+    instead of loading rows one at a time when listing many Event.
+
+    Methods:
+        execute: Executes the command and returns a list of Event.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(
+        self,
+        criteria: dict[str, any] = {},
+        order_by: str = None,
+        compact: bool = False,
+    ) -> list["Event"]:
+        """Executes the command and returns a list of Event.
+
+        Args:
+            criteria (dict[str, any]): The criteria of Event to be
+                returned as a dictionary mapping column names to their values.
+
+            order_by (str): The column name by which the results will be
+                sorted.
+
+            compact (bool, optional): Returns CompactEvent Objects when
+                True. Defaults to False.
+        """
+        item_class = CompactEvent if compact else Event
+
+        return self._receiver.read_items("events", item_class, criteria, order_by)
@@ -6,16 +6,26 @@ Classes:
 """
 from typing import Protocol
 
+from narcotics_tracker.services.metrics import metrics_registry
+
 
 class Command(Protocol):
     """The interface for SQLite3 database commands.
 
+    The execute method of each command is instrumented so that its calls are
+    recorded by the metrics registry when it is enabled.
+
     Required method signatures:
         def __init__(self, receiver) -> None:
 
         def execute(self) -> None:
     """
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Instruments the execute method of the command."""
+        super().__init_subclass__(**kwargs)
+        metrics_registry.instrument(cls, "execute")
+
     def __init__(self, receiver) -> None:
         """Sets the receiver of the command."""
         ...
@@ -16,11 +16,15 @@ Classes:
         Medication.
 
     LoadMedication: Loads a Medication Object from data.
+
+    LoadMedications: Returns a list of Medication Objects from the database.
 """
 from typing import TYPE_CHECKING, Union
 
 from narcotics_tracker.commands.interfaces.command import Command
-from narcotics_tracker.items.medications import Medication
+from narcotics_tracker.items.medications import CompactMedication, Medication
+from narcotics_tracker.services.code_lookup import CodeLookup
+from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
 from narcotics_tracker.services.service_manager import ServiceManager
 
 if TYPE_CHECKING:
@@ -54,12 +58,11 @@ class AddMedication(Command):
             medication (Medication): The Medication object to be added to the
                 database.
         """
-        medication_info = vars(medication)
-        table_name = medication_info.pop("table")
+        serializer = DataItemSerializer.for_item(medication)
 
-        self._receiver.add(table_name, medication_info)
+        self._receiver.insert(serializer, serializer.return_values(medication))
 
-        return f"Medication added to {table_name} table."
+        return f"Medication added to {serializer.table_name} table."
 
 
 class DeleteMedication(Command):
@@ -95,6 +98,7 @@ class DeleteMedication(Command):
             criteria = {"medication_code": medication_identifier}
 
         self._receiver.remove("medications", criteria)
+        CodeLookup.for_receiver(self._receiver).clear()
 
         return f"Medication {medication_identifier} deleted."
 
@@ -165,6 +169,7 @@ class UpdateMedication(Command):
                 column name to its value.
         """
         self._receiver.update("medications", data, criteria)
+        CodeLookup.for_receiver(self._receiver).clear()
 
         return f"Medication data updated."
 
@@ -176,8 +181,6 @@ class ReturnPreferredUnit(Command):
         execute: Executes the command, returns results.
     """
 
-    _receiver = ServiceManager().persistence
-
     def __init__(self, receiver: "PersistenceService" = None) -> None:
         """Initializes the command. Sets the receiver if passed.
 
@@ -187,6 +190,8 @@ class ReturnPreferredUnit(Command):
         """
         if receiver:
             self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
 
     def execute(self, medication_code: str) -> str:
         """Executes the command, returns results."""
@@ -236,3 +241,48 @@ class LoadMedication(Command):
             modified_date=data[9],
             modified_by=data[10],
         )
+
+
+class LoadMedications(Command):
+    """Returns a list of Medication Objects from the database.
+
+    Builds the Objects directly from the selected rows. Use this command
+    instead of loading rows one at a time when listing many Medication.
+
+    Methods:
+        execute: Executes the command and returns a list of Medication.
+    """
+
+    _receiver = ServiceManager().persistence
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+
+    def execute(
+        self,
+        criteria: dict[str, any] = {},
+        order_by: str = None,
+        compact: bool = False,
+    ) -> list["Medication"]:
+        """Executes the command and returns a list of Medication.
+
+        Args:
+            criteria (dict[str, any]): The criteria of Medication to be
+                returned as a dictionary mapping column names to their values.
+
+            order_by (str): The column name by which the results will be
+                sorted.
+
+            compact (bool, optional): Returns CompactMedication Objects when
+                True. Defaults to False.
+        """
+        item_class = CompactMedication if compact else Medication
+
+        return self._receiver.read_items("medications", item_class, criteria, order_by)
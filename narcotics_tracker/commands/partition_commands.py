@@ -0,0 +1,134 @@
+"""Contains the command which moves closed periods into partition files.
+
+Please see the package documentation for more information.
+
+The adjustments of a closed reporting period are moved out of the database
+file into the partition file for the year the period started. Read them back
+with a PartitionedSQLiteManager, which combines the inventory of the
+database and its partitions or targets a single partition.
+
+Moved adjustments keep their ids. Inventory tables created before ids were
+assigned with AUTOINCREMENT are migrated first so that new adjustments never
+receive the id of a moved one.
+
+Classes:
+
+    MovePeriodToPartition: Moves the adjustments of a closed period into its
+        partition file.
+"""
+
+from typing import TYPE_CHECKING
+
+from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.commands.reporting_period_commands import ListReportingPeriods
+from narcotics_tracker.commands.rollup_commands import (
+    ARCHIVE_TABLE,
+    _check_period_is_closed,
+)
+from narcotics_tracker.commands.table_commands import (
+    CreateInventoryTable,
+    MigrateInventoryKeys,
+)
+from narcotics_tracker.services.code_lookup import CodeLookup
+from narcotics_tracker.services.partitioned_sqlite_manager import (
+    return_partition_filename,
+    return_schema_name,
+)
+from narcotics_tracker.services.interfaces.persistence import require_sql_scripts
+from narcotics_tracker.services.service_manager import ServiceManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.services.interfaces.persistence import PersistenceService
+
+
+class MovePeriodToPartition(Command):
+    """Moves the adjustments of a closed period into its partition file.
+
+    Archived adjustments of a rolled up period are moved as well. The
+    partition is created if it does not exist. It is detached again
+    afterwards unless the receiver had already attached it.
+
+    Methods:
+        execute: Executes the command, returns a success message.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(self, reporting_period_id: int) -> str:
+        """Executes the command, returns a success message.
+
+        Args:
+            reporting_period_id (int): The id of the closed reporting period.
+
+        Raises:
+            ValueError: The reporting period does not exist or is not closed.
+
+            sqlite3.NotSupportedError: The receiver cannot execute SQL.
+        """
+        require_sql_scripts(self._receiver, type(self).__name__)
+        reporting_period_id = int(reporting_period_id)
+        _check_period_is_closed(self._receiver, reporting_period_id)
+
+        lookup = CodeLookup.for_receiver(self._receiver)
+        MigrateInventoryKeys(self._receiver).execute(lookup.uses_integer_keys())
+
+        year = self._return_year(reporting_period_id)
+        schema_name = return_schema_name(year)
+
+        attached = schema_name in self._receiver.return_attached()
+        if not attached:
+            filename = return_partition_filename(self._receiver.filename, year)
+            self._receiver.attach(filename, schema_name)
+
+        try:
+            self._move_adjustments(reporting_period_id, schema_name)
+        finally:
+            if not attached:
+                self._receiver.detach(schema_name)
+
+        return f"Reporting Period {reporting_period_id} moved to partition {year}."
+
+    def _return_year(self, reporting_period_id: int) -> int:
+        """Returns the year the reporting period started in."""
+        period = ListReportingPeriods(self._receiver).execute(
+            {"id": reporting_period_id}
+        )[0]
+
+        return ServiceManager().datetime.return_year(period[1])
+
+    def _move_adjustments(self, reporting_period_id: int, schema_name: str) -> None:
+        """Copies the adjustments into the partition and deletes them."""
+        if CodeLookup.for_receiver(self._receiver).uses_integer_keys():
+            column_info = CreateInventoryTable._integer_key_column_info
+        else:
+            column_info = CreateInventoryTable._column_info
+
+        column_names = ", ".join(column_info)
+        period = f"reporting_period_id = {reporting_period_id}"
+        table_names = self._receiver.return_table_names()
+
+        statements = []
+        for table_name in ("inventory", ARCHIVE_TABLE):
+            if table_name not in table_names:
+                continue
+
+            self._receiver.create_table(f"{schema_name}.{table_name}", column_info)
+            statements += [
+                f"CREATE INDEX IF NOT EXISTS {schema_name}.{table_name}_period "
+                f"ON {table_name} (reporting_period_id);",
+                f"INSERT INTO {schema_name}.{table_name} ({column_names}) "
+                f"SELECT {column_names} FROM main.{table_name} WHERE {period};",
+                f"DELETE FROM main.{table_name} WHERE {period};",
+            ]
+
+        self._receiver.execute_script(statements)
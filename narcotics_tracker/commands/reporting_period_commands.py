@@ -12,16 +12,25 @@ Classes:
 
     UpdateReportingPeriod: Updates a Reporting Period with the given data and 
         criteria. 
+
+    LoadReportingPeriod: Returns a ReportingPeriod Object from data.
+
+    LoadReportingPeriods: Returns a list of ReportingPeriod Objects from the 
+        database.
 """
 from typing import TYPE_CHECKING
 
 from narcotics_tracker.builders.interfaces.builder import Builder
 from narcotics_tracker.builders.reporting_period_builder import ReportingPeriodBuilder
 from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.items.reporting_periods import (
+    CompactReportingPeriod,
+    ReportingPeriod,
+)
+from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
 from narcotics_tracker.services.service_manager import ServiceManager
 
 if TYPE_CHECKING:
-    from narcotics_tracker.items.reporting_periods import ReportingPeriod
     from narcotics_tracker.services.interfaces.persistence import PersistenceService
 
 
@@ -51,12 +60,11 @@ class AddReportingPeriod(Command):
             reporting_period (ReportingPeriod): The Reporting Period object to
                 be added to the database.
         """
-        reporting_period_info = vars(reporting_period)
-        table_name = reporting_period_info.pop("table")
+        serializer = DataItemSerializer.for_item(reporting_period)
 
-        self._receiver.add(table_name, reporting_period_info)
+        self._receiver.insert(serializer, serializer.return_values(reporting_period))
 
-        return f"Reporting Period added to {table_name} table."
+        return f"Reporting Period added to {serializer.table_name} table."
 
 
 class DeleteReportingPeriod(Command):
@@ -191,3 +199,50 @@ class LoadReportingPeriod(Command):
             .set_modified_by(period_data[6])
             .build()
         )
+
+
+class LoadReportingPeriods(Command):
+    """Returns a list of ReportingPeriod Objects from the database.
+
+    Builds the Objects directly from the selected rows. Use this command
+    instead of loading rows one at a time when listing many ReportingPeriod.
+
+    Methods:
+        execute: Executes the command and returns a list of ReportingPeriod.
+    """
+
+    _receiver = ServiceManager().persistence
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+
+    def execute(
+        self,
+        criteria: dict[str, any] = {},
+        order_by: str = None,
+        compact: bool = False,
+    ) -> list["ReportingPeriod"]:
+        """Executes the command and returns a list of ReportingPeriod.
+
+        Args:
+            criteria (dict[str, any]): The criteria of ReportingPeriod to be
+                returned as a dictionary mapping column names to their values.
+
+            order_by (str): The column name by which the results will be
+                sorted.
+
+            compact (bool, optional): Returns CompactReportingPeriod Objects when
+                True. Defaults to False.
+        """
+        item_class = CompactReportingPeriod if compact else ReportingPeriod
+
+        return self._receiver.read_items(
+            "reporting_periods", item_class, criteria, order_by
+        )
@@ -0,0 +1,234 @@
+"""Contains the commands which roll up the adjustments of closed periods.
+
+Please see the package documentation for more information.
+
+Adjustments of closed reporting periods are never edited, yet each one stays
+in the 'inventory' table and is read by every query on it. Rolling up a
+closed period moves its adjustments into the 'inventory_archive' table and
+replaces them with one summary adjustment for each medication and event.
+Summary adjustments hold the total amount of the adjustments they replace
+and use 'ROLLUP' as their reference id.
+
+Reports read the summary adjustments like any other adjustment, so their
+results do not change, while queries on the inventory only read the
+adjustments of open periods and a few summaries.
+
+Archived adjustments keep their ids. Inventory tables created before ids were
+assigned with AUTOINCREMENT are migrated first so that new adjustments never
+receive the id of an archived one.
+
+Classes:
+
+    RollupReportingPeriod: Moves the adjustments of a closed period into the
+        archive and replaces them with summary adjustments.
+
+    RestoreReportingPeriod: Moves the archived adjustments of a period back
+        into the inventory and removes its summary adjustments.
+
+    ListArchivedAdjustments: Returns a list of archived Adjustments.
+"""
+
+from typing import TYPE_CHECKING
+
+from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.commands.reporting_period_commands import ListReportingPeriods
+from narcotics_tracker.commands.table_commands import (
+    CreateInventoryArchiveTable,
+    MigrateInventoryKeys,
+)
+from narcotics_tracker.services.code_lookup import CodeLookup
+from narcotics_tracker.services.interfaces.persistence import require_sql_scripts
+from narcotics_tracker.services.service_manager import ServiceManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.services.interfaces.persistence import PersistenceService
+
+ARCHIVE_TABLE = CreateInventoryArchiveTable._table_name
+ROLLUP_REFERENCE = "ROLLUP"
+
+
+class RollupReportingPeriod(Command):
+    """Moves the adjustments of a closed period into the archive.
+
+    The adjustments are replaced with one summary adjustment for each
+    medication and event. Rolling up a period again archives any adjustments
+    added since and recalculates its summaries.
+
+    Methods:
+        execute: Executes the command, returns a success message.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(self, reporting_period_id: int) -> str:
+        """Executes the command, returns a success message.
+
+        Args:
+            reporting_period_id (int): The id of the closed reporting period.
+
+        Raises:
+            ValueError: The reporting period does not exist or is not closed.
+
+            sqlite3.NotSupportedError: The receiver cannot execute SQL.
+        """
+        require_sql_scripts(self._receiver, type(self).__name__)
+        reporting_period_id = int(reporting_period_id)
+        _check_period_is_closed(self._receiver, reporting_period_id)
+
+        lookup = CodeLookup.for_receiver(self._receiver)
+        integer_keys = lookup.uses_integer_keys()
+        MigrateInventoryKeys(self._receiver).execute(integer_keys)
+        CreateInventoryArchiveTable(self._receiver).execute(integer_keys)
+
+        columns = self._receiver.return_columns("inventory")
+        column_names = ", ".join(columns)
+        event_column, medication_column = _return_key_columns(lookup)
+        timestamp = ServiceManager().datetime.return_current()
+        period = f"reporting_period_id = {reporting_period_id}"
+
+        self._receiver.execute_script(
+            [
+                f"INSERT INTO {ARCHIVE_TABLE} ({column_names}) "
+                f"SELECT {column_names} FROM inventory "
+                f"WHERE {period} AND reference_id != '{ROLLUP_REFERENCE}';",
+                f"DELETE FROM inventory WHERE {period};",
+                f"INSERT INTO inventory (adjustment_date, {event_column}, "
+                f"{medication_column}, amount, reporting_period_id, reference_id, "
+                "created_date, modified_date, modified_by) "
+                f"SELECT MAX(adjustment_date), {event_column}, {medication_column}, "
+                f"SUM(amount), reporting_period_id, '{ROLLUP_REFERENCE}', "
+                f"{timestamp}, {timestamp}, 'Rollup' FROM {ARCHIVE_TABLE} "
+                f"WHERE {period} GROUP BY {event_column}, {medication_column} "
+                f"ORDER BY {medication_column}, {event_column};",
+            ]
+        )
+
+        return f"Reporting Period {reporting_period_id} rolled up."
+
+
+class RestoreReportingPeriod(Command):
+    """Moves the archived adjustments of a period back into the inventory.
+
+    The summary adjustments of the period are removed.
+
+    Methods:
+        execute: Executes the command, returns a success message.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(self, reporting_period_id: int) -> str:
+        """Executes the command, returns a success message.
+
+        Args:
+            reporting_period_id (int): The id of the reporting period.
+        """
+        require_sql_scripts(self._receiver, type(self).__name__)
+        reporting_period_id = int(reporting_period_id)
+
+        if ARCHIVE_TABLE not in self._receiver.return_table_names():
+            return f"Reporting Period {reporting_period_id} has not been rolled up."
+
+        column_names = ", ".join(self._receiver.return_columns("inventory"))
+        period = f"reporting_period_id = {reporting_period_id}"
+
+        self._receiver.execute_script(
+            [
+                f"DELETE FROM inventory WHERE {period} "
+                f"AND reference_id = '{ROLLUP_REFERENCE}';",
+                f"INSERT INTO inventory ({column_names}) "
+                f"SELECT {column_names} FROM {ARCHIVE_TABLE} WHERE {period};",
+                f"DELETE FROM {ARCHIVE_TABLE} WHERE {period};",
+            ]
+        )
+
+        return f"Reporting Period {reporting_period_id} restored."
+
+
+class ListArchivedAdjustments(Command):
+    """Returns a list of archived Adjustments.
+
+    Methods:
+        execute: Executes the command and returns a list of Adjustments.
+    """
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(self, criteria: dict[str] = {}, order_by: str = None) -> list[tuple]:
+        """Executes the command and returns a list of Adjustments.
+
+        Args:
+            criteria (dict[str, any]): The criteria of Adjustments to be
+                returned as a dictionary mapping column names to their values.
+
+            order_by (str): The column name by which the results will be
+                sorted.
+        """
+        if ARCHIVE_TABLE not in self._receiver.return_table_names():
+            return []
+
+        lookup = CodeLookup.for_receiver(self._receiver)
+        if not lookup.uses_integer_keys():
+            cursor = self._receiver.read(ARCHIVE_TABLE, criteria, order_by)
+            return cursor.fetchall()
+
+        criteria = lookup.translate_criteria(criteria)
+        if order_by:
+            order_by = lookup.translate_column_name(order_by)
+
+        cursor = self._receiver.read(ARCHIVE_TABLE, criteria, order_by)
+        return [lookup.translate_row(row) for row in cursor.fetchall()]
+
+
+def _check_period_is_closed(
+    receiver: "PersistenceService", reporting_period_id: int
+) -> None:
+    """Raises ValueError if the reporting period is missing or not closed."""
+    periods = ListReportingPeriods(receiver).execute({"id": reporting_period_id})
+
+    if not periods:
+        raise ValueError(f"Reporting Period {reporting_period_id} not found.")
+
+    if periods[0][3] != "CLOSED":
+        raise ValueError(
+            f"Reporting Period {reporting_period_id} is not closed and cannot be "
+            "rolled up."
+        )
+
+
+def _return_key_columns(lookup: CodeLookup) -> tuple[str, str]:
+    """Returns the names of the event and medication columns of the inventory."""
+    if lookup.uses_integer_keys():
+        return "event_id", "medication_id"
+
+    return "event_code", "medication_code"
@@ -14,6 +14,7 @@ Classes:
 from typing import TYPE_CHECKING, Union
 
 from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
 from narcotics_tracker.services.service_manager import ServiceManager
 
 if TYPE_CHECKING:
@@ -46,12 +47,11 @@ class AddStatus(Command):
         Args:
             status (Status): The Status object to be added to the database.
         """
-        status_info = vars(status)
-        table_name = status_info.pop("table")
+        serializer = DataItemSerializer.for_item(status)
 
-        self._receiver.add(table_name, status_info)
+        self._receiver.insert(serializer, serializer.return_values(status))
 
-        return f"Status added to {table_name} table."
+        return f"Status added to {serializer.table_name} table."
 
 
 class DeleteStatus(Command):
@@ -9,6 +9,9 @@ Classes:
     CreateInventoryTable: Creates the 'inventory' table in the SQLite3 
         database.
 
+    CreateInventoryArchiveTable: Creates the 'inventory_archive' table in the 
+        SQLite3 database.
+
     CreateMedicationsTable: Creates the 'medications' table in the SQLite3 
         database.
 
@@ -18,10 +21,19 @@ Classes:
     CreateStatusesTable: Creates the 'statuses' table in the SQLite3 database.
 
     CreateUnitsTable: Creates the 'units' table in the SQLite3 database.
+
+    MigrateInventoryKeys: Converts the event and medication references in the 
+        'inventory' table between codes and integer keys.
 """
 from typing import TYPE_CHECKING
 
+from narcotics_tracker.commands.change_log_commands import (
+    CHANGES_TABLE,
+    return_trigger_statements,
+)
 from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.services.code_lookup import CodeLookup
+from narcotics_tracker.services.interfaces.persistence import require_sql_scripts
 from narcotics_tracker.services.service_manager import ServiceManager
 
 if TYPE_CHECKING:
@@ -67,13 +79,21 @@ class CreateEventsTable(Command):
 class CreateInventoryTable(Command):
     """Creates the 'inventory' table in the SQLite3 database.
 
+    The events and medications can be referenced by their codes (default) or
+    by integer keys referencing the id column of their tables. Integer keys
+    shrink the table and speed up grouping. Please see the CodeLookup service
+    for more information.
+
+    Ids are assigned with AUTOINCREMENT, so the ids of adjustments moved into
+    the archive or a partition file are never given to new adjustments.
+
     Methods:
         execute: Executes the command.
     """
 
     _table_name = "inventory"
     _column_info = {
-        "id": "INTEGER PRIMARY KEY",
+        "id": "INTEGER PRIMARY KEY AUTOINCREMENT",
         "adjustment_date": "INTEGER NOT NULL",
         "event_code": "TEXT NOT NULL",
         "medication_code": "TEXT NOT NULL",
@@ -91,6 +111,25 @@ class CreateInventoryTable(Command):
         "FOREIGN KEY (reporting_period_id) REFERENCES reporting_periods (id) ON UPDATE CASCADE",
     ]
 
+    _integer_key_column_info = {
+        "id": "INTEGER PRIMARY KEY AUTOINCREMENT",
+        "adjustment_date": "INTEGER NOT NULL",
+        "event_id": "INTEGER NOT NULL",
+        "medication_id": "INTEGER NOT NULL",
+        "amount": "REAL NOT NULL",
+        "reporting_period_id": "INTEGER NOT NULL",
+        "reference_id": "TEXT NOT NULL",
+        "created_date": "INTEGER NOT NULL",
+        "modified_date": "INTEGER NOT NULL",
+        "modified_by": "TEXT NOT NULL",
+    }
+
+    _integer_key_foreign_key_info = [
+        "FOREIGN KEY (event_id) REFERENCES events (id)",
+        "FOREIGN KEY (medication_id) REFERENCES medications (id)",
+        "FOREIGN KEY (reporting_period_id) REFERENCES reporting_periods (id) ON UPDATE CASCADE",
+    ]
+
     def __init__(self, receiver: "PersistenceService" = None) -> None:
         """Initializes the command. Sets the receiver if passed.
 
@@ -103,12 +142,56 @@ class CreateInventoryTable(Command):
         else:
             self._receiver = ServiceManager().persistence
 
-    def execute(self):
-        """Executes the command."""
+    def execute(self, integer_keys: bool = False):
+        """Executes the command.
+
+        Args:
+            integer_keys (bool, optional): Stores events and medications as
+                integer keys instead of codes. Defaults to False.
+        """
+        if integer_keys:
+            column_info = self._integer_key_column_info
+            foreign_key_info = self._integer_key_foreign_key_info
+        else:
+            column_info = self._column_info
+            foreign_key_info = self._foreign_key_info
+
         self._receiver.create_table(
             table_name=self._table_name,
-            column_info=self._column_info,
-            foreign_key_info=self._foreign_key_info,
+            column_info=column_info,
+            foreign_key_info=foreign_key_info,
+        )
+        CodeLookup.for_receiver(self._receiver).clear()
+
+
+class CreateInventoryArchiveTable(CreateInventoryTable):
+    """Creates the 'inventory_archive' table in the SQLite3 database.
+
+    The archive stores the adjustments of rolled up reporting periods. It has
+    the same columns as the 'inventory' table and an index on the reporting
+    period.
+
+    Methods:
+        execute: Executes the command.
+    """
+
+    _table_name = "inventory_archive"
+
+    def execute(self, integer_keys: bool = False):
+        """Executes the command.
+
+        Args:
+            integer_keys (bool, optional): Stores events and medications as
+                integer keys instead of codes. Use the same setting as the
+                'inventory' table. Defaults to False.
+        """
+        require_sql_scripts(self._receiver, type(self).__name__)
+        super().execute(integer_keys)
+        self._receiver.execute_script(
+            [
+                f"CREATE INDEX IF NOT EXISTS {self._table_name}_period "
+                f"ON {self._table_name} (reporting_period_id);"
+            ]
         )
 
 
@@ -261,3 +344,144 @@ class CreateUnitsTable(Command):
     def execute(self):
         """Executes the command."""
         self._receiver.create_table(self._table_name, self._column_info)
+
+
+class MigrateInventoryKeys(Command):
+    """Converts the event and medication references in the 'inventory' table.
+
+    The 'inventory_archive' table is converted as well when it exists, and
+    the triggers of the change log are recreated. The tables are rebuilt in a
+    single transaction. Every adjustment must reference an existing event and
+    medication, otherwise the migration fails and the table is left
+    unchanged.
+
+    Tables created before ids were assigned with AUTOINCREMENT are rebuilt
+    even when they already use the requested keys. The next id is set above
+    the highest archived id.
+
+    Methods:
+        execute: Executes the command.
+    """
+
+    _table_name = "inventory"
+    _temporary_table_name = "inventory_migration"
+
+    def __init__(self, receiver: "PersistenceService" = None) -> None:
+        """Initializes the command. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to SQLiteManager.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().persistence
+
+    def execute(self, integer_keys: bool = True) -> str:
+        """Executes the command.
+
+        Args:
+            integer_keys (bool, optional): Converts codes to integer keys when
+                True, converts integer keys back to codes when False. Defaults
+                to True.
+        """
+        require_sql_scripts(self._receiver, type(self).__name__)
+        lookup = CodeLookup.for_receiver(self._receiver)
+        lookup.clear()
+
+        convert_keys = lookup.uses_integer_keys() != integer_keys
+        if not convert_keys and self._uses_autoincrement():
+            return "Inventory table already uses the requested keys."
+
+        statements = self._return_rebuild_statements(
+            self._table_name, self._temporary_table_name, integer_keys, convert_keys
+        )
+
+        archive_table_name = CreateInventoryArchiveTable._table_name
+        if archive_table_name in self._receiver.return_table_names():
+            statements += self._return_rebuild_statements(
+                archive_table_name,
+                f"{archive_table_name}_migration",
+                integer_keys,
+                convert_keys,
+            )
+            statements += [
+                f"CREATE INDEX {archive_table_name}_period "
+                f"ON {archive_table_name} (reporting_period_id);",
+                "INSERT INTO sqlite_sequence (name, seq) "
+                f"SELECT '{self._table_name}', 0 WHERE NOT EXISTS "
+                f"(SELECT 1 FROM sqlite_sequence WHERE name = '{self._table_name}');",
+                "UPDATE sqlite_sequence SET seq = MAX(seq, "
+                f"(SELECT COALESCE(MAX(id), 0) FROM {archive_table_name})) "
+                f"WHERE name = '{self._table_name}';",
+            ]
+
+        if CHANGES_TABLE in self._receiver.return_table_names():
+            statements += return_trigger_statements(integer_keys)
+
+        self._receiver.execute_script(statements)
+        lookup.clear()
+
+        key_type = "integer keys" if integer_keys else "codes"
+        return f"Inventory table migrated to {key_type}."
+
+    def _uses_autoincrement(self) -> bool:
+        """Returns True if the inventory table assigns ids with AUTOINCREMENT."""
+        rows = self._receiver.read("sqlite_master", {"name": self._table_name})
+        definition = rows.fetchone()
+
+        return definition is not None and "AUTOINCREMENT" in definition[4].upper()
+
+    @staticmethod
+    def _return_rebuild_statements(
+        table_name: str,
+        temporary_table_name: str,
+        integer_keys: bool,
+        convert_keys: bool = True,
+    ) -> list[str]:
+        """Returns the statements which rebuild a table with the requested keys.
+
+        The keys are copied as they are when convert_keys is False.
+        """
+        if integer_keys:
+            column_info = CreateInventoryTable._integer_key_column_info
+            foreign_key_info = CreateInventoryTable._integer_key_foreign_key_info
+            key_columns = {"event_id": "events.id", "medication_id": "medications.id"}
+            joins = (
+                f"LEFT JOIN events ON events.event_code = {table_name}.event_code "
+                "LEFT JOIN medications "
+                f"ON medications.medication_code = {table_name}.medication_code"
+            )
+        else:
+            column_info = CreateInventoryTable._column_info
+            foreign_key_info = CreateInventoryTable._foreign_key_info
+            key_columns = {
+                "event_code": "events.event_code",
+                "medication_code": "medications.medication_code",
+            }
+            joins = (
+                f"LEFT JOIN events ON events.id = {table_name}.event_id "
+                f"LEFT JOIN medications ON medications.id = {table_name}.medication_id"
+            )
+
+        if not convert_keys:
+            key_columns = {}
+            joins = ""
+
+        column_names = ", ".join(column_info)
+        selected_columns = ", ".join(
+            key_columns.get(column, f"{table_name}.{column}") for column in column_info
+        )
+        columns_with_details = [
+            f"{column_name} {details}" for column_name, details in column_info.items()
+        ]
+        table_definition = ", ".join(columns_with_details + foreign_key_info)
+
+        return [
+            f"CREATE TABLE {temporary_table_name} ({table_definition});",
+            f"INSERT INTO {temporary_table_name} ({column_names}) "
+            f"SELECT {selected_columns} FROM {table_name} {joins};",
+            f"DROP TABLE {table_name};",
+            f"ALTER TABLE {temporary_table_name} RENAME TO {table_name};",
+        ]
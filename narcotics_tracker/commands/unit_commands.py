@@ -15,6 +15,7 @@ Classes:
 from typing import TYPE_CHECKING, Union
 
 from narcotics_tracker.commands.interfaces.command import Command
+from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
 from narcotics_tracker.services.service_manager import ServiceManager
 
 if TYPE_CHECKING:
@@ -47,12 +48,11 @@ class AddUnit(Command):
         Args:
             unit (Unit): The Unit object to be added to the database.
         """
-        unit_info = vars(unit)
-        table_name = unit_info.pop("table")
+        serializer = DataItemSerializer.for_item(unit)
 
-        self._receiver.add(table_name, unit_info)
+        self._receiver.insert(serializer, serializer.return_values(unit))
 
-        return f"Unit added to {table_name} table."
+        return f"Unit added to {serializer.table_name} table."
 
 
 class DeleteUnit(Command):
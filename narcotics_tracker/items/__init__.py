@@ -35,19 +35,34 @@ Intended Use
     should be used to created them. Review the documentation for the builders 
     for more information.
 
-    Python's 'vars' method returns a dictionary mapping the attribute names 
-    with their values. The first key 'table' maps to the name of the SQLite3 
-    Database table the item lives in. The rest of the keys match the column 
-    names and can be used to construct SQL statements for saving them into the 
-    database.
+    The 'table' attribute stores the name of the SQLite3 Database table the 
+    item lives in. The rest of the attributes match the column names. The 
+    'return_column_data' function returns a dictionary mapping the column 
+    names to their values which can be used to construct SQL statements for 
+    saving them into the database.
+
+Compact Items
+
+    Each Data Item has a compact variant (CompactAdjustment, CompactEvent, 
+    etc.) which stores its attributes in slots and defines the table as a 
+    class constant. Compact items use considerably less memory and should be 
+    used when loading large numbers of items, such as the entire inventory 
+    for an audit. Compact items are created directly instead of through the 
+    builders.
 
 Interfaces:
 
     DataItem: Defines the interface for items stored in the database.
 
+    CompactDataItem: Defines the interface for memory efficient items stored 
+        in the database.
+
 Modules:
     
     Adjustments: Defines the changes which occur to the inventory.
+
+    Adjustment_Frame: Stores large numbers of adjustments in a compact, column 
+        based container.
     
     Events: Defines the types of events which can affect the inventory.
     
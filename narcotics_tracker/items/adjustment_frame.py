@@ -0,0 +1,310 @@
+"""Stores large numbers of adjustments in a compact, column based container.
+
+Reports and audits which look at every adjustment in the inventory do not
+need an object for each adjustment. The AdjustmentFrame stores each column in
+a typed array instead. Event and medication codes are stored as small
+integers referencing a list of the unique codes (categories).
+
+Classes:
+    AdjustmentFrame: Stores adjustments as columns of typed arrays.
+"""
+from array import array
+from itertools import compress
+from typing import TYPE_CHECKING, Callable, Iterable, Union
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+class AdjustmentFrame:
+    """Stores adjustments as columns of typed arrays.
+
+    Attributes:
+        ids (array): The ids of the adjustments.
+
+        adjustment_dates (array): Unix timestamps of when the adjustments
+            occurred.
+
+        amounts (array): The adjusted amounts in the standard unit.
+
+        reporting_period_ids (array): The ids of the reporting periods the
+            adjustments occurred during.
+
+    Methods:
+        from_cursor: Returns an AdjustmentFrame loaded from a cursor.
+
+        from_rows: Returns an AdjustmentFrame loaded from rows of data.
+
+        append: Adds an adjustment to the frame.
+
+        codes: Returns the code of each adjustment for a code column.
+
+        relabel: Replaces the categories of a code column.
+
+        filter: Returns a new frame containing the matching adjustments.
+
+        total: Returns the sum of all amounts.
+
+        group_sum: Returns the sum of the amounts grouped by one or more
+            columns.
+    """
+
+    code_columns = ("event_code", "medication_code")
+    _key_columns = {"event_id": "event_code", "medication_id": "medication_code"}
+    _number_columns = {
+        "id": ("ids", "q"),
+        "adjustment_date": ("adjustment_dates", "q"),
+        "amount": ("amounts", "d"),
+        "reporting_period_id": ("reporting_period_ids", "q"),
+    }
+
+    def __init__(self) -> None:
+        """Initializes an empty AdjustmentFrame."""
+        self.ids = array("q")
+        self.adjustment_dates = array("q")
+        self.amounts = array("d")
+        self.reporting_period_ids = array("q")
+        self._codes = {column: array("l") for column in self.code_columns}
+        self._categories = {column: [] for column in self.code_columns}
+        self._category_index = {column: {} for column in self.code_columns}
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    @classmethod
+    def from_cursor(
+        cls, cursor: "sqlite3.Cursor", batch_size: int = 10_000
+    ) -> "AdjustmentFrame":
+        """Returns an AdjustmentFrame loaded from a cursor.
+
+        The cursor must contain the results of a select query on the
+        inventory table. Columns are matched by name. Integer event and
+        medication keys are stored as categories; Use the relabel method to
+        replace them with codes.
+
+        Args:
+            cursor (sqlite3.Cursor): A cursor containing inventory rows.
+
+            batch_size (int, optional): The number of rows fetched at a time.
+                Defaults to 10,000.
+        """
+        columns = [description[0] for description in cursor.description]
+        frame = cls()
+
+        rows = cursor.fetchmany(batch_size)
+        while rows:
+            frame._extend(columns, rows)
+            rows = cursor.fetchmany(batch_size)
+
+        return frame
+
+    @classmethod
+    def from_rows(cls, columns: list[str], rows: Iterable[tuple]) -> "AdjustmentFrame":
+        """Returns an AdjustmentFrame loaded from rows of data.
+
+        Args:
+            columns (list[str]): The column names of the values in each row.
+
+            rows (Iterable[tuple]): The rows of adjustment data.
+        """
+        frame = cls()
+        frame._extend(columns, rows)
+
+        return frame
+
+    def append(
+        self,
+        id: int,
+        adjustment_date: int,
+        event_code: str,
+        medication_code: str,
+        amount: float,
+        reporting_period_id: int,
+    ) -> None:
+        """Adds an adjustment to the frame."""
+        self.ids.append(id)
+        self.adjustment_dates.append(adjustment_date)
+        self.amounts.append(amount)
+        self.reporting_period_ids.append(reporting_period_id)
+        self._codes["event_code"].append(self._encode("event_code", event_code))
+        self._codes["medication_code"].append(
+            self._encode("medication_code", medication_code)
+        )
+
+    def codes(self, column: str) -> list:
+        """Returns the code of each adjustment for a code column.
+
+        Args:
+            column (str): Either 'event_code' or 'medication_code'.
+        """
+        categories = self._categories[column]
+
+        return [categories[index] for index in self._codes[column]]
+
+    def relabel(self, column: str, labeler: Callable) -> None:
+        """Replaces the categories of a code column.
+
+        Used to replace integer keys with their codes. Categories which end up
+        with the same label are merged.
+
+        Args:
+            column (str): Either 'event_code' or 'medication_code'.
+
+            labeler (Callable): Returns the new label for an old category.
+        """
+        old_categories = self._categories[column]
+        self._categories[column] = []
+        self._category_index[column] = {}
+
+        new_indexes = [self._encode(column, labeler(old)) for old in old_categories]
+        self._codes[column] = array(
+            "l", [new_indexes[index] for index in self._codes[column]]
+        )
+
+    def filter(
+        self,
+        event_code: str = None,
+        medication_code: str = None,
+        reporting_period_id: int = None,
+    ) -> "AdjustmentFrame":
+        """Returns a new frame containing the matching adjustments.
+
+        Args:
+            event_code (str, optional): Only include adjustments with this
+                event code.
+
+            medication_code (str, optional): Only include adjustments with
+                this medication code.
+
+            reporting_period_id (int, optional): Only include adjustments from
+                this reporting period.
+        """
+        mask = [True] * len(self)
+
+        for column, code in (
+            ("event_code", event_code),
+            ("medication_code", medication_code),
+        ):
+            if code is None:
+                continue
+            index = self._category_index[column].get(code, -1)
+            mask = [
+                keep and value == index
+                for keep, value in zip(mask, self._codes[column])
+            ]
+
+        if reporting_period_id is not None:
+            mask = [
+                keep and value == reporting_period_id
+                for keep, value in zip(mask, self.reporting_period_ids)
+            ]
+
+        return self._select(mask)
+
+    def total(self) -> float:
+        """Returns the sum of all amounts."""
+        return sum(self.amounts)
+
+    def group_sum(self, by: Union[str, tuple[str]]) -> dict:
+        """Returns the sum of the amounts grouped by one or more columns.
+
+        Args:
+            by (str, tuple[str]): The column, or columns, to group by. Valid
+                columns: 'event_code', 'medication_code' and
+                'reporting_period_id'.
+
+        Returns:
+            dict: Maps each group to the sum of its amounts. Groups are keyed
+                by a value when grouping by one column, otherwise by a tuple
+                of values.
+        """
+        if type(by) is str:
+            return self._sum_by_single_column(by)
+
+        keys = [self._return_group_column(column) for column in by]
+        totals = {}
+        for *group, amount in zip(*keys, self.amounts):
+            group = tuple(group)
+            totals[group] = totals.get(group, 0) + amount
+
+        return totals
+
+    def _sum_by_single_column(self, column: str) -> dict:
+        """Returns the sum of the amounts for each value of a single column."""
+        if column not in self.code_columns:
+            totals = {}
+            for key, amount in zip(self._return_group_column(column), self.amounts):
+                totals[key] = totals.get(key, 0) + amount
+            return totals
+
+        categories = self._categories[column]
+        sums = [None] * len(categories)
+        for index, amount in zip(self._codes[column], self.amounts):
+            total = sums[index]
+            sums[index] = amount if total is None else total + amount
+
+        return {
+            category: sums[index]
+            for index, category in enumerate(categories)
+            if sums[index] is not None
+        }
+
+    def _return_group_column(self, column: str) -> list:
+        """Returns the values of a column used for grouping."""
+        if column in self.code_columns:
+            return self.codes(column)
+
+        if column == "reporting_period_id":
+            return self.reporting_period_ids
+
+        raise ValueError(f"Cannot group adjustments by '{column}'.")
+
+    def _encode(self, column: str, code: any) -> int:
+        """Returns the category index for a code, adding it if needed."""
+        index = self._category_index[column].get(code)
+
+        if index is None:
+            index = len(self._categories[column])
+            self._categories[column].append(code)
+            self._category_index[column][code] = index
+
+        return index
+
+    def _extend(self, columns: list[str], rows: Iterable[tuple]) -> None:
+        """Adds rows of adjustment data to the frame."""
+        positions = {}
+        for position, column in enumerate(columns):
+            column = self._key_columns.get(column, column)
+            positions[column] = position
+
+        id_index = positions["id"]
+        date_index = positions["adjustment_date"]
+        event_index = positions["event_code"]
+        medication_index = positions["medication_code"]
+        amount_index = positions["amount"]
+        period_index = positions["reporting_period_id"]
+
+        for row in rows:
+            self.append(
+                row[id_index],
+                row[date_index],
+                row[event_index],
+                row[medication_index],
+                row[amount_index],
+                row[period_index],
+            )
+
+    def _select(self, mask: list[bool]) -> "AdjustmentFrame":
+        """Returns a new frame containing the rows selected by the mask."""
+        frame = AdjustmentFrame()
+
+        for attribute, typecode in self._number_columns.values():
+            selected = array(typecode, compress(getattr(self, attribute), mask))
+            setattr(frame, attribute, selected)
+
+        for column in self.code_columns:
+            frame._codes[column] = array("l", compress(self._codes[column], mask))
+            frame._categories[column] = list(self._categories[column])
+            frame._category_index[column] = dict(self._category_index[column])
+
+        return frame
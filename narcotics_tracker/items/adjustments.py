@@ -2,11 +2,17 @@
 
 Classes: 
     Adjustment: A change which occurred to the inventory.
+
+    CompactAdjustment: A memory efficient change which occurred to the inventory.
 """
 
 from dataclasses import dataclass
+from typing import ClassVar
 
-from narcotics_tracker.items.interfaces.dataitem_interface import DataItem
+from narcotics_tracker.items.interfaces.dataitem_interface import (
+    CompactDataItem,
+    DataItem,
+)
 
 
 @dataclass
@@ -36,3 +42,35 @@ class Adjustment(DataItem):
 
     def __str__(self) -> str:
         return f"Adjustment #{self.id}: {self.medication_code} adjusted by {self.amount} due to {self.event_code} on {self.adjustment_date}."
+
+
+@dataclass(slots=True)
+class CompactAdjustment(CompactDataItem):
+    """A memory efficient change which occurred to the inventory.
+
+    Stores the same information as the Adjustment using slots. Please see the
+    Adjustment class for more information.
+
+    Attributes:
+        adjustment_date (int): Unix timestamp when the adjustment occurred.
+
+        event_code (str): Unique code of the event that caused the adjustment.
+
+        medication_code (str): Unique code of the medication being adjusted.
+
+        amount (float): Amount of medication being adjusted.
+
+        reference_id (str): ID of the document containing more adjustment info.
+
+        reporting_period_id (int): ID of the period adjustment occurred during.
+    """
+
+    table: ClassVar[str] = "inventory"
+    adjustment_date: int
+    event_code: str
+    medication_code: str
+    amount: float
+    reference_id: str
+    reporting_period_id: int
+
+    __str__ = Adjustment.__str__
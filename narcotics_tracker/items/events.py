@@ -2,10 +2,16 @@
 
 Classes: 
     Event: A type of event which can affect the inventory.
+
+    CompactEvent: A memory efficient type of event which can affect the inventory.
 """
 from dataclasses import dataclass
+from typing import ClassVar
 
-from narcotics_tracker.items.interfaces.dataitem_interface import DataItem
+from narcotics_tracker.items.interfaces.dataitem_interface import (
+    CompactDataItem,
+    DataItem,
+)
 
 
 @dataclass
@@ -29,3 +35,29 @@ class Event(DataItem):
 
     def __str__(self) -> str:
         return f"Event #{self.id}: {self.event_name} ({self.event_code}) {self.description}"
+
+
+@dataclass(slots=True)
+class CompactEvent(CompactDataItem):
+    """A memory efficient type of event which can affect the inventory.
+
+    Stores the same information as the Event using slots. Please see the
+    Event class for more information.
+
+    Attributes:
+        event_code (str): Unique code identifying the event.
+
+        event_name (str): Name of the event.
+
+        description (str): Description of the event.
+
+        modifier (int): (+1 or -1) Specifies if the event adds or removes from the inventory.
+    """
+
+    table: ClassVar[str] = "events"
+    event_code: str
+    event_name: str
+    description: str
+    modifier: int
+
+    __str__ = Event.__str__
@@ -2,9 +2,17 @@
 
 Classes: 
     DatabaseItems: The interface for items which are stored in the database.
+
+    CompactDataItem: The interface for memory efficient items which are 
+        stored in the database.
+
+Functions:
+    return_column_data: Returns a dictionary mapping an item's column names to 
+        their values.
 """
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import ClassVar, Union
 
 
 @dataclass
@@ -32,3 +40,49 @@ class DataItem(ABC):
     @abstractmethod
     def __str__(self) -> str:
         """Returns a string representation of the item."""
+
+
+@dataclass(slots=True)
+class CompactDataItem(ABC):
+    """The interface for memory efficient items which are stored in the database.
+
+    Compact items store their attributes in slots instead of a dictionary and
+    define the table as a class constant. They are intended for loading large
+    numbers of items, such as the full inventory during an audit.
+
+    Attributes:
+        table (str): Name of the table the item belongs to. Class constant.
+
+        id (int): Numeric identifier of the item.
+
+        created_date (int): Unix timestamp when the item was first added.
+
+        modified_date (int): Unix timestamp when the item was last modified.
+
+        modified_by (str): The name of the user who last modified the item.
+    """
+
+    table: ClassVar[str]
+    id: int
+    created_date: int
+    modified_date: int
+    modified_by: str
+
+    @abstractmethod
+    def __str__(self) -> str:
+        """Returns a string representation of the item."""
+
+
+def return_column_data(item: Union[DataItem, CompactDataItem]) -> dict[str, any]:
+    """Returns a dictionary mapping an item's column names to their values.
+
+    The item is not modified. The table attribute is not included.
+
+    Args:
+        item (DataItem, CompactDataItem): The item to be read.
+    """
+    return {
+        field.name: getattr(item, field.name)
+        for field in fields(item)
+        if field.name != "table"
+    }
@@ -2,10 +2,16 @@
 
 Classes:
     Medication: A controlled substance medication which is tracked.
+
+    CompactMedication: A memory efficient controlled substance medication.
 """
 from dataclasses import dataclass
+from typing import ClassVar
 
-from narcotics_tracker.items.interfaces.dataitem_interface import DataItem
+from narcotics_tracker.items.interfaces.dataitem_interface import (
+    CompactDataItem,
+    DataItem,
+)
 from narcotics_tracker.services.service_manager import ServiceManager
 
 
@@ -43,3 +49,38 @@ class Medication(DataItem):
             self.medication_amount, self.preferred_unit
         )
         return f"Medication #{self.id}: {self.medication_name} ({self.medication_code}) {medication_amount} {self.preferred_unit} in {self.fill_amount} ml."
+
+
+@dataclass(slots=True)
+class CompactMedication(CompactDataItem):
+    """A memory efficient controlled substance medication.
+
+    Stores the same information as the Medication using slots. Please see the
+    Medication class for more information.
+
+    Attributes:
+        medication_code (str): Unique code identifying the medication.
+
+        medication_name (str): Name of the medication.
+
+        fill_amount (float): Amount of liquid the medication is dissolved in.
+
+        medication_amount (float): Amount of medication.
+
+        preferred_unit (str): The unit of measurement for the medication.
+
+        concentration (float): The ratio of medication to liquid.
+
+        status (str): Status of the medication.
+    """
+
+    table: ClassVar[str] = "medications"
+    medication_code: str
+    medication_name: str
+    fill_amount: float
+    medication_amount: float
+    preferred_unit: str
+    concentration: float
+    status: str
+
+    __str__ = Medication.__str__
@@ -2,10 +2,16 @@
 
 Classes:
     ReportingPeriod: A period of time for medication tracking.
+
+    CompactReportingPeriod: A memory efficient period of time for medication tracking.
 """
 from dataclasses import dataclass
+from typing import ClassVar
 
-from narcotics_tracker.items.interfaces.dataitem_interface import DataItem
+from narcotics_tracker.items.interfaces.dataitem_interface import (
+    CompactDataItem,
+    DataItem,
+)
 from narcotics_tracker.services.service_manager import ServiceManager
 
 
@@ -33,3 +39,26 @@ class ReportingPeriod(DataItem):
         else:
             end_date = "None"
         return f"Reporting Period #{self.id}: Start Date: {start_date}, End Date: {end_date}, Current Status: {self.status}."
+
+
+@dataclass(slots=True)
+class CompactReportingPeriod(CompactDataItem):
+    """A memory efficient period of time for medication tracking.
+
+    Stores the same information as the ReportingPeriod using slots. Please see the
+    ReportingPeriod class for more information.
+
+    Attributes:
+        start_date (int): Unix timestamp of when the reporting period opened.
+
+        end_date (int): Unix timestamp of when the reporting period closed.
+
+        status (str): Status of the reporting period.
+    """
+
+    table: ClassVar[str] = "reporting_periods"
+    start_date: int
+    end_date: int
+    status: str
+
+    __str__ = ReportingPeriod.__str__
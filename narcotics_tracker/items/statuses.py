@@ -2,10 +2,16 @@
 
 Classes:
     Status: A status for other data items.
+
+    CompactStatus: A memory efficient status for other data items.
 """
 from dataclasses import dataclass
+from typing import ClassVar
 
-from narcotics_tracker.items.interfaces.dataitem_interface import DataItem
+from narcotics_tracker.items.interfaces.dataitem_interface import (
+    CompactDataItem,
+    DataItem,
+)
 
 
 @dataclass
@@ -27,3 +33,26 @@ class Status(DataItem):
 
     def __str__(self) -> str:
         return f"Status #{self.id}: {self.status_name} ({self.status_code}) {self.description}"
+
+
+@dataclass(slots=True)
+class CompactStatus(CompactDataItem):
+    """A memory efficient status for other data items.
+
+    Stores the same information as the Status using slots. Please see the
+    Status class for more information.
+
+    Attributes:
+        status_code (str): Unique identifier for the status.
+
+        status_name (str): Name of the status.
+
+        description (str): Description of the status.
+    """
+
+    table: ClassVar[str] = "statuses"
+    status_code: str
+    status_name: str
+    description: str
+
+    __str__ = Status.__str__
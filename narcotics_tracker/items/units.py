@@ -2,10 +2,16 @@
 
 Classes:
     Unit: A unit of measurement for medications.
+
+    CompactUnit: A memory efficient unit of measurement for medications.
 """
 from dataclasses import dataclass
+from typing import ClassVar
 
-from narcotics_tracker.items.interfaces.dataitem_interface import DataItem
+from narcotics_tracker.items.interfaces.dataitem_interface import (
+    CompactDataItem,
+    DataItem,
+)
 
 
 @dataclass
@@ -26,3 +32,26 @@ class Unit(DataItem):
 
     def __str__(self) -> str:
         return f"Unit #{self.id}: {self.unit_name} ({self.unit_code})."
+
+
+@dataclass(slots=True)
+class CompactUnit(CompactDataItem):
+    """A memory efficient unit of measurement for medications.
+
+    Stores the same information as the Unit using slots. Please see the
+    Unit class for more information.
+
+    Attributes:
+        unit_code (str): Unique identifier for the unit.
+
+        unit_name (str): Name of the unit.
+
+        decimals (int): Number of decimal places for the unit.
+    """
+
+    table: ClassVar[str] = "units"
+    unit_code: str
+    unit_name: str
+    decimals: int
+
+    __str__ = Unit.__str__
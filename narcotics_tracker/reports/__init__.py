@@ -1,6 +1,25 @@
 """Contains the modules required to return reports regarding the inventory.
 
 Reports:
+    AsyncBiAnnualNarcoticsInventory, AsyncReturnCurrentInventory, 
+    AsyncReturnMedicationStock: Run the reports below without blocking an 
+        event loop.
+
+    BiAnnualNarcoticsInventory: Returns information required for the 
+        Bi-Annual Narcotics Report.
+
+    ConsolidatedReport: Runs a report for many database files and combines 
+        the results into a county summary.
+
+    IncrementalBiAnnualNarcoticsInventory: Returns the Bi-Annual Narcotics 
+        Report from the running totals of the inventory.
+
+    MultiPeriodBiAnnualNarcoticsInventory: Returns the Bi-Annual Narcotics 
+        Report for many reporting periods at once.
+
+    ReportCache: Runs reports and caches their results until the database 
+        changes.
+
     ReturnCurrentInventory: Returns the current stock for all active 
         medications in the inventory.
     
@@ -8,6 +27,20 @@ Reports:
         medication.
 """
 
+from narcotics_tracker.reports.async_reports import (
+    AsyncBiAnnualNarcoticsInventory,
+    AsyncReport,
+    AsyncReturnCurrentInventory,
+    AsyncReturnMedicationStock,
+)
 from narcotics_tracker.reports.biannual_inventory import BiAnnualNarcoticsInventory
+from narcotics_tracker.reports.consolidated_report import ConsolidatedReport
+from narcotics_tracker.reports.incremental_biannual_inventory import (
+    IncrementalBiAnnualNarcoticsInventory,
+)
+from narcotics_tracker.reports.multi_period_biannual_inventory import (
+    MultiPeriodBiAnnualNarcoticsInventory,
+)
+from narcotics_tracker.reports.report_cache import ReportCache
 from narcotics_tracker.reports.return_current_inventory import ReturnCurrentInventory
 from narcotics_tracker.reports.return_medication_stock import ReturnMedicationStock
@@ -0,0 +1,76 @@
+"""Contains the async variants of the reports.
+
+Each async report runs its synchronous report on a connection's thread of an
+AsyncSQLiteManager, so awaiting it does not block the event loop.
+
+Classes:
+    AsyncReport: Runs a synchronous report without blocking the event loop.
+
+    AsyncBiAnnualNarcoticsInventory: Returns information required for the
+        Bi-Annual Narcotics Report.
+
+    AsyncReturnCurrentInventory: Returns the current stock for all active
+        medications in the inventory.
+
+    AsyncReturnMedicationStock: Returns the current amount on hand for a
+        specific medication.
+"""
+
+from typing import TYPE_CHECKING
+
+from narcotics_tracker.reports.biannual_inventory import BiAnnualNarcoticsInventory
+from narcotics_tracker.reports.return_current_inventory import ReturnCurrentInventory
+from narcotics_tracker.reports.return_medication_stock import ReturnMedicationStock
+
+if TYPE_CHECKING:
+    from narcotics_tracker.reports.interfaces.report import Report
+    from narcotics_tracker.services.async_sqlite_manager import AsyncSQLiteManager
+
+
+class AsyncReport:
+    """Runs a synchronous report without blocking the event loop.
+
+    Subclasses set the report attribute to the class of the synchronous
+    report. It is created with the synchronous manager of the connection.
+    """
+
+    report: type["Report"]
+
+    def __init__(self, receiver: "AsyncSQLiteManager") -> None:
+        """Initializes the report. Sets the receiver.
+
+        Args:
+            receiver (AsyncSQLiteManager): Object which communicates with the
+                data repository.
+        """
+        self._receiver = receiver
+
+    async def run(self, *args, **kwargs) -> any:
+        """Runs the report, returns its results.
+
+        Accepts the parameters of the synchronous report's run method.
+        """
+        return await self._receiver.run(_run, self.report, args, kwargs)
+
+
+def _run(receiver, report: type["Report"], args: tuple, kwargs: dict) -> any:
+    """Runs the report with the receiver on the connection's thread."""
+    return report(receiver).run(*args, **kwargs)
+
+
+class AsyncBiAnnualNarcoticsInventory(AsyncReport):
+    """Returns information required for the Bi-Annual Narcotics Report."""
+
+    report = BiAnnualNarcoticsInventory
+
+
+class AsyncReturnCurrentInventory(AsyncReport):
+    """Returns the current stock for all active medications in the inventory."""
+
+    report = ReturnCurrentInventory
+
+
+class AsyncReturnMedicationStock(AsyncReport):
+    """Returns the current amount on hand for a specific medication."""
+
+    report = ReturnMedicationStock
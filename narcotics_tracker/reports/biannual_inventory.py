@@ -1,6 +1,8 @@
 """Contains the BiAnnualNarcoticsInventory Report.
 
 Classes:
+    BiAnnualNarcoticsInventory: Returns information required for the
+        Bi-Annual Narcotics Report.
 """
 from typing import TYPE_CHECKING
 
@@ -19,7 +21,6 @@ if TYPE_CHECKING:
 class BiAnnualNarcoticsInventory(Report):
     """Returns information required for the Bi-Annual Narcotics Report."""
 
-    _receiver = ServiceManager().persistence
     _converter = ServiceManager().conversion
 
     def __init__(
@@ -31,7 +32,8 @@ class BiAnnualNarcoticsInventory(Report):
 
         Args:
             receiver (PersistenceService, optional): Object which communicates
-                with the data repository. Defaults to SQLiteManager.
+                with the data repository. Defaults to the report persistence
+                service.
 
             converter(ConversionService, optional): Service which converts
                 medication amounts. Defaults to ConverterManager.
@@ -44,6 +46,11 @@ class BiAnnualNarcoticsInventory(Report):
     def run(self) -> dict[str, int]:
         self._period = self._get_current_reporting_period()
         self._medications = self._get_active_medications()
+
+        return self._build_report()
+
+    def _build_report(self) -> dict[int, dict]:
+        """Returns the report of the period for the medications."""
         self._report = self._build_report_dictionary(self._medications)
 
         for medication in self._medications:
@@ -83,7 +90,7 @@ class BiAnnualNarcoticsInventory(Report):
             ] = amount_lost
 
         for medication in self._medications:
-            ending_amount = self._calculate_total_ending_amount()
+            ending_amount = self._calculate_total_ending_amount(medication)
             self._report[self._period.id][medication.medication_code][
                 "ending_amount"
             ] = ending_amount
@@ -92,22 +99,14 @@ class BiAnnualNarcoticsInventory(Report):
 
     def _get_current_reporting_period(self) -> "ReportingPeriod":
         criteria = {"status": "OPEN"}
-        data = commands.ListReportingPeriods(self._receiver).execute(criteria)[-1]
 
-        return commands.LoadReportingPeriod().execute(data)
+        return commands.LoadReportingPeriods(self._receiver).execute(criteria)[-1]
 
     def _get_active_medications(self) -> list["Medication"]:
-        medication_list = []
         criteria = {"status": "ACTIVE"}
         order = "medication_code"
 
-        active_meds = commands.ListMedications(self._receiver).execute(criteria, order)
-
-        for med_data in active_meds:
-            medication = commands.LoadMedication().execute(med_data)
-            medication_list.append(medication)
-
-        return medication_list
+        return commands.LoadMedications(self._receiver).execute(criteria, order)
 
     def _build_report_dictionary(self, med_list: list["Medication"]) -> dict[dict]:
         period_id = self._period.id
@@ -129,7 +128,13 @@ class BiAnnualNarcoticsInventory(Report):
             "medication_code": medication.medication_code,
             "reporting_period_id": self._period.id,
         }
-        raw_amt = commands.ListAdjustments(self._receiver).execute(criteria)[0][4]
+        adj_list = commands.ListAdjustments(self._receiver).execute(criteria)
+
+        if adj_list == []:
+            return 0
+
+        amounts = self._extract_amounts(adj_list)
+        raw_amt = sum(amounts)
 
         return self._converter.to_milliliters(
             raw_amt,
@@ -149,9 +154,10 @@ class BiAnnualNarcoticsInventory(Report):
             return 0
 
         amounts = self._extract_amounts(adj_list)
+        raw_amt = sum(amounts)
 
         return self._converter.to_milliliters(
-            amounts,
+            raw_amt,
             medication.preferred_unit,
             medication.concentration,
         )
@@ -247,22 +253,77 @@ class BiAnnualNarcoticsInventory(Report):
 
         return amounts
 
-    def _calculate_total_ending_amount(self) -> int:
-        for medication in self._medications:
-            code = medication.medication_code
-            starting = self._report[self._period.id][code]["starting_amount"]
-            received = self._report[self._period.id][code]["amount_received"]
-            used = self._report[self._period.id][code]["amount_used"]
-            wasted = self._report[self._period.id][code]["amount_wasted"]
-            destroyed = self._report[self._period.id][code]["amount_destroyed"]
-            lost = self._report[self._period.id][code]["amount_lost"]
-
-            ending_amount = starting
-            ending_amount += received
-            ending_amount -= used
-            ending_amount -= wasted
-            ending_amount -= destroyed
-            ending_amount -= lost
-            ending_amount = round(ending_amount, 2)
-
-            return ending_amount
+    def _calculate_total_ending_amount(self, medication: "Medication") -> int:
+        """Returns the amount of the medication left at the end in ml."""
+        code = medication.medication_code
+        starting = self._report[self._period.id][code]["starting_amount"]
+        received = self._report[self._period.id][code]["amount_received"]
+        used = self._report[self._period.id][code]["amount_used"]
+        wasted = self._report[self._period.id][code]["amount_wasted"]
+        destroyed = self._report[self._period.id][code]["amount_destroyed"]
+        lost = self._report[self._period.id][code]["amount_lost"]
+
+        ending_amount = starting
+        ending_amount += received
+        ending_amount -= used
+        ending_amount -= wasted
+        ending_amount -= destroyed
+        ending_amount -= lost
+        ending_amount = round(ending_amount, 2)
+
+        return ending_amount
+
+
+class _TotalledBiAnnualNarcoticsInventory(BiAnnualNarcoticsInventory):
+    """Builds the Bi-Annual Narcotics Report from totals of the adjustments.
+
+    Subclasses return the total amount of each event and medication of the
+    period from _return_totals, which replaces the queries for each
+    medication and event.
+    """
+
+    _totals: dict[tuple[str, str], float] = None
+
+    def _return_totals(self) -> dict[tuple[str, str], float]:
+        """Returns the total amount of each event and medication code."""
+        ...
+
+    def _get_starting_amount(self, medication: "Medication") -> int:
+        """Returns the amount in milliliters."""
+        return self._convert(medication, self._return_total(medication, "IMPORT"))
+
+    def _get_amount_received(self, medication: "Medication") -> int:
+        """Returns the total amount of medication ordered in ml."""
+        return self._convert(medication, self._return_total(medication, "ORDER"))
+
+    def _get_amount_used(self, medication: "Medication") -> int:
+        """Returns the total amount of medication used in ml."""
+        return self._convert(medication, -self._return_total(medication, "USE"))
+
+    def _get_amount_wasted(self, medication: "Medication") -> int:
+        """Returns the total amount of medication wasted in ml."""
+        return self._convert(medication, -self._return_total(medication, "WASTE"))
+
+    def _get_amount_destroyed(self, medication: "Medication") -> int:
+        """Returns the total amount of medication destroyed in ml."""
+        return self._convert(medication, -self._return_total(medication, "DESTROY"))
+
+    def _get_amount_lost(self, medication: "Medication") -> int:
+        """Returns the total amount of medication lost in ml."""
+        return self._convert(medication, -self._return_total(medication, "LOSS"))
+
+    def _convert(self, medication: "Medication", raw_amount: float) -> int:
+        """Returns the raw amount of the medication in milliliters."""
+        if raw_amount == 0:
+            return 0
+
+        return self._converter.to_milliliters(
+            raw_amount, medication.preferred_unit, medication.concentration
+        )
+
+    def _return_total(self, medication: "Medication", event_code: str) -> float:
+        """Returns the total amount of the medication's adjustments for an event."""
+        if self._totals is None:
+            self._totals = self._return_totals()
+
+        return self._totals.get((event_code, medication.medication_code), 0)
@@ -0,0 +1,171 @@
+"""Runs a report for many agencies and combines their results.
+
+A county office receives the database of each agency it oversees. The
+ConsolidatedReport runs the same report against every database file in a
+pool of processes, so the databases are read in parallel, and combines the
+results into a county summary. A database which cannot be read does not stop
+the report. Its error is returned alongside the results of the others.
+
+Classes:
+    ConsolidatedReport: Runs a report for many database files and combines
+        the results into a county summary.
+"""
+
+import concurrent.futures
+from typing import TYPE_CHECKING, Callable
+
+from narcotics_tracker.reports.biannual_inventory import BiAnnualNarcoticsInventory
+from narcotics_tracker.reports.interfaces.report import Report
+from narcotics_tracker.reports.return_current_inventory import ReturnCurrentInventory
+from narcotics_tracker.services.read_only_sqlite_manager import ReadOnlySQLiteManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.services.interfaces.persistence import PersistenceService
+
+
+class ConsolidatedReport(Report):
+    """Runs a report for many database files and combines the results.
+
+    Supported reports are the BiAnnualNarcoticsInventory and the
+    ReturnCurrentInventory.
+
+    Methods:
+        run: Runs the report for each database file and returns the results.
+    """
+
+    def __init__(
+        self,
+        filenames: list[str],
+        report: type["Report"] = BiAnnualNarcoticsInventory,
+        max_workers: int = None,
+        receiver_class: type["PersistenceService"] = ReadOnlySQLiteManager,
+    ) -> None:
+        """Initializes the report.
+
+        Args:
+            filenames (list[str]): The filenames of the agency databases in
+                the data directory.
+
+            report (type, optional): The class of the report run for each
+                database. Defaults to BiAnnualNarcoticsInventory.
+
+            max_workers (int, optional): The number of processes reading the
+                databases. Defaults to the number of processors.
+
+            receiver_class (type, optional): The persistence service each
+                process opens its database with. Defaults to
+                ReadOnlySQLiteManager.
+
+        Raises:
+            ValueError: The report cannot be consolidated.
+        """
+        if report not in _SUMMARIZERS:
+            raise ValueError(f"{report.__name__} cannot be consolidated.")
+
+        self.filenames = list(filenames)
+        self.report = report
+        self.max_workers = max_workers
+        self.receiver_class = receiver_class
+
+    def run(self, progress: Callable[[int, int, str], None] = None) -> dict[str, any]:
+        """Runs the report for each database file and returns the results.
+
+        Args:
+            progress (Callable, optional): Called each time a database is
+                finished with the number of finished databases, the total
+                number of databases and the filename.
+
+        Returns:
+            dict: Maps 'agencies' to the report result of each filename,
+                'errors' to the error message of each filename which failed
+                and 'summary' to the combined results of the agencies.
+        """
+        results = {}
+        errors = {}
+
+        with concurrent.futures.ProcessPoolExecutor(self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    _run_report, self.report, self.receiver_class, filename
+                ): filename
+                for filename in self.filenames
+            }
+
+            for finished, future in enumerate(
+                concurrent.futures.as_completed(futures), start=1
+            ):
+                filename = futures[future]
+                try:
+                    results[filename] = future.result()
+                except Exception as error:
+                    errors[filename] = f"{type(error).__name__}: {error}"
+
+                if progress:
+                    progress(finished, len(futures), filename)
+
+        agencies = {
+            filename: results[filename]
+            for filename in self.filenames
+            if filename in results
+        }
+
+        return {
+            "agencies": agencies,
+            "errors": errors,
+            "summary": _SUMMARIZERS[self.report](list(agencies.values())),
+        }
+
+
+def _run_report(
+    report: type["Report"], receiver_class: type["PersistenceService"], filename: str
+) -> any:
+    """Runs the report against a database file in a worker process."""
+    receiver = receiver_class(filename)
+    try:
+        return report(receiver).run()
+    finally:
+        receiver.close()
+
+
+def _summarize_biannual(results: list[dict]) -> dict[str, dict]:
+    """Adds up the amounts of each medication across the agencies.
+
+    Each agency reports its own reporting period, so the summary is keyed by
+    medication code only.
+    """
+    summary = {}
+
+    for result in results:
+        for medications in result.values():
+            for code, figures in medications.items():
+                if code not in summary:
+                    summary[code] = dict(figures)
+                    continue
+
+                for key, value in figures.items():
+                    if key.endswith("amount") or key.startswith("amount"):
+                        summary[code][key] = round(summary[code][key] + value, 2)
+
+    return summary
+
+
+def _summarize_current_inventory(results: list[list[dict]]) -> list[dict]:
+    """Adds up the stock of each medication across the agencies."""
+    summary = {}
+
+    for result in results:
+        for medication in result:
+            if medication["code"] not in summary:
+                summary[medication["code"]] = dict(medication)
+                continue
+
+            total = summary[medication["code"]]["amount"] + medication["amount"]
+            summary[medication["code"]]["amount"] = round(total, 2)
+
+    return list(summary.values())
+
+
+_SUMMARIZERS = {
+    BiAnnualNarcoticsInventory: _summarize_biannual,
+    ReturnCurrentInventory: _summarize_current_inventory,
+}
@@ -0,0 +1,39 @@
+"""Contains the IncrementalBiAnnualNarcoticsInventory Report.
+
+Classes:
+    IncrementalBiAnnualNarcoticsInventory: Returns the Bi-Annual Narcotics
+        Report from the running totals of the inventory.
+"""
+
+from narcotics_tracker.commands.change_log_commands import CHANGES_TABLE, TOTALS_TABLE
+from narcotics_tracker.reports.biannual_inventory import (
+    _TotalledBiAnnualNarcoticsInventory,
+)
+
+
+class IncrementalBiAnnualNarcoticsInventory(_TotalledBiAnnualNarcoticsInventory):
+    """Returns the Bi-Annual Narcotics Report from the running totals.
+
+    The change log must be enabled with the EnableChangeLog command. The
+    report reads the totals of the current reporting period and adds the
+    changes recorded since the change log was last applied, instead of
+    reading every adjustment of the period.
+    """
+
+    def run(self) -> dict[str, int]:
+        self._totals = None
+
+        return super().run()
+
+    def _return_totals(self) -> dict[tuple[str, str], float]:
+        """Returns the totals of the period with the recorded changes added."""
+        criteria = {"reporting_period_id": self._period.id}
+        totals = {}
+
+        for table_name in (TOTALS_TABLE, CHANGES_TABLE):
+            for row in self._receiver.read(table_name, criteria).fetchall():
+                event_code, medication_code, amount = row[-3:]
+                key = (event_code, medication_code)
+                totals[key] = totals.get(key, 0) + amount
+
+        return totals
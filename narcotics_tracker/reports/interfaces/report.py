@@ -3,17 +3,54 @@
 Classes:
 
     Report: The protocol for Reports in the Narcotics Tracker.
+
+    ReportReceiver: Provides the default receiver of a report when it is
+        first used.
 """
 from typing import TYPE_CHECKING, Protocol
 
+from narcotics_tracker.services.metrics import metrics_registry
+from narcotics_tracker.services.service_manager import ServiceManager
+
 if TYPE_CHECKING:
     from narcotics_tracker.services.interfaces.persistence import PersistenceService
 
 
+class ReportReceiver:
+    """Provides the default receiver of a report when it is first used.
+
+    The receiver is the ServiceManager's report persistence service. It is
+    created when a report without a receiver first reads from the data
+    repository, rather than when the report's module is imported, so the
+    database file only has to exist once a report runs. A receiver passed to
+    the report replaces it.
+    """
+
+    def __get__(self, report: "Report", report_class: type) -> "PersistenceService":
+        if report is None:
+            return self
+
+        receiver = ServiceManager().report_persistence
+        report.__dict__["_receiver"] = receiver
+
+        return receiver
+
+
 class Report(Protocol):
-    """The protocol for Reports in the Narcotics Tracker."""
+    """The protocol for Reports in the Narcotics Tracker.
+
+    The run method of each report is instrumented so that its calls are
+    recorded by the metrics registry when it is enabled. Reports read through
+    the ServiceManager's report persistence service unless a receiver is
+    passed to them.
+    """
+
+    _receiver: "PersistenceService" = ReportReceiver()
 
-    _receiver: "PersistenceService"
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Instruments the run method of the report."""
+        super().__init_subclass__(**kwargs)
+        metrics_registry.instrument(cls, "run")
 
     def __init__(self):
         """Initializes the Report, sets any needed services."""
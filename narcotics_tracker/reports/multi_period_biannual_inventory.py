@@ -0,0 +1,75 @@
+"""Contains the MultiPeriodBiAnnualNarcoticsInventory Report.
+
+Classes:
+    MultiPeriodBiAnnualNarcoticsInventory: Returns the Bi-Annual Narcotics
+        Report for many reporting periods at once.
+"""
+
+from typing import TYPE_CHECKING
+
+from narcotics_tracker import commands
+from narcotics_tracker.reports.biannual_inventory import (
+    _TotalledBiAnnualNarcoticsInventory,
+)
+
+if TYPE_CHECKING:
+    from narcotics_tracker.items.reporting_periods import ReportingPeriod
+
+
+class MultiPeriodBiAnnualNarcoticsInventory(_TotalledBiAnnualNarcoticsInventory):
+    """Returns the Bi-Annual Narcotics Report for many reporting periods.
+
+    The amounts of every period are totalled by one query grouped by the
+    reporting period, event and medication, instead of querying each event
+    and medication of each period. The result maps each period id to the
+    figures returned by the BiAnnualNarcoticsInventory.
+    """
+
+    def run(self, reporting_period_ids: list[int] = None) -> dict[int, dict]:
+        """Runs the report for the reporting periods.
+
+        Args:
+            reporting_period_ids (list[int], optional): The ids of the
+                reporting periods. Defaults to all reporting periods.
+
+        Raises:
+            ValueError: A reporting period does not exist.
+        """
+        periods = self._get_reporting_periods(reporting_period_ids)
+        self._medications = self._get_active_medications()
+        period_totals = self._return_period_totals()
+
+        report = {}
+        for period in periods:
+            self._period = period
+            self._totals = period_totals.get(period.id, {})
+            report.update(self._build_report())
+
+        return report
+
+    def _get_reporting_periods(
+        self, reporting_period_ids: list[int] = None
+    ) -> list["ReportingPeriod"]:
+        """Returns the reporting periods in the order of their ids."""
+        periods = commands.LoadReportingPeriods(self._receiver).execute(order_by="id")
+
+        if reporting_period_ids is None:
+            return periods
+
+        requested = set(reporting_period_ids)
+        missing = requested - {period.id for period in periods}
+        if missing:
+            raise ValueError(f"Reporting Periods {sorted(missing)} not found.")
+
+        return [period for period in periods if period.id in requested]
+
+    def _return_period_totals(self) -> dict[int, dict[tuple[str, str], float]]:
+        """Returns the totals of each event and medication mapped by period."""
+        rows = commands.ListAdjustmentTotals(self._receiver).execute()
+        period_totals = {}
+
+        for period_id, event_code, medication_code, amount in rows:
+            totals = period_totals.setdefault(period_id, {})
+            totals[(event_code, medication_code)] = amount
+
+        return period_totals
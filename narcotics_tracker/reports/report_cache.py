@@ -0,0 +1,138 @@
+"""Returns the results of reports again while the database is unchanged.
+
+Dashboards run the same reports over and over although the inventory rarely
+changes between the runs. The ReportCache stores the result of each report
+together with the data version of its receiver. When the report is run again
+with the same parameters and the data version has not changed, a copy of the
+stored result is returned without reading the database. Lists, sets and
+dictionaries passed to a report are compared by their contents. Reports run
+with other arguments which cannot be hashed are not cached.
+
+The data version combines SQLite's data version, which changes when another
+connection commits a change, with the number of writes made through the
+SQLiteManagers of this process. Receivers without a data version, such as
+the DictionaryManager, are never cached.
+
+Classes:
+    ReportCache: Runs reports and caches their results until the database
+        changes.
+"""
+
+import collections
+import copy
+from typing import TYPE_CHECKING
+
+from narcotics_tracker.services.service_manager import ServiceManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.reports.interfaces.report import Report
+    from narcotics_tracker.services.interfaces.persistence import PersistenceService
+
+
+class ReportCache:
+    """Runs reports and caches their results until the database changes.
+
+    A cache holds one connection to the database and must be used from the
+    thread which created it.
+
+    Attributes:
+        max_entries (int): The number of results kept. The least recently
+            used result is removed first.
+
+        hits (int): The number of runs answered from the cache.
+
+        misses (int): The number of runs which ran the report.
+
+    Methods:
+        run: Returns the result of a report, running it only if the database
+            changed.
+
+        clear: Removes all cached results.
+    """
+
+    max_entries: int = 128
+
+    def __init__(
+        self, receiver: "PersistenceService" = None, max_entries: int = None
+    ) -> None:
+        """Initializes the cache. Sets the receiver if passed.
+
+        Args:
+            receiver (PersistenceService, optional): Object which communicates
+                with the data repository. Defaults to the report persistence
+                service.
+
+            max_entries (int, optional): The number of results kept. Defaults
+                to the max_entries class attribute.
+        """
+        if receiver:
+            self._receiver = receiver
+        else:
+            self._receiver = ServiceManager().report_persistence
+
+        if max_entries is not None:
+            self.max_entries = max_entries
+
+        self._results = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def run(self, report: type["Report"], *args, **kwargs) -> any:
+        """Returns the result of a report, running it only if the database changed.
+
+        Args:
+            report (type): The class of the report.
+
+            *args, **kwargs: Passed to the report's run method.
+        """
+        try:
+            key = (report, _freeze(args), _freeze(kwargs))
+            hash(key)
+        except TypeError:
+            key = None
+
+        version = None if key is None else self._return_version()
+
+        if version is not None and key in self._results:
+            cached_version, result = self._results[key]
+            if cached_version == version:
+                self.hits += 1
+                self._results.move_to_end(key)
+                return copy.deepcopy(result)
+
+        self.misses += 1
+        result = report(self._receiver).run(*args, **kwargs)
+
+        if version is not None:
+            self._results[key] = (version, copy.deepcopy(result))
+            self._results.move_to_end(key)
+            if len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+        return result
+
+    def clear(self) -> None:
+        """Removes all cached results."""
+        self._results.clear()
+
+    def _return_version(self) -> any:
+        """Returns the data version of the receiver, or None if it has none."""
+        return_data_version = getattr(self._receiver, "return_data_version", None)
+        if return_data_version is None:
+            return None
+
+        return return_data_version()
+
+
+def _freeze(value: any) -> any:
+    """Returns lists, sets and dictionaries as hashable tuples and frozensets."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+
+    return value
@@ -18,7 +18,6 @@ if TYPE_CHECKING:
 class ReturnCurrentInventory(Report):
     """Returns the current stock for all active medications in the inventory."""
 
-    _receiver = ServiceManager().persistence
     _converter = ServiceManager().conversion
 
     def __init__(self, receiver: "PersistenceService" = None) -> None:
@@ -26,7 +25,8 @@ class ReturnCurrentInventory(Report):
 
         Args:
             receiver (PersistenceService, optional): Object which communicates
-                with the data repository. Defaults to SQLiteManager.
+                with the data repository. Defaults to the report persistence
+                service.
         """
         if receiver:
             self._receiver = receiver
@@ -8,7 +8,6 @@ from typing import TYPE_CHECKING
 
 from narcotics_tracker import commands
 from narcotics_tracker.reports.interfaces.report import Report
-from narcotics_tracker.services.service_manager import ServiceManager
 
 if TYPE_CHECKING:
     from narcotics_tracker.services.interfaces.persistence import PersistenceService
@@ -17,14 +16,13 @@ if TYPE_CHECKING:
 class ReturnMedicationStock(Report):
     """Returns the current amount on hand for a specific medication."""
 
-    _receiver = ServiceManager().persistence
-
     def __init__(self, receiver: "PersistenceService" = None) -> None:
         """Initializes the command. Sets the receiver if passed.
 
         Args:
             receiver (PersistenceService, optional): Object which communicates
-                with the data repository. Defaults to SQLiteManager.
+                with the data repository. Defaults to the report persistence
+                service.
         """
         if receiver:
             self._receiver = receiver
@@ -2,15 +2,37 @@
 
 Scripts:
 
+    backup_database: Backs up the inventory database while it remains in use.
+
     create_my_database: Creates the medications which I use at my agency and 
         writes them to the table.
 
+    generate_load_data: Generates large databases for load testing the 
+        Narcotics Tracker.
+
+    profiling: Runs scripts under the profiler to show where time and memory 
+        are spent.
+
     run_biannual_report: Script which runs the Bi-Annual Narcotics Report. For 
         demo purposes.
 
+    run_county_report: Runs a report for every agency of a county and prints 
+        the county summary.
+
     run_report: Scripts to run Current Inventory Report. For demo purposes.
         
     setup: Sets up the Narcotics Tracker.
 
     wlvac_adjustment: Adds all inventory adjustments to the WLVAC Inventory.
+
+Profiling:
+
+    The backup_database, run_county_report, run_reports, run_biannual_report, 
+    setup and wlvac_adjustment scripts can be profiled by passing the 
+    --profile option or setting the NARCOTICS_TRACKER_PROFILE environment 
+    variable.
+
+    ```
+    python -m narcotics_tracker.scripts.run_reports --profile
+    ```
 """
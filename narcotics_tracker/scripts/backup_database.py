@@ -0,0 +1,94 @@
+"""Backs up the inventory database while it remains in use.
+
+The database is copied in steps so that stations can keep saving adjustments
+during the backup. Afterwards the row counts and stock totals of the backup
+are compared with the database. The script exits with status 1 if they do
+not match.
+
+Example:
+
+    python -m narcotics_tracker.scripts.backup_database --pages 512 --sleep 0.1
+
+Functions:
+
+    main: Backs up and verifies the database.
+
+    parse_arguments: Returns the settings for the backup.
+"""
+
+import argparse
+import datetime
+import os
+import sys
+
+from narcotics_tracker import commands
+from narcotics_tracker.scripts import profiling
+from narcotics_tracker.services.service_manager import ServiceManager
+
+
+def main(arguments: list[str] = None) -> int:
+    """Backs up and verifies the database, returns the exit status.
+
+    Args:
+        arguments (list[str], optional): The command line arguments. Defaults
+            to the arguments passed to the script.
+    """
+    settings = parse_arguments(arguments)
+    receiver = ServiceManager().persistence
+
+    message = commands.BackupDatabase(receiver).execute(
+        settings.target, settings.pages, settings.sleep, _print_progress
+    )
+    print(f"\n{message}")
+
+    if settings.no_verify:
+        return 0
+
+    comparison = commands.VerifyBackup(receiver).execute(settings.target)
+    for table_name, (source, copy) in comparison["row_counts"].items():
+        print(f"{table_name}: {source} rows in database, {copy} in backup.")
+
+    if comparison["verified"]:
+        print("Backup verified.")
+        return 0
+
+    print("Backup does not match the database.")
+    return 1
+
+
+def parse_arguments(arguments: list[str] = None) -> argparse.Namespace:
+    """Returns the settings for the backup.
+
+    Args:
+        arguments (list[str], optional): The command line arguments. Defaults
+            to the arguments passed to the script.
+    """
+    database = ServiceManager().database
+    name, extension = os.path.splitext(database)
+    today = datetime.date.today().isoformat()
+
+    parser = argparse.ArgumentParser(description="Backs up the database.")
+    parser.add_argument(
+        "--target",
+        default=os.path.join("backups", f"{name}_{today}{extension}"),
+        help="The filename of the backup in the data directory.",
+    )
+    parser.add_argument(
+        "--pages", type=int, default=1024, help="Pages copied in each step."
+    )
+    parser.add_argument(
+        "--sleep", type=float, default=0.05, help="Seconds waited between steps."
+    )
+    parser.add_argument("--no-verify", action="store_true")
+
+    return parser.parse_args(arguments)
+
+
+def _print_progress(status: int, remaining: int, total: int) -> None:
+    """Prints the share of pages which have been copied."""
+    copied = total - remaining
+    print(f"\rCopied {copied} of {total} pages.", end="", flush=True)
+
+
+if __name__ == "__main__":
+    sys.exit(profiling.run(main, "backup_database"))
@@ -23,16 +23,19 @@ dt_man = DateTimeManager()
 def main():
     """Sets up the narcotics database for WLVAC."""
     # * Populate Database with WLVAC Medications.
+    batch = commands.CommandBatch()
     meds = build_wlvac_meds()
 
     for medication in meds:
-        commands.AddMedication().execute(medication)
+        batch.add(commands.AddMedication, medication)
 
     # * Populate Database with Reporting Periods for 2022.
     periods = build_reporting_periods()
 
     for period in periods:
-        commands.AddReportingPeriod().execute(period)
+        batch.add(commands.AddReportingPeriod, period)
+
+    batch.execute()
 
 
 def build_wlvac_meds() -> list["Medication"]:
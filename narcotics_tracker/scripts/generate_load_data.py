@@ -0,0 +1,433 @@
+"""Generates large databases for load testing the Narcotics Tracker.
+
+Each agency receives its own database file containing the standard items, a
+set of medications, reporting periods covering the requested years and
+adjustments spread over those periods. Most adjustments are uses of a
+medication, followed by waste, orders and destruction. A few medications
+make up most of the uses. The adjustments are built as CompactAdjustments and
+saved in batches with the AddAdjustments command.
+
+The same seed always generates the same data.
+
+Usage:
+
+    python -m narcotics_tracker.scripts.generate_load_data --agencies 3 \
+        --medications 8 --years 5 --adjustments 1000000
+
+Functions:
+
+    main: Parses the arguments and generates a database for each agency.
+
+    parse_arguments: Returns the settings passed on the command line.
+
+    generate_agency: Creates and populates the database for one agency.
+
+    build_medications: Builds the medications used by each agency.
+
+    return_period_boundaries: Returns the start and end timestamps of each 
+        reporting period.
+
+    build_reporting_periods: Builds the reporting periods for each year.
+
+    generate_adjustments: Yields adjustments for a reporting period.
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+from itertools import islice
+from typing import TYPE_CHECKING, Iterator
+
+from narcotics_tracker import commands
+from narcotics_tracker.builders.medication_builder import MedicationBuilder
+from narcotics_tracker.builders.reporting_period_builder import ReportingPeriodBuilder
+from narcotics_tracker.configuration.standard_items import StandardItemCreator
+from narcotics_tracker.items.adjustments import CompactAdjustment
+from narcotics_tracker.services.datetime_manager import DateTimeManager
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.items.medications import Medication
+    from narcotics_tracker.items.reporting_periods import ReportingPeriod
+
+
+MEDICATION_TEMPLATES = [
+    ("fentanyl", "Fentanyl", 2, 100, "mcg"),
+    ("morphine", "Morphine", 1, 10, "mg"),
+    ("midazolam", "Midazolam", 2, 10, "mg"),
+    ("ketamine", "Ketamine", 5, 500, "mg"),
+    ("hydromorphone", "Hydromorphone", 1, 2, "mg"),
+    ("diazepam", "Diazepam", 2, 10, "mg"),
+    ("lorazepam", "Lorazepam", 1, 2, "mg"),
+    ("meperidine", "Meperidine", 1, 50, "mg"),
+]
+
+EVENT_WEIGHTS = {"USE": 80, "WASTE": 12, "ORDER": 6, "DESTROY": 2}
+
+VIALS_PER_EVENT = {
+    "USE": (0.25, 0.5, 0.5, 1, 1, 1),
+    "WASTE": (0.25, 0.5, 0.75),
+    "ORDER": (10, 12, 12),
+    "DESTROY": (1, 2, 3, 5),
+}
+
+REFERENCE_PREFIXES = {
+    "IMPORT": "Starting Inventory",
+    "USE": "PCR#",
+    "WASTE": "PCR#",
+    "ORDER": "PO#",
+    "DESTROY": "RxRD#",
+}
+
+
+def main(arguments: list[str] = None) -> list[str]:
+    """Parses the arguments and generates a database for each agency.
+
+    Args:
+        arguments (list[str], optional): The command line arguments. Defaults
+            to the arguments passed to the script.
+
+    Returns:
+        list[str]: The filenames of the generated databases.
+    """
+    settings = parse_arguments(arguments)
+    filenames = []
+
+    for agency_number in range(1, settings.agencies + 1):
+        filename = f"{settings.prefix}_{agency_number:02d}.db"
+        rng = random.Random(f"{settings.seed}-{agency_number}")
+
+        count = generate_agency(filename, settings, rng)
+        filenames.append(filename)
+        print(f"{filename}: {count} adjustments generated.")
+
+    return filenames
+
+
+def parse_arguments(arguments: list[str] = None) -> argparse.Namespace:
+    """Returns the settings passed on the command line.
+
+    Args:
+        arguments (list[str], optional): The command line arguments. Defaults
+            to the arguments passed to the script.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generates large databases for load testing."
+    )
+    parser.add_argument("--prefix", default="load_test", help="Database filename.")
+    parser.add_argument("--agencies", type=int, default=1)
+    parser.add_argument("--medications", type=int, default=3)
+    parser.add_argument("--years", type=int, default=2)
+    parser.add_argument("--start-year", type=int, default=2020)
+    parser.add_argument(
+        "--periods-per-year",
+        type=int,
+        default=2,
+        choices=(1, 2, 3, 4, 6, 12),
+    )
+    parser.add_argument(
+        "--adjustments", type=int, default=100_000, help="Adjustments per agency."
+    )
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--seed", default="narcotics")
+    parser.add_argument(
+        "--integer-keys",
+        action="store_true",
+        help="Store integer keys for events and medications in the inventory.",
+    )
+
+    return parser.parse_args(arguments)
+
+
+def generate_agency(
+    filename: str, settings: argparse.Namespace, rng: random.Random
+) -> int:
+    """Creates and populates the database for one agency.
+
+    An existing database with the same filename is replaced.
+
+    Args:
+        filename (str): The filename of the database file.
+
+        settings (argparse.Namespace): The settings returned by
+            parse_arguments.
+
+        rng (random.Random): The random number generator for the agency.
+
+    Returns:
+        int: The number of adjustments added.
+    """
+    if os.path.exists(f"data/{filename}"):
+        os.remove(f"data/{filename}")
+
+    receiver = SQLiteManager(filename)
+
+    for command in (
+        commands.CreateEventsTable,
+        commands.CreateMedicationsTable,
+        commands.CreateReportingPeriodsTable,
+        commands.CreateStatusesTable,
+        commands.CreateUnitsTable,
+    ):
+        command(receiver).execute()
+    commands.CreateInventoryTable(receiver).execute(settings.integer_keys)
+
+    _add_standard_items(receiver)
+
+    medications = build_medications(settings.medications)
+    for medication in medications:
+        commands.AddMedication(receiver).execute(medication)
+
+    boundaries = return_period_boundaries(
+        settings.start_year, settings.years, settings.periods_per_year
+    )
+    periods = build_reporting_periods(boundaries)
+    for period in periods:
+        commands.AddReportingPeriod(receiver).execute(period)
+
+    modifiers = {
+        event_code: commands.ReturnEventModifier(receiver).execute(event_code)
+        for event_code in REFERENCE_PREFIXES
+    }
+
+    per_period, remainder = divmod(settings.adjustments, len(periods))
+    count = 0
+
+    for number, (period, (_, period_end)) in enumerate(zip(periods, boundaries)):
+        adjustments = generate_adjustments(
+            period,
+            period_end,
+            medications,
+            modifiers,
+            per_period + (number < remainder),
+            rng,
+            include_import=number == 0,
+        )
+        count += _add_in_batches(receiver, adjustments, settings.batch_size)
+
+    return count
+
+
+def build_medications(count: int) -> list["Medication"]:
+    """Builds the medications used by each agency.
+
+    The templates are reused with a numbered code when more medications are
+    requested than there are templates.
+
+    Args:
+        count (int): The number of medications.
+    """
+    medications = []
+    med_builder = MedicationBuilder()
+
+    for number in range(count):
+        code, name, fill_amount, amount, unit = MEDICATION_TEMPLATES[
+            number % len(MEDICATION_TEMPLATES)
+        ]
+        cycle = number // len(MEDICATION_TEMPLATES)
+        if cycle:
+            code = f"{code}_{cycle}"
+            name = f"{name} {cycle}"
+
+        medication = (
+            med_builder.set_table("medications")
+            .set_id()
+            .set_medication_code(code)
+            .set_medication_name(name)
+            .set_fill_amount(fill_amount)
+            .set_medication_amount(amount)
+            .set_preferred_unit(unit)
+            .set_concentration()
+            .set_status("ACTIVE")
+            .set_created_date()
+            .set_modified_date()
+            .set_modified_by("Generator")
+            .build()
+        )
+        medications.append(medication)
+
+    return medications
+
+
+def return_period_boundaries(
+    start_year: int, years: int, periods_per_year: int
+) -> list[tuple[int, int]]:
+    """Returns the start and end timestamps of each reporting period.
+
+    Args:
+        start_year (int): The year of the first reporting period.
+
+        years (int): The number of years.
+
+        periods_per_year (int): The number of reporting periods in each year.
+    """
+    dt_manager = DateTimeManager()
+    months_per_period = 12 // periods_per_year
+
+    starts = [
+        dt_manager.convert_to_timestamp(f"{month:02d}-01-{year} 00:00:00")
+        for year in range(start_year, start_year + years)
+        for month in range(1, 13, months_per_period)
+    ]
+    starts.append(
+        dt_manager.convert_to_timestamp(f"01-01-{start_year + years} 00:00:00")
+    )
+
+    return [(start, next_start - 1) for start, next_start in zip(starts, starts[1:])]
+
+
+def build_reporting_periods(
+    boundaries: list[tuple[int, int]],
+) -> list["ReportingPeriod"]:
+    """Builds the reporting periods for each year.
+
+    The last reporting period is left open, all others are closed.
+
+    Args:
+        boundaries (list[tuple[int, int]]): The start and end timestamps of
+            each reporting period.
+    """
+    period_builder = ReportingPeriodBuilder()
+    periods = []
+
+    for number, (start_date, end_date) in enumerate(boundaries, start=1):
+        is_open = number == len(boundaries)
+
+        period = (
+            period_builder.set_table("reporting_periods")
+            .set_id(number)
+            .set_start_date(start_date)
+            .set_end_date(None if is_open else end_date)
+            .set_status("OPEN" if is_open else "CLOSED")
+            .set_created_date()
+            .set_modified_date()
+            .set_modified_by("Generator")
+            .build()
+        )
+        periods.append(period)
+
+    return periods
+
+
+def generate_adjustments(
+    period: "ReportingPeriod",
+    period_end: int,
+    medications: list["Medication"],
+    modifiers: dict[str, int],
+    count: int,
+    rng: random.Random,
+    include_import: bool = False,
+) -> Iterator[CompactAdjustment]:
+    """Yields adjustments for a reporting period.
+
+    Adjustment dates increase through the period. Amounts are multiples of
+    the medication's vial amount in the standard unit with the event's
+    modifier applied.
+
+    Args:
+        period (ReportingPeriod): The reporting period.
+
+        period_end (int): Unix timestamp of the end of the period.
+
+        medications (list[Medication]): The medications being adjusted.
+
+        modifiers (dict[str, int]): Maps event codes to their modifiers.
+
+        count (int): The number of adjustments.
+
+        rng (random.Random): The random number generator.
+
+        include_import (bool, optional): Whether the period starts with an
+            import of the starting inventory of each medication. Defaults to
+            False.
+    """
+    created_date = DateTimeManager().return_current()
+    codes = [medication.medication_code for medication in medications]
+    vial_amounts = [medication.medication_amount for medication in medications]
+    medication_weights = [1 / rank for rank in range(1, len(medications) + 1)]
+    event_codes = list(EVENT_WEIGHTS)
+    event_weights = list(EVENT_WEIGHTS.values())
+
+    if include_import:
+        for code, vial_amount in zip(codes, vial_amounts):
+            yield CompactAdjustment(
+                None,
+                created_date,
+                created_date,
+                "Generator",
+                period.start_date,
+                "IMPORT",
+                code,
+                round(vial_amount * 25 * modifiers["IMPORT"], 2),
+                REFERENCE_PREFIXES["IMPORT"],
+                period.id,
+            )
+
+    if count <= 0:
+        return
+
+    mean_gap = max((period_end - period.start_date) / count, 1)
+    adjustment_date = float(period.start_date)
+    medication_indexes = rng.choices(
+        range(len(medications)), medication_weights, k=count
+    )
+    chosen_events = rng.choices(event_codes, event_weights, k=count)
+
+    for number, (index, event_code) in enumerate(
+        zip(medication_indexes, chosen_events)
+    ):
+        adjustment_date = min(
+            adjustment_date + rng.expovariate(1 / mean_gap), period_end
+        )
+        vials = rng.choice(VIALS_PER_EVENT[event_code])
+        amount = round(vial_amounts[index] * vials * modifiers[event_code], 2)
+
+        yield CompactAdjustment(
+            None,
+            created_date,
+            created_date,
+            "Generator",
+            int(adjustment_date),
+            event_code,
+            codes[index],
+            amount,
+            f"{REFERENCE_PREFIXES[event_code]} {period.id}-{number}",
+            period.id,
+        )
+
+
+def _add_standard_items(receiver: SQLiteManager) -> None:
+    """Adds the standard events, statuses and units to the database."""
+    creator = StandardItemCreator()
+    add_commands = (
+        (commands.AddEvent, creator.create_events),
+        (commands.AddStatus, creator.create_statuses),
+        (commands.AddUnit, creator.create_units),
+    )
+
+    for command, create_items in add_commands:
+        for item in create_items():
+            try:
+                command(receiver).execute(item)
+            except sqlite3.IntegrityError:  # Item already in the database.
+                pass
+
+
+def _add_in_batches(
+    receiver: SQLiteManager, adjustments: Iterator[CompactAdjustment], size: int
+) -> int:
+    """Saves the adjustments in batches, returns the number saved."""
+    count = 0
+    batch = list(islice(adjustments, size))
+
+    while batch:
+        commands.AddAdjustments(receiver).execute(batch)
+        count += len(batch)
+        batch = list(islice(adjustments, size))
+
+    return count
+
+
+if __name__ == "__main__":
+    main()
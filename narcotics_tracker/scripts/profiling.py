@@ -0,0 +1,181 @@
+"""Runs scripts under the profiler to show where time and memory are spent.
+
+Scripts are profiled when they are started with the --profile option or when
+the NARCOTICS_TRACKER_PROFILE environment variable is set. The script runs
+under cProfile and tracemalloc. Afterwards the slowest functions and the
+peak memory use are printed and two files are written to the profile
+directory:
+
+    <script>.pstats: The cProfile statistics. Open them with the pstats
+        module or a viewer such as snakeviz.
+
+    <script>.collapsed: Call stacks in the collapsed format used by flame
+        graph tools such as flamegraph.pl and speedscope. The stacks are
+        rebuilt from the callers recorded by cProfile, so the time of a
+        function called from several places is divided between them in
+        proportion to the time of each call site.
+
+The profile directory defaults to 'data/profiles' and can be changed with the
+NARCOTICS_TRACKER_PROFILE_DIR environment variable.
+
+Functions:
+
+    run: Runs a script's main function, profiling it if requested.
+
+    profile: Runs a function under cProfile and tracemalloc.
+
+    write_collapsed_stacks: Writes the profiled call stacks in the collapsed
+        format.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+import tracemalloc
+from typing import Callable
+
+PROFILE_OPTION = "--profile"
+PROFILE_VARIABLE = "NARCOTICS_TRACKER_PROFILE"
+DIRECTORY_VARIABLE = "NARCOTICS_TRACKER_PROFILE_DIR"
+
+
+def run(main: Callable[[], any], name: str) -> any:
+    """Runs a script's main function, profiling it if requested.
+
+    The --profile option is removed from the command line arguments before
+    the script runs.
+
+    Args:
+        main (Callable): The main function of the script.
+
+        name (str): The name of the script. Used to name the output files.
+    """
+    profile_requested = PROFILE_OPTION in sys.argv
+    if profile_requested:
+        sys.argv.remove(PROFILE_OPTION)
+
+    if not (profile_requested or os.environ.get(PROFILE_VARIABLE)):
+        return main()
+
+    directory = os.environ.get(DIRECTORY_VARIABLE, "data/profiles")
+
+    return profile(main, name, directory)
+
+
+def profile(
+    function: Callable[[], any], name: str, directory: str, top: int = 15
+) -> any:
+    """Runs a function under cProfile and tracemalloc.
+
+    Args:
+        function (Callable): The function to be profiled.
+
+        name (str): Used to name the output files.
+
+        directory (str): The directory the output files are written to.
+
+        top (int, optional): The number of functions printed. Defaults to 15.
+
+    Returns:
+        any: The value returned by the function.
+    """
+    os.makedirs(directory, exist_ok=True)
+    profiler = cProfile.Profile()
+
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        result = function()
+    finally:
+        profiler.disable()
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        stats_path = os.path.join(directory, f"{name}.pstats")
+        collapsed_path = os.path.join(directory, f"{name}.collapsed")
+        profiler.dump_stats(stats_path)
+        stats = pstats.Stats(profiler)
+        write_collapsed_stacks(stats, collapsed_path)
+
+        print(_format_summary(stats, peak_memory, top))
+        print(f"Profile written to {stats_path} and {collapsed_path}.")
+
+    return result
+
+
+def write_collapsed_stacks(stats: pstats.Stats, filename: str) -> None:
+    """Writes the profiled call stacks in the collapsed format.
+
+    Each line contains a call stack, with the functions separated by
+    semicolons, followed by the time spent in the last function in
+    microseconds.
+
+    Args:
+        stats (pstats.Stats): The profile statistics.
+
+        filename (str): The path of the output file.
+    """
+    timings = stats.stats
+    callees = {}
+    for function, (_, _, _, _, callers) in timings.items():
+        for caller, (_, _, _, cumulative_time) in callers.items():
+            callees.setdefault(caller, []).append((function, cumulative_time))
+
+    roots = [function for function, timing in timings.items() if not timing[4]]
+    stacks = {}
+    for root in roots:
+        _collapse(root, timings[root][3], (), timings, callees, stacks)
+
+    with open(filename, "w") as collapsed_file:
+        for stack, seconds in sorted(stacks.items()):
+            microseconds = round(seconds * 1_000_000)
+            if microseconds > 0:
+                collapsed_file.write(f"{stack} {microseconds}\n")
+
+
+def _collapse(
+    function: tuple,
+    cumulative_time: float,
+    stack: tuple[str],
+    timings: dict,
+    callees: dict,
+    stacks: dict[str, float],
+) -> None:
+    """Adds a function and its callees to the collapsed stacks."""
+    total_time = timings[function][3]
+    if total_time <= 0 or cumulative_time <= 0:
+        return
+
+    share = min(cumulative_time / total_time, 1)
+    stack = stack + (_label(function),)
+    key = ";".join(stack)
+    stacks[key] = stacks.get(key, 0) + timings[function][2] * share
+
+    for callee, callee_time in callees.get(function, []):
+        if _label(callee) in stack:  # Recursive calls are already counted.
+            continue
+        _collapse(callee, callee_time * share, stack, timings, callees, stacks)
+
+
+def _label(function: tuple) -> str:
+    """Returns a readable name for a function in the profile statistics."""
+    filename, line_number, function_name = function
+
+    if filename == "~":
+        return function_name
+
+    return f"{function_name} ({os.path.basename(filename)}:{line_number})"
+
+
+def _format_summary(stats: pstats.Stats, peak_memory: int, top: int) -> str:
+    """Returns the slowest functions and the peak memory use."""
+    output = io.StringIO()
+    stats.stream = output
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+    summary = output.getvalue().strip()
+    summary += f"\n\nPeak memory traced: {peak_memory / 1_048_576:.2f} MiB"
+
+    return summary
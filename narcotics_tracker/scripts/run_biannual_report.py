@@ -2,7 +2,13 @@
 
 
 from narcotics_tracker import reports
+from narcotics_tracker.scripts import profiling
 
-if __name__ == "__main__":
-    report = reports.biannual_inventory.BiAnnualNarcoticsInventory().execute()
+
+def main():
+    report = reports.BiAnnualNarcoticsInventory().run()
     print(report)
+
+
+if __name__ == "__main__":
+    profiling.run(main, "run_biannual_report")
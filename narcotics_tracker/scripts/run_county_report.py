@@ -0,0 +1,79 @@
+"""Runs a report for every agency of a county and prints the county summary.
+
+Each agency database is read in its own process. Databases which cannot be
+read are listed after the summary and the script exits with status 1.
+
+Example:
+
+    python -m narcotics_tracker.scripts.run_county_report agency_a.db agency_b.db
+
+Functions:
+
+    main: Runs the consolidated report and prints the results.
+
+    parse_arguments: Returns the settings for the report.
+"""
+
+import argparse
+import sys
+
+from narcotics_tracker import reports
+from narcotics_tracker.scripts import profiling
+
+REPORTS = {
+    "biannual": reports.BiAnnualNarcoticsInventory,
+    "current": reports.ReturnCurrentInventory,
+}
+
+
+def main(arguments: list[str] = None) -> int:
+    """Runs the consolidated report and prints the results.
+
+    Args:
+        arguments (list[str], optional): The command line arguments. Defaults
+            to the arguments passed to the script.
+    """
+    settings = parse_arguments(arguments)
+
+    report = reports.ConsolidatedReport(
+        settings.filenames, REPORTS[settings.report], settings.workers
+    )
+    results = report.run(_print_progress)
+    print()
+
+    print("County Summary:")
+    print("---------------")
+    print(results["summary"])
+
+    for filename, message in results["errors"].items():
+        print(f"{filename} could not be read: {message}")
+
+    return 1 if results["errors"] else 0
+
+
+def parse_arguments(arguments: list[str] = None) -> argparse.Namespace:
+    """Returns the settings for the report.
+
+    Args:
+        arguments (list[str], optional): The command line arguments. Defaults
+            to the arguments passed to the script.
+    """
+    parser = argparse.ArgumentParser(description="Runs a report for each agency.")
+    parser.add_argument(
+        "filenames", nargs="+", help="The agency databases in the data directory."
+    )
+    parser.add_argument("--report", choices=REPORTS, default="biannual")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="The number of processes used."
+    )
+
+    return parser.parse_args(arguments)
+
+
+def _print_progress(finished: int, total: int, filename: str) -> None:
+    """Prints the number of databases which have been read."""
+    print(f"\rRead {finished} of {total} databases.", end="", flush=True)
+
+
+if __name__ == "__main__":
+    sys.exit(profiling.run(main, "run_county_report"))
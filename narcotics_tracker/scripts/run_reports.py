@@ -3,6 +3,7 @@
 import os
 
 from narcotics_tracker import reports
+from narcotics_tracker.scripts import profiling
 
 
 def main():
@@ -28,4 +29,4 @@ def _make_strings(db_totals: list[dict]) -> list[str]:
 
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main, "run_reports")
@@ -26,6 +26,7 @@ from typing import TYPE_CHECKING
 
 from narcotics_tracker import commands
 from narcotics_tracker.configuration.standard_items import StandardItemCreator
+from narcotics_tracker.scripts import profiling
 from narcotics_tracker.services.service_manager import ServiceManager
 
 if TYPE_CHECKING:
@@ -132,4 +133,4 @@ def populate_units() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main, "setup")
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from narcotics_tracker import commands
 from narcotics_tracker.builders.adjustment_builder import AdjustmentBuilder
+from narcotics_tracker.scripts import profiling
 from narcotics_tracker.services.service_manager import ServiceManager
 
 if TYPE_CHECKING:
@@ -16,8 +17,11 @@ def main() -> None:
 
     adjustment_list = construct_adjustments(adjustment_data)
 
+    batch = commands.CommandBatch()
     for adjustment in adjustment_list:
-        message = commands.AddAdjustment().execute(adjustment)
+        batch.add(commands.AddAdjustment, adjustment)
+
+    for message in batch.execute():
         print(message)
 
 
@@ -110,4 +114,4 @@ def return_adjustments_data() -> list[list]:
 
 
 if __name__ == "__main__":
-    main()
+    profiling.run(main, "wlvac_adjustment")
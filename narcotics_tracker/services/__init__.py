@@ -17,12 +17,42 @@ Modules:
     service_manager: Provides access to the services used by the Narcotics 
         Tracker.
 
+    async_sqlite_manager: Manages communication with the SQLite3 database from 
+        asyncio code.
+
+    code_lookup: Maps medication and event codes to the integer keys used in 
+        the inventory.
+
     conversion_manager: Handles conversion between different units.
     
+    dataitem_serializer: Prepares DataItems to be saved in the database.
+
     datetime_manager: Handles datetime functions for the Narcotics Tracker.
 
+    dictionary_manager: Stores the data of the Narcotics Tracker in Python 
+        dictionaries.
+
+    memory_sqlite_manager: Manages communication with an in-memory SQLite3 
+        database.
+
+    metrics: Records how often commands and reports run and how much work 
+        they do.
+
+    partitioned_sqlite_manager: Manages communication with a database split 
+        into yearly partitions.
+
+    read_only_sqlite_manager: Manages read-only communication with the SQLite3 
+        database.
+
+    query_log: Times SQL statements and logs the slow ones.
+
     sqlite_manager: Manages Communication with the SQLite3 Database.
 
+    threaded_sqlite_manager: Manages communication with the SQLite3 database 
+        from many threads.
+
+    write_queue: Funnels changes from many threads through a single writer.
+
 Accessing Services:
     When a service is needed they can be instantiated by accessing the 
     appropriate property in the ServiceProvider.
@@ -49,5 +79,53 @@ Changing The Database:
 
         services.database = 'new_filename.db'
 
+        persistence_service = services.persistence
+        ```
+
+Report Persistence:
+    Reports read through the ServiceProvider's report_persistence property. 
+    For the SQLiteManager it returns a ReadOnlySQLiteManager, which cannot 
+    take write locks. To run a report against a snapshot copy of the 
+    database, pass a ReadOnlySQLiteManager for the snapshot to the report.
+
+    Example:
+
+        ```python
+        snapshot = ReadOnlySQLiteManager('snapshot.db', immutable=True)
+
+        report = BiAnnualNarcoticsInventory(snapshot).run()
+        ```
+
+In-Memory Persistence:
+    The MemorySQLiteManager and the DictionaryManager keep the data in memory 
+    so that tests and benchmarks do not write database files. Assign either 
+    one as the persistence service, or select it for every ServiceManager by 
+    setting the NARCOTICS_TRACKER_PERSISTENCE environment variable to 
+    'memory' or 'dictionary'.
+
+    Example:
+
+        ```python
+        services = ServiceProvider()
+
+        services.persistence = MemorySQLiteManager
+
+        persistence_service = services.persistence
+        ```
+
+Using The Database From Many Threads:
+    The SQLiteManager's connection can only be used by the thread which 
+    created it. When commands or reports are run from a thread pool, assign 
+    the ThreadedSQLiteManager as the persistence service. It opens a 
+    connection for each thread, waits for locks held by other connections and 
+    retries statements while the database is busy.
+
+    Example:
+
+        ```python
+        services = ServiceProvider()
+
+        services.persistence = ThreadedSQLiteManager
+
         persistence_service = services.persistence
 """
@@ -0,0 +1,285 @@
+"""Manages communication with the SQLite3 database from asyncio code.
+
+The SQLiteManager and the commands block while the database works, which
+stops an event loop from serving other requests. The AsyncSQLiteManager keeps
+a small pool of connections. Each connection is created on, and only used
+by, its own executor thread. Awaiting a method sends the work to a free
+connection's thread so the event loop keeps running, and concurrent requests
+share the connections in the pool.
+
+Classes:
+    AsyncSQLiteManager: Sends and receives information from the SQLite
+        database without blocking the event loop.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterable
+
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
+
+
+class AsyncSQLiteManager:
+    """Sends and receives information from the SQLite database asynchronously.
+
+    Implements the methods of the PersistenceService protocol as coroutines.
+    Unlike the SQLiteManager, the read method returns the selected rows
+    instead of a cursor because the cursor belongs to the connection's thread.
+
+    Inside a transaction every call made by the task uses the same connection.
+
+    Methods:
+        run: Calls a function with a synchronous manager on a connection's
+            thread.
+
+        add: Adds a new row to the database.
+
+        insert: Adds a serialized DataItem to the database.
+
+        insert_many: Adds many serialized DataItems to the database.
+
+        read: Returns the selected rows from the database.
+
+        update: Updates rows in the database.
+
+        remove: Removes rows from the database.
+
+        transaction: Runs the calls made inside it in a single transaction.
+
+        close: Closes the connections and stops their threads.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        connections: int = 4,
+        manager: type[SQLiteManager] = SQLiteManager,
+        **kwargs,
+    ) -> None:
+        """Opens the connections of the pool.
+
+        Args:
+            filename (str): The filename of the database file.
+
+            connections (int, optional): The number of connections in the
+                pool. Defaults to 4.
+
+            manager (type[SQLiteManager], optional): The synchronous manager
+                created for each connection. Defaults to SQLiteManager.
+
+            **kwargs: Passed to the synchronous manager.
+        """
+        self.filename = filename
+        self._connections = [
+            _Connection(functools.partial(manager, filename, **kwargs), number)
+            for number in range(connections)
+        ]
+        self._available = None
+        self._pinned = contextvars.ContextVar(f"pinned_{id(self)}", default=None)
+
+    async def __aenter__(self) -> "AsyncSQLiteManager":
+        return self
+
+    async def __aexit__(self, *exception_info) -> None:
+        self.close()
+
+    async def run(self, function: Callable, *args, **kwargs) -> any:
+        """Calls a function with a synchronous manager on a connection's thread.
+
+        Args:
+            function (Callable): Called with the synchronous manager followed
+                by the other arguments.
+
+            *args, **kwargs: Passed to the function.
+
+        Returns:
+            any: The value returned by the function.
+        """
+        pinned = self._pinned.get()
+        if pinned is not None:
+            return await pinned.call(function, *args, **kwargs)
+
+        async with self._acquire() as connection:
+            return await connection.call(function, *args, **kwargs)
+
+    async def add(self, table_name: str, data: dict[str]) -> None:
+        """Adds a new row to the database.
+
+        Args:
+            table_name (str): Name of the table receiving the data.
+
+            data (dict[str]): Maps column names to the values being added.
+        """
+        return await self.run(_call, "add", table_name, data)
+
+    async def insert(self, serializer: "DataItemSerializer", values: tuple) -> None:
+        """Adds a serialized DataItem to the database.
+
+        Args:
+            serializer (DataItemSerializer): Provides the table and columns.
+
+            values (tuple): The values in the order of the columns.
+        """
+        return await self.run(_call, "insert", serializer, values)
+
+    async def insert_many(
+        self, serializer: "DataItemSerializer", rows: Iterable[tuple]
+    ) -> int:
+        """Adds many serialized DataItems to the database.
+
+        Args:
+            serializer (DataItemSerializer): Provides the table and columns.
+
+            rows (Iterable[tuple]): The values of each DataItem.
+
+        Returns:
+            int: The number of rows added.
+        """
+        return await self.run(_call, "insert_many", serializer, list(rows))
+
+    async def read(
+        self, table_name: str, criteria: dict[str] = {}, order_by: str = None
+    ) -> list[tuple]:
+        """Returns the selected rows from the database.
+
+        Args:
+            table_name (str): Name of the table.
+
+            criteria (dict[str], optional): Maps column names to values used
+                to select rows. Defaults to {}.
+
+            order_by (str, optional): Name of the column used to sort the
+                rows. Defaults to None.
+        """
+        return await self.run(_fetch_rows, table_name, criteria, order_by)
+
+    async def update(
+        self, table_name: str, data: dict[str], criteria: dict[str]
+    ) -> None:
+        """Updates rows in the database.
+
+        Args:
+            table_name (str): Name of the table.
+
+            data (dict[str]): Maps column names to their updated values.
+
+            criteria (dict[str]): Maps column names to values used to select
+                the rows to update.
+        """
+        return await self.run(_call, "update", table_name, data, criteria)
+
+    async def remove(self, table_name: str, criteria: dict[str]) -> None:
+        """Removes rows from the database.
+
+        Args:
+            table_name (str): Name of the table.
+
+            criteria (dict[str]): Maps column names to values used to select
+                the rows to remove.
+        """
+        return await self.run(_call, "remove", table_name, criteria)
+
+    @contextlib.asynccontextmanager
+    async def transaction(self) -> AsyncIterator["AsyncSQLiteManager"]:
+        """Runs the calls made inside it in a single transaction.
+
+        The changes are committed when the block completes and rolled back if
+        it raises an exception. Nested transactions join the outer one.
+        """
+        if self._pinned.get() is not None:
+            yield self
+            return
+
+        async with self._acquire() as connection:
+            context = await connection.call(_enter_transaction)
+            token = self._pinned.set(connection)
+            try:
+                yield self
+            except BaseException as exception:
+                await connection.call(
+                    _exit_transaction, context, type(exception), exception
+                )
+                raise
+            else:
+                await connection.call(_exit_transaction, context, None, None)
+            finally:
+                self._pinned.reset(token)
+
+    def close(self) -> None:
+        """Closes the connections and stops their threads."""
+        for connection in self._connections:
+            connection.close()
+
+    @contextlib.asynccontextmanager
+    async def _acquire(self) -> AsyncIterator["_Connection"]:
+        """Waits for a free connection and returns it to the pool afterwards."""
+        if self._available is None:
+            self._available = asyncio.Queue()
+            for connection in self._connections:
+                self._available.put_nowait(connection)
+
+        connection = await self._available.get()
+        try:
+            yield connection
+        finally:
+            self._available.put_nowait(connection)
+
+
+class _Connection:
+    """A synchronous manager used only by its own executor thread."""
+
+    def __init__(self, factory: Callable[[], SQLiteManager], number: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"narcotics-tracker-db-{number}"
+        )
+        self._manager = self._executor.submit(factory).result()
+
+    async def call(self, function: Callable, *args, **kwargs) -> any:
+        """Calls the function with the manager on the executor thread."""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(function, self._manager, *args, **kwargs)
+
+        return await loop.run_in_executor(self._executor, call)
+
+    def close(self) -> None:
+        """Closes the manager on its thread and stops the thread."""
+        if self._manager is not None:
+            self._executor.submit(self._manager.close).result()
+            self._manager = None
+        self._executor.shutdown()
+
+
+def _call(manager: SQLiteManager, method_name: str, *args) -> any:
+    """Calls a method of the manager."""
+    return getattr(manager, method_name)(*args)
+
+
+def _fetch_rows(
+    manager: SQLiteManager, table_name: str, criteria: dict[str], order_by: str
+) -> list[tuple]:
+    """Returns the selected rows, fetched on the connection's thread."""
+    return manager.read(table_name, criteria, order_by).fetchall()
+
+
+def _enter_transaction(manager: SQLiteManager) -> contextlib.AbstractContextManager:
+    """Begins a transaction, returns its context."""
+    context = manager.transaction()
+    context.__enter__()
+
+    return context
+
+
+def _exit_transaction(
+    manager: SQLiteManager,
+    context: contextlib.AbstractContextManager,
+    exception_type: type,
+    exception: BaseException,
+) -> None:
+    """Commits or rolls back the transaction."""
+    context.__exit__(exception_type, exception, None)
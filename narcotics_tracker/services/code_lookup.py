@@ -0,0 +1,293 @@
+"""Maps medication and event codes to the integer keys used in the inventory.
+
+The inventory table can store its event and medication references as integer
+keys pointing to the id columns of the events and medications tables instead
+of repeating the codes as text. Integer keys keep the rows and indexes of the
+largest table in the database small and make grouping compare numbers instead
+of strings.
+
+The rest of the Narcotics Tracker continues to work with codes. The
+CodeLookup translates codes to ids before data is written or used as criteria
+and translates ids back to codes when rows are returned. The codes and ids are
+read once and cached for each data repository.
+
+Classes:
+    CodeLookup: Caches the mapping between codes and ids for a data
+        repository.
+"""
+
+import weakref
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
+    from narcotics_tracker.services.interfaces.persistence import PersistenceService
+
+
+class CodeLookup:
+    """Caches the mapping between codes and ids for a data repository.
+
+    Methods:
+        for_receiver: Returns the shared CodeLookup for a data repository.
+
+        uses_integer_keys: Returns True if the inventory stores integer keys.
+
+        to_id: Returns the id of the item with the given code.
+
+        to_code: Returns the code of the item with the given id.
+
+        translate_columns: Returns a dictionary with code columns replaced by
+            their integer key columns.
+
+        translate_criteria: Returns read criteria with code columns replaced
+            by their integer key columns.
+
+        translate_column_name: Returns the name of the key column which
+            replaces a code column.
+
+        return_code_column_name: Returns the name of the code column which
+            a key column replaces.
+
+        translate_serializer: Returns a serializer which saves codes into the
+            key columns.
+
+        translate_values: Returns serialized values with codes replaced by
+            their ids.
+
+        translate_row: Returns an inventory row with its keys replaced by
+            codes.
+
+        clear: Removes all cached information.
+    """
+
+    _lookups: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    code_columns = {
+        "event_code": ("event_id", "events"),
+        "medication_code": ("medication_id", "medications"),
+    }
+
+    def __init__(self, receiver: "PersistenceService") -> None:
+        """Initializes the CodeLookup for the passed data repository.
+
+        Args:
+            receiver (PersistenceService): Object which communicates with the
+                data repository.
+        """
+        self._receiver = receiver
+        self.clear()
+
+    @classmethod
+    def for_receiver(cls, receiver: "PersistenceService") -> "CodeLookup":
+        """Returns the shared CodeLookup for a data repository.
+
+        Receivers used by a CommandBatch share the lookup of the receiver
+        the batch runs against.
+
+        Args:
+            receiver (PersistenceService): Object which communicates with the
+                data repository.
+        """
+        receiver = getattr(receiver, "batched_receiver", receiver)
+        lookup = cls._lookups.get(receiver)
+
+        if lookup is None:
+            lookup = cls(receiver)
+            cls._lookups[receiver] = lookup
+
+        return lookup
+
+    def clear(self) -> None:
+        """Removes all cached information."""
+        self._integer_keys = None
+        self._key_positions = ()
+        self._ids = {}
+        self._codes = {}
+
+    def uses_integer_keys(self) -> bool:
+        """Returns True if the inventory stores integer keys."""
+        if self._integer_keys is None:
+            columns = self._receiver.return_columns("inventory")
+            self._integer_keys = "event_id" in columns
+            self._key_positions = tuple(
+                (columns.index(key_column), table)
+                for key_column, table in self.code_columns.values()
+                if key_column in columns
+            )
+
+        return self._integer_keys
+
+    def to_id(self, table_name: str, code: str) -> int:
+        """Returns the id of the item with the given code.
+
+        Args:
+            table_name (str): The table the item is stored in. Either 'events'
+                or 'medications'.
+
+            code (str): The unique code of the item.
+
+        Raises:
+            ValueError: The code does not exist in the table.
+        """
+        ids = self._return_ids(table_name)
+
+        if code not in ids:
+            ids = self._load(table_name)
+
+        if code not in ids:
+            raise ValueError(f"Code '{code}' not found in the {table_name} table.")
+
+        return ids[code]
+
+    def to_code(self, table_name: str, id_number: int) -> str:
+        """Returns the code of the item with the given id.
+
+        Args:
+            table_name (str): The table the item is stored in. Either 'events'
+                or 'medications'.
+
+            id_number (int): The id of the item.
+        """
+        codes = self._codes.get(table_name)
+
+        if codes is None or id_number not in codes:
+            self._load(table_name)
+            codes = self._codes[table_name]
+
+        return codes.get(id_number)
+
+    def translate_columns(self, data: dict[str, any]) -> dict[str, any]:
+        """Returns a dictionary with code columns replaced by their key columns.
+
+        Args:
+            data (dict[str, any]): A dictionary mapping inventory column names
+                to their values.
+        """
+        translated = {}
+
+        for column, value in data.items():
+            if column in self.code_columns:
+                key_column, table_name = self.code_columns[column]
+                translated[key_column] = self.to_id(table_name, value)
+            else:
+                translated[column] = value
+
+        return translated
+
+    def translate_criteria(self, criteria: dict[str, any]) -> dict[str, any]:
+        """Returns read criteria with code columns replaced by their key columns.
+
+        Codes which do not exist are replaced by None, which matches no rows,
+        so reads return nothing for them as they do when codes are stored.
+
+        Args:
+            criteria (dict[str, any]): A dictionary mapping inventory column
+                names to the values of the rows to be read.
+        """
+        translated = {}
+
+        for column, value in criteria.items():
+            if column in self.code_columns:
+                key_column, table_name = self.code_columns[column]
+                try:
+                    translated[key_column] = self.to_id(table_name, value)
+                except ValueError:
+                    translated[key_column] = None
+            else:
+                translated[column] = value
+
+        return translated
+
+    def translate_column_name(self, column: str) -> str:
+        """Returns the name of the key column which replaces a code column.
+
+        Args:
+            column (str): The name of an inventory column.
+        """
+        if column in self.code_columns:
+            return self.code_columns[column][0]
+
+        return column
+
+    def return_code_column_name(self, column: str) -> str:
+        """Returns the name of the code column which a key column replaces.
+
+        Args:
+            column (str): The name of an inventory column.
+        """
+        for code_column, (key_column, _) in self.code_columns.items():
+            if column == key_column:
+                return code_column
+
+        return column
+
+    def translate_serializer(
+        self, serializer: "DataItemSerializer"
+    ) -> "DataItemSerializer":
+        """Returns a serializer which saves codes into the key columns.
+
+        Args:
+            serializer (DataItemSerializer): The serializer of an Adjustment
+                class.
+        """
+        return serializer.with_column_names(
+            self.translate_column_name(column) for column in serializer.columns
+        )
+
+    def translate_values(self, columns: tuple[str], values: tuple) -> tuple:
+        """Returns serialized values with codes replaced by their ids.
+
+        Args:
+            columns (tuple[str]): The names of the serialized columns.
+
+            values (tuple): The serialized values.
+        """
+        values = list(values)
+
+        for position, column in enumerate(columns):
+            if column in self.code_columns:
+                table_name = self.code_columns[column][1]
+                values[position] = self.to_id(table_name, values[position])
+
+        return tuple(values)
+
+    def translate_row(self, row: tuple) -> tuple:
+        """Returns an inventory row with its keys replaced by codes.
+
+        Args:
+            row (tuple): A row returned from the inventory table.
+        """
+        row = list(row)
+
+        for position, table_name in self._key_positions:
+            row[position] = self.to_code(table_name, row[position])
+
+        return tuple(row)
+
+    def _return_ids(self, table_name: str) -> dict[str, int]:
+        """Returns the cached ids for a table, loading them if needed."""
+        ids = self._ids.get(table_name)
+
+        if ids is None:
+            ids = self._load(table_name)
+
+        return ids
+
+    def _load(self, table_name: str) -> dict[str, int]:
+        """Reads the codes and ids of a table into the cache."""
+        code_column = "event_code" if table_name == "events" else "medication_code"
+        cursor = self._receiver.read(table_name)
+        columns = [description[0] for description in cursor.description]
+        id_index = columns.index("id")
+        code_index = columns.index(code_column)
+
+        ids = {}
+        codes = {}
+        for row in cursor.fetchall():
+            ids[row[code_index]] = row[id_index]
+            codes[row[id_index]] = row[code_index]
+
+        self._ids[table_name] = ids
+        self._codes[table_name] = codes
+
+        return ids
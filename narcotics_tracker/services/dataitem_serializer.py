@@ -0,0 +1,126 @@
+"""Prepares DataItems to be saved in the database.
+
+Saving a DataItem requires an insert statement listing the item's columns and
+a tuple containing its values. The statement only depends on the class of the
+item and its table, so it is built once and reused for every item of that
+class. The values are read from the item's attributes without copying or
+modifying the item.
+
+Classes:
+    DataItemSerializer: Stores the insert statement for a DataItem class and
+        extracts the values of its items.
+"""
+from dataclasses import fields
+from operator import attrgetter
+from typing import TYPE_CHECKING, Iterable, Union
+
+if TYPE_CHECKING:
+    from narcotics_tracker.items.interfaces.dataitem_interface import (
+        CompactDataItem,
+        DataItem,
+    )
+
+
+class DataItemSerializer:
+    """Stores the insert statement for a DataItem class and extracts values.
+
+    Attributes:
+        table_name (str): The name of the table the items are saved in.
+
+        columns (tuple[str]): The names of the attributes saved as columns.
+
+        column_names (tuple[str]): The names of the columns in the table.
+            Usually the same as the attribute names.
+
+        insert_statement (str): The SQL statement which inserts one item.
+
+    Methods:
+        for_item: Returns the shared serializer for the class and table of an
+            item.
+
+        return_values: Returns the column values of an item as a tuple.
+
+        return_rows: Returns the column values of many items.
+
+        with_column_names: Returns a serializer which saves the same
+            attributes into differently named columns.
+    """
+
+    _serializers: dict[tuple[type, str], "DataItemSerializer"] = {}
+
+    def __init__(
+        self, item_class: type, table_name: str, column_names: tuple[str] = None
+    ) -> None:
+        """Builds the insert statement for the DataItem class.
+
+        Args:
+            item_class (type): The class of the DataItems.
+
+            table_name (str): The name of the table the items are saved in.
+
+            column_names (tuple[str], optional): The names of the columns in
+                the table, in the same order as the attributes. Defaults to
+                the attribute names.
+        """
+        self.item_class = item_class
+        self.table_name = table_name
+        self.columns = tuple(
+            field.name for field in fields(item_class) if field.name != "table"
+        )
+        self.column_names = tuple(column_names or self.columns)
+
+        placeholders = ", ".join("?" for _ in self.column_names)
+        self.insert_statement = (
+            f"INSERT INTO {table_name} ({', '.join(self.column_names)}) "
+            f"VALUES ({placeholders});"
+        )
+
+        self.return_values = attrgetter(*self.columns)
+        self._renamed = {}
+
+    @classmethod
+    def for_item(
+        cls, item: Union["DataItem", "CompactDataItem"]
+    ) -> "DataItemSerializer":
+        """Returns the shared serializer for the class and table of an item.
+
+        Args:
+            item (DataItem, CompactDataItem): The item to be saved.
+        """
+        key = (type(item), item.table)
+        serializer = cls._serializers.get(key)
+
+        if serializer is None:
+            serializer = cls(type(item), item.table)
+            cls._serializers[key] = serializer
+
+        return serializer
+
+    def return_rows(
+        self, items: Iterable[Union["DataItem", "CompactDataItem"]]
+    ) -> Iterable[tuple]:
+        """Returns the column values of many items.
+
+        Args:
+            items (Iterable[DataItem, CompactDataItem]): The items to be saved.
+                Must all be of the serializer's class.
+        """
+        return map(self.return_values, items)
+
+    def with_column_names(self, column_names: tuple[str]) -> "DataItemSerializer":
+        """Returns a serializer which saves the same attributes into other columns.
+
+        Args:
+            column_names (tuple[str]): The names of the columns in the table,
+                in the same order as the attributes.
+        """
+        column_names = tuple(column_names)
+        serializer = self._renamed.get(column_names)
+
+        if serializer is None:
+            serializer = DataItemSerializer(
+                self.item_class, self.table_name, column_names
+            )
+            self._renamed[column_names] = serializer
+
+        return serializer
@@ -23,6 +23,8 @@ class DateTimeManager(DateTimeService):
 
         convert_to_string: Returns a timestamp as a readable string.
 
+        return_year: Returns the year of a timestamp.
+
         validate: Corrects invalid dates and returns them as a unix timestamp.
     """
 
@@ -55,6 +57,10 @@ class DateTimeManager(DateTimeService):
 
         return dt_object.format("MM-DD-YYYY HH:mm:ss")
 
+    def return_year(self, timestamp: int) -> int:
+        """Returns the year of a timestamp, accounts for the timezone."""
+        return self._datetime_package.from_timestamp(timestamp, self._timezone).year
+
     def validate(self, date: Union[int, str]) -> int:
         """Corrects invalid dates and returns them as a unix timestamp."""
         if self._date_is_invalid(date):
@@ -0,0 +1,595 @@
+"""Stores the data of the Narcotics Tracker in Python dictionaries.
+
+The DictionaryManager implements the PersistenceService protocol without
+SQLite. Rows are kept in memory and selected with the same semantics as the
+SQLiteManager's statements:
+
+    - Criteria select rows whose columns equal all of the given values. A
+        criterion of None selects no rows, as '= NULL' does in SQL.
+
+    - Values are converted using the affinity of the column's declared type,
+        so an amount stored in a REAL column is returned as a float.
+
+    - Rows are returned in the order of their ids unless they are ordered by
+        a column. None sorts before numbers, which sort before text.
+
+    - INTEGER PRIMARY KEY columns are assigned the next id when no id is
+        given. The ids of deleted rows are not reused when the column is
+        declared with AUTOINCREMENT. PRIMARY KEY, UNIQUE and NOT NULL
+        constraints raise sqlite3.IntegrityError. Missing tables and columns
+        raise sqlite3.OperationalError.
+
+Managers created with the same filename share their tables. SQL statements
+cannot be executed, so the commands which run SQL scripts raise
+sqlite3.NotSupportedError when used with a DictionaryManager:
+
+    - CreateInventoryArchiveTable and MigrateInventoryKeys.
+
+    - RollupReportingPeriod and RestoreReportingPeriod.
+
+    - MovePeriodToPartition.
+
+    - EnableChangeLog and ApplyChangeLog.
+
+Classes:
+    DictionaryManager: Stores and retrieves data in Python dictionaries.
+"""
+
+import contextlib
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.items.interfaces.dataitem_interface import DataItem
+    from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
+
+
+class DictionaryManager:
+    """Stores and retrieves data in Python dictionaries.
+
+    Methods:
+        add: Adds a new row to a table.
+
+        insert: Adds a serialized DataItem to a table.
+
+        insert_many: Adds many serialized DataItems to a table.
+
+        read: Returns a cursor containing the selected rows.
+
+        read_items: Returns a list of DataItems built from the selected rows.
+
+        read_totals: Returns the total of a column for each group of rows.
+
+        update: Updates the selected rows.
+
+        remove: Removes the selected rows.
+
+        create_table: Adds a table.
+
+        return_columns: Returns the column names of a table.
+
+        transaction: Runs all changes within the context together.
+
+        delete_database: Removes all tables.
+
+        close: Does nothing. Provided for compatibility with the SQLiteManager.
+    """
+
+    _databases: dict[str, dict[str, "_Table"]] = {}
+    _lock = threading.RLock()
+
+    return_row_factory = staticmethod(SQLiteManager.return_row_factory)
+
+    def __init__(self, filename: str) -> None:
+        """Initializes the DictionaryManager and stores the database name.
+
+        Args:
+            filename (str): The name shared by managers using the same tables.
+        """
+        self.filename = filename
+        self._transaction_depth = 0
+
+    @property
+    def _tables(self) -> dict[str, "_Table"]:
+        """Returns the tables of the database, creating it if needed."""
+        return self._databases.setdefault(self.filename, {})
+
+    def add(self, table_name: str, data: dict[str]) -> None:
+        """Adds a new row to a table.
+
+        Args:
+            table_name (str): Name of the table receiving the new row.
+
+            data (dict[str]): A dictionary mapping column names to the values.
+        """
+        with self._lock:
+            self._return_table(table_name).insert(tuple(data), tuple(data.values()))
+
+    def insert(self, serializer: "DataItemSerializer", values: tuple) -> None:
+        """Adds a serialized DataItem to a table.
+
+        Args:
+            serializer (DataItemSerializer): The serializer of the DataItem's
+                class which contains the table and column names.
+
+            values (tuple): The column values of the DataItem.
+        """
+        with self._lock:
+            table = self._return_table(serializer.table_name)
+            table.insert(serializer.column_names, values)
+
+    def insert_many(
+        self, serializer: "DataItemSerializer", rows: Iterable[tuple]
+    ) -> int:
+        """Adds many serialized DataItems together.
+
+        No rows are added if any of them cannot be added.
+
+        Args:
+            serializer (DataItemSerializer): The serializer of the DataItems'
+                class which contains the table and column names.
+
+            rows (Iterable[tuple]): The column values of each DataItem.
+
+        Returns:
+            int: The number of rows added.
+        """
+        count = 0
+
+        with self.transaction():
+            table = self._return_table(serializer.table_name)
+            for values in rows:
+                table.insert(serializer.column_names, values)
+                count += 1
+
+        return count
+
+    def read(
+        self, table_name: str, criteria: dict[str] = {}, order_by: str = None
+    ) -> "_Cursor":
+        """Returns a cursor containing the selected rows.
+
+        Args:
+            table_name (str): The name of the table.
+
+            criteria (dict[str], optional): A dictionary mapping column names
+                to values used to select rows.
+
+            order_by (str, optional): The name of the column by which to order
+                the rows, optionally followed by 'ASC' or 'DESC'.
+        """
+        with self._lock:
+            table = self._return_table(table_name)
+            rows = table.select(criteria)
+
+            if order_by:
+                rows = table.order(rows, order_by)
+
+            return _Cursor(table.columns, [row for _, row in rows])
+
+    def read_totals(
+        self,
+        table_name: str,
+        group_by: tuple[str],
+        total_column: str,
+        criteria: dict[str] = {},
+    ) -> "_Cursor":
+        """Returns the total of a column for each group of rows.
+
+        Args:
+            table_name (str): The name of the table.
+
+            group_by (tuple[str]): The names of the columns whose values form
+                the groups.
+
+            total_column (str): The name of the column which is totalled.
+
+            criteria (dict[str], optional): A dictionary mapping column names
+                to values used to select the rows which are grouped.
+        """
+        with self._lock:
+            table = self._return_table(table_name)
+            group_positions = [table._return_position(column) for column in group_by]
+            total_position = table._return_position(total_column)
+
+            totals = {}
+            for _, row in table.select(criteria):
+                group = tuple(row[position] for position in group_positions)
+                value = row[total_position]
+                total = totals.get(group)
+                if total is not None and value is not None:
+                    value += total
+                totals[group] = total if value is None else value
+
+        rows = [
+            group + (totals[group],)
+            for group in sorted(totals, key=lambda group: tuple(map(_sort_key, group)))
+        ]
+        columns = tuple(group_by) + (f"SUM({total_column})",)
+
+        return _Cursor(columns, rows)
+
+    def read_items(
+        self,
+        table_name: str,
+        item_class: type,
+        criteria: dict[str] = {},
+        order_by: str = None,
+    ) -> list["DataItem"]:
+        """Returns a list of DataItems built from the selected rows.
+
+        Args:
+            table_name (str): The name of the table.
+
+            item_class (type): The DataItem class to be built from each row.
+
+            criteria (dict[str], optional): A dictionary mapping column names
+                to values used to select rows.
+
+            order_by (str, optional): The name of the column by which to order
+                the rows.
+        """
+        cursor = self.read(table_name, criteria, order_by)
+        columns = [description[0] for description in cursor.description]
+        cursor.row_factory = self.return_row_factory(item_class, table_name, columns)
+
+        return cursor.fetchall()
+
+    def update(self, table_name: str, data: dict[str], criteria: dict[str]) -> None:
+        """Updates the selected rows.
+
+        Args:
+            table_name (str): The name of the table.
+
+            data (dict[str]): A dictionary mapping column names to updated
+                values.
+
+            criteria (dict[str]): A dictionary mapping column names to values
+                used to select the rows to update.
+
+        Raises:
+            ValueError: No criteria were passed.
+        """
+        if not criteria:
+            raise ValueError("Criteria are required to update rows.")
+
+        with self.transaction():
+            table = self._return_table(table_name)
+            for row_id, row in table.select(criteria):
+                table.replace(row_id, row, data)
+
+    def remove(self, table_name: str, criteria: dict[str]) -> None:
+        """Removes the selected rows.
+
+        Args:
+            table_name (str): The name of the table.
+
+            criteria (dict[str]): A dictionary mapping column names to values
+                used to select the rows to remove.
+
+        Raises:
+            ValueError: No criteria were passed.
+        """
+        if not criteria:
+            raise ValueError("Criteria are required to remove rows.")
+
+        with self._lock:
+            table = self._return_table(table_name)
+            for row_id, _ in table.select(criteria):
+                table.delete(row_id)
+
+    def create_table(
+        self,
+        table_name: str,
+        column_info: dict[str],
+        foreign_key_info: list[str] = None,
+    ) -> None:
+        """Adds a table. Does nothing if the table already exists.
+
+        Foreign keys are not enforced, as in SQLite by default.
+
+        Args:
+            table_name (str): The name of the table.
+
+            column_info (dict[str]): A dictionary mapping column names to their
+                datatype and constraints.
+
+            foreign_key_info (list[str], optional): Accepted for compatibility
+                with the SQLiteManager.
+        """
+        with self._lock:
+            if table_name not in self._tables:
+                self._tables[table_name] = _Table(table_name, column_info)
+
+    def return_columns(self, table_name: str) -> list[str]:
+        """Returns the column names of a table.
+
+        Returns:
+            list[str]: The column names in the order they were defined. Empty
+                if the table does not exist.
+        """
+        table = self._tables.get(table_name)
+
+        return list(table.columns) if table else []
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["DictionaryManager"]:
+        """Runs all changes within the context together.
+
+        The tables are restored if the context raises an exception. Other
+        managers sharing the tables wait until the transaction ends.
+        """
+        with self._lock:
+            if self._transaction_depth:
+                self._transaction_depth += 1
+                try:
+                    yield self
+                finally:
+                    self._transaction_depth -= 1
+                return
+
+            snapshot = {name: table.copy() for name, table in self._tables.items()}
+            self._transaction_depth = 1
+            try:
+                yield self
+            except BaseException:
+                self._tables.clear()
+                self._tables.update(snapshot)
+                raise
+            finally:
+                self._transaction_depth = 0
+
+    def delete_database(self) -> None:
+        """Removes all tables."""
+        with self._lock:
+            self._databases.pop(self.filename, None)
+
+    def close(self) -> None:
+        """Does nothing. Provided for compatibility with the SQLiteManager."""
+
+    def _return_table(self, table_name: str) -> "_Table":
+        """Returns a table, raises sqlite3.OperationalError if it is missing."""
+        table = self._tables.get(table_name)
+
+        if table is None:
+            raise sqlite3.OperationalError(f"no such table: {table_name}")
+
+        return table
+
+
+class _Table:
+    """The rows of a table, mapped by their row ids."""
+
+    def __init__(self, name: str, column_info: dict[str]) -> None:
+        self.name = name
+        self.columns = tuple(column_info)
+        self.positions = {column: index for index, column in enumerate(self.columns)}
+        self.affinities = tuple(
+            _return_affinity(details) for details in column_info.values()
+        )
+        self.not_null = tuple(
+            index
+            for index, details in enumerate(column_info.values())
+            if "NOT NULL" in details.upper()
+        )
+        self.unique = tuple(
+            index
+            for index, details in enumerate(column_info.values())
+            if "UNIQUE" in details.upper() or "PRIMARY KEY" in details.upper()
+        )
+        self.row_id = next(
+            (
+                index
+                for index, details in enumerate(column_info.values())
+                if "INTEGER PRIMARY KEY" in details.upper()
+            ),
+            None,
+        )
+        self.autoincrement = self.row_id is not None and (
+            "AUTOINCREMENT" in tuple(column_info.values())[self.row_id].upper()
+        )
+        self.rows = {}
+        self._next_id = 1
+
+    def copy(self) -> "_Table":
+        """Returns a copy of the table which does not share its rows."""
+        table = _Table.__new__(_Table)
+        table.__dict__.update(self.__dict__)
+        table.rows = dict(self.rows)
+
+        return table
+
+    def insert(self, columns: tuple[str], values: tuple) -> None:
+        """Adds a row, converting the values using the column affinities."""
+        row = [None] * len(self.columns)
+        for column, value in zip(columns, values):
+            index = self._return_position(column)
+            row[index] = _apply_affinity(self.affinities[index], value)
+
+        if self.row_id is None:
+            row_id = self._next_id
+        elif row[self.row_id] is None:
+            row_id = row[self.row_id] = self._next_id
+        else:
+            row_id = row[self.row_id]
+
+        row = tuple(row)
+        self._check_constraints(row, row_id)
+        self.rows[row_id] = row
+        self._next_id = max(self._next_id, row_id + 1)
+
+    def replace(self, row_id: int, row: tuple, data: dict[str]) -> None:
+        """Changes the values of a row."""
+        row = list(row)
+        for column, value in data.items():
+            index = self._return_position(column)
+            row[index] = _apply_affinity(self.affinities[index], value)
+
+        row = tuple(row)
+        new_id = row_id if self.row_id is None else row[self.row_id]
+        self._check_constraints(row, new_id, ignored_id=row_id)
+
+        del self.rows[row_id]
+        self.rows[new_id] = row
+        self._next_id = max(self._next_id, new_id + 1)
+
+    def delete(self, row_id: int) -> None:
+        """Removes a row. Its id is reused if it was the largest, as in SQLite."""
+        del self.rows[row_id]
+
+        if not self.autoincrement and row_id == self._next_id - 1:
+            self._next_id = max(self.rows, default=0) + 1
+
+    def select(self, criteria: dict[str]) -> list[tuple[int, tuple]]:
+        """Returns the ids and rows matching all criteria in id order."""
+        conditions = []
+        for column, value in criteria.items():
+            index = self._return_position(column)
+            conditions.append((index, _apply_affinity(self.affinities[index], value)))
+
+        if any(value is None for _, value in conditions):
+            return []
+
+        return [
+            (row_id, row)
+            for row_id, row in sorted(self.rows.items())
+            if all(row[index] == value for index, value in conditions)
+        ]
+
+    def order(self, rows: list[tuple[int, tuple]], order_by: str) -> list[tuple]:
+        """Returns the rows sorted by a column."""
+        column, _, direction = order_by.strip().partition(" ")
+        index = self._return_position(column)
+        descending = direction.strip().upper() == "DESC"
+
+        return sorted(
+            rows, key=lambda item: _sort_key(item[1][index]), reverse=descending
+        )
+
+    def _return_position(self, column: str) -> int:
+        """Returns the position of a column, raises if it does not exist."""
+        try:
+            return self.positions[column]
+        except KeyError:
+            raise sqlite3.OperationalError(f"no such column: {column}") from None
+
+    def _check_constraints(self, row: tuple, row_id: int, ignored_id: int = None):
+        """Raises sqlite3.IntegrityError if the row breaks a constraint."""
+        for index in self.not_null:
+            if row[index] is None:
+                raise sqlite3.IntegrityError(
+                    f"NOT NULL constraint failed: {self.name}.{self.columns[index]}"
+                )
+
+        if row_id != ignored_id and row_id in self.rows:
+            column = self.columns[self.row_id] if self.row_id is not None else "rowid"
+            raise sqlite3.IntegrityError(
+                f"UNIQUE constraint failed: {self.name}.{column}"
+            )
+
+        for index in self.unique:
+            if index == self.row_id or row[index] is None:
+                continue
+            for other_id, other in self.rows.items():
+                if other_id != ignored_id and other[index] == row[index]:
+                    raise sqlite3.IntegrityError(
+                        f"UNIQUE constraint failed: {self.name}.{self.columns[index]}"
+                    )
+
+
+class _Cursor:
+    """Returns selected rows like an sqlite3.Cursor."""
+
+    def __init__(self, columns: tuple[str], rows: list[tuple]) -> None:
+        self.description = tuple((column,) + (None,) * 6 for column in columns)
+        self.rowcount = -1
+        self.row_factory = None
+        self._rows = iter(rows)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.fetchall())
+
+    def fetchone(self) -> any:
+        """Returns the next row, or None when no rows remain."""
+        rows = self.fetchmany(1)
+
+        return rows[0] if rows else None
+
+    def fetchmany(self, size: int = 1) -> list:
+        """Returns up to the given number of the remaining rows."""
+        rows = []
+        for row in self._rows:
+            rows.append(row)
+            if len(rows) == size:
+                break
+
+        return self._build(rows)
+
+    def fetchall(self) -> list:
+        """Returns the remaining rows."""
+        return self._build(list(self._rows))
+
+    def _build(self, rows: list[tuple]) -> list:
+        """Passes the rows to the row factory if one is assigned."""
+        if self.row_factory is None:
+            return rows
+
+        return [self.row_factory(self, row) for row in rows]
+
+
+def _return_affinity(details: str) -> str:
+    """Returns the affinity of a column's declared type, as SQLite does."""
+    declared_type = details.upper().split(" ")[0] if details.strip() else ""
+
+    if "INT" in declared_type:
+        return "INTEGER"
+    if any(name in declared_type for name in ("CHAR", "CLOB", "TEXT")):
+        return "TEXT"
+    if "BLOB" in declared_type or not declared_type:
+        return "BLOB"
+    if any(name in declared_type for name in ("REAL", "FLOA", "DOUB")):
+        return "REAL"
+    return "NUMERIC"
+
+
+def _apply_affinity(affinity: str, value: any) -> any:
+    """Converts a value using a column's affinity."""
+    if value is None or isinstance(value, bytes):
+        return value
+    if isinstance(value, bool):
+        value = int(value)
+
+    if affinity == "TEXT":
+        return value if isinstance(value, str) else str(value)
+
+    if affinity == "BLOB":
+        return value
+
+    if isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            return value
+        value = int(number) if number.is_integer() and "." not in value else number
+
+    if affinity == "REAL":
+        return float(value)
+
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+
+    return value
+
+
+def _sort_key(value: any) -> tuple:
+    """Sorts None before numbers before text before bytes, as SQLite does."""
+    if value is None:
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    if isinstance(value, str):
+        return (2, value)
+    return (3, value)
@@ -25,6 +25,8 @@ class DateTimeService(Protocol):
 
         convert_to_string: Converts a timestamp to the formatted string.
 
+        return_year: Returns the year of a timestamp.
+
         validate: Checks a date and converts it as necessary.
     """
 
@@ -37,5 +39,8 @@ class DateTimeService(Protocol):
     def convert_to_string() -> str:
         ...
 
+    def return_year() -> int:
+        ...
+
     def validate() -> int:
         ...
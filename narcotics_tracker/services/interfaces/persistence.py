@@ -2,9 +2,17 @@
 
 Classes:
     PersistenceService: Protocol for communicating with a data repository.
+
+    SQLScriptService: Protocol for data repositories which execute SQL
+        statements.
+
+Functions:
+    require_sql_scripts: Raises sqlite3.NotSupportedError if a receiver
+        cannot execute SQL statements.
     """
 
-from typing import Protocol
+import sqlite3
+from typing import Protocol, runtime_checkable
 
 
 class PersistenceService(Protocol):
@@ -16,16 +24,29 @@ class PersistenceService(Protocol):
     Methods:
         add: Adds new data to the repository.
 
+        insert: Adds a serialized DataItem to the repository.
+
+        insert_many: Adds many serialized DataItems to the repository.
+
         remove: Deletes data from the repository.
 
         read: Returns data from the repository.
 
         update: Updates data in the repository.
+
+        transaction: Returns a context in which all changes are saved
+            together.
     """
 
     def add():
         ...
 
+    def insert():
+        ...
+
+    def insert_many():
+        ...
+
     def remove():
         ...
 
@@ -34,3 +55,36 @@ class PersistenceService(Protocol):
 
     def update():
         ...
+
+    def transaction():
+        ...
+
+
+@runtime_checkable
+class SQLScriptService(PersistenceService, Protocol):
+    """Protocol for data repositories which execute SQL statements.
+
+    Commands which rebuild tables or move rows between them, such as
+    MigrateInventoryKeys, require it.
+
+    Methods:
+        execute_script: Executes multiple statements in a single transaction.
+    """
+
+    def execute_script():
+        ...
+
+
+def require_sql_scripts(receiver: PersistenceService, command_name: str) -> None:
+    """Raises sqlite3.NotSupportedError if a receiver cannot execute SQL.
+
+    Args:
+        receiver (PersistenceService): The receiver of the command.
+
+        command_name (str): The name of the command, used in the message.
+    """
+    if not isinstance(receiver, SQLScriptService):
+        raise sqlite3.NotSupportedError(
+            f"{command_name} executes SQL statements, which the "
+            f"{type(receiver).__name__} does not support."
+        )
@@ -28,6 +28,9 @@ class ServiceProvider(Protocol):
         persistence: Returns an instance of the object which communicates with
             the data repository.
 
+        report_persistence: Returns an instance of the object which reports
+            use to read from the data repository.
+
         datetime:
             Returns an instance of the object which handles datetimes.
 
@@ -38,6 +41,9 @@ class ServiceProvider(Protocol):
     def persistence() -> "PersistenceService":
         ...
 
+    def report_persistence() -> "PersistenceService":
+        ...
+
     def datetime() -> "DateTimeService":
         ...
 
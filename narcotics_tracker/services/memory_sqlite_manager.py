@@ -0,0 +1,62 @@
+"""Manages communication with an in-memory SQLite3 database.
+
+Tests and benchmarks which use the SQLiteManager create and delete database
+files in the data directory. The MemorySQLiteManager keeps the database in
+memory instead. Managers created with the same filename share one database
+through SQLite's shared cache, so the ServiceManager can create a new manager
+for each command just as it does for database files.
+
+The database exists until delete_database is called on one of its managers.
+
+Classes:
+    MemorySQLiteManager: Sends and receives information from an in-memory
+        SQLite database.
+"""
+
+import sqlite3
+import threading
+
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+
+class MemorySQLiteManager(SQLiteManager):
+    """Sends and receives information from an in-memory SQLite database.
+
+    This class inherits methods and attributes from the SQLiteManager.
+    Review the documentation for more information.
+
+    Methods:
+        delete_database: Removes the in-memory database.
+    """
+
+    _keepers: dict[str, sqlite3.Connection] = {}
+    _keepers_lock = threading.Lock()
+
+    def delete_database(self) -> None:
+        """Removes the in-memory database."""
+        with self._keepers_lock:
+            keeper = self._keepers.pop(self.filename, None)
+
+        self.connection.close()
+        if keeper is not None:
+            keeper.close()
+
+    def _return_uri(self) -> str:
+        """Returns the URI of the shared in-memory database."""
+        return f"file:{self.filename}?mode=memory&cache=shared"
+
+    def _connect(self) -> None:
+        """Connects to the shared in-memory database.
+
+        The first connection to a database is kept open so that the database
+        remains when the managers using it are closed.
+        """
+        with self._keepers_lock:
+            if self.filename not in self._keepers:
+                self._keepers[self.filename] = sqlite3.connect(
+                    self._return_uri(), uri=True, check_same_thread=False
+                )
+
+        self.connection = sqlite3.connect(
+            self._return_uri(), uri=True, cached_statements=self.cached_statements
+        )
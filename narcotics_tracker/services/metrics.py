@@ -0,0 +1,310 @@
+"""Records how often commands and reports run and how much work they do.
+
+The Command and Report interfaces instrument the execute and run methods of
+every class which implements them. While the MetricsRegistry is enabled each
+call is counted and timed, and the SQL statements it sends to the database
+are counted along with the number of rows they changed. Statements sent by a
+command which runs inside another command or report are counted for both.
+A command which issues many more queries than it returns rows usually has an
+N+1 problem.
+
+The metrics can be written to a file as JSON or in the Prometheus text
+format.
+
+Classes:
+    CallMetrics: Stores the metrics for a single command or report class.
+
+    MetricsRegistry: Collects the metrics of commands and reports.
+
+Variables:
+    metrics_registry: The MetricsRegistry shared by the Narcotics Tracker.
+"""
+
+import bisect
+import functools
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass
+class CallMetrics:
+    """Stores the metrics for a single command or report class.
+
+    Attributes:
+        calls (int): The number of times the class was executed.
+
+        errors (int): The number of calls which raised an exception.
+
+        total_seconds (float): The total time spent in the calls.
+
+        queries (int): The number of SQL statements sent during the calls.
+
+        rows_changed (int): The number of rows added, updated or removed.
+
+        rows_returned (int): The number of items returned by the calls.
+
+        latency_buckets (list[int]): The number of calls which took at most
+            the matching number of seconds in LATENCY_BUCKETS. The last entry
+            counts the slower calls.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    queries: int = 0
+    rows_changed: int = 0
+    rows_returned: int = 0
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+
+class _ActiveCall:
+    """Counts the statements sent during a single call."""
+
+    __slots__ = ("queries", "rows_changed")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.rows_changed = 0
+
+
+class MetricsRegistry:
+    """Collects the metrics of commands and reports.
+
+    Attributes:
+        enabled (bool): Whether calls are recorded.
+
+    Methods:
+        instrument: Wraps a method of a class so that its calls are recorded.
+
+        record_query: Counts a statement sent by the active calls.
+
+        return_metrics: Returns the metrics of each class.
+
+        reset: Removes all recorded metrics.
+
+        to_json: Returns the metrics as a JSON string.
+
+        to_prometheus: Returns the metrics in the Prometheus text format.
+
+        dump: Writes the metrics to a file.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initializes the registry.
+
+        Args:
+            enabled (bool, optional): Whether calls are recorded. Defaults to
+                False.
+        """
+        self.enabled = enabled
+        self._metrics: dict[str, CallMetrics] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def instrument(self, cls: type, method_name: str) -> None:
+        """Wraps a method of a class so that its calls are recorded.
+
+        Does nothing if the class does not define the method itself.
+
+        Args:
+            cls (type): The command or report class.
+
+            method_name (str): The name of the method to be wrapped.
+        """
+        method = cls.__dict__.get(method_name)
+
+        if method is None or getattr(method, "__wrapped__", None):
+            return
+
+        cls_name = cls.__name__
+        registry = self
+
+        @functools.wraps(method)
+        def recorded_method(*args, **kwargs):
+            if not registry.enabled:
+                return method(*args, **kwargs)
+
+            return registry._record_call(cls_name, method, args, kwargs)
+
+        setattr(cls, method_name, recorded_method)
+
+    def record_query(self, rows_changed: int = 0) -> None:
+        """Counts a statement sent by the active calls.
+
+        Args:
+            rows_changed (int, optional): The number of rows the statement
+                added, updated or removed. Defaults to 0.
+        """
+        stack = getattr(self._local, "stack", None)
+
+        if not stack:
+            return
+
+        for active_call in stack:
+            active_call.queries += 1
+            if rows_changed > 0:
+                active_call.rows_changed += rows_changed
+
+    def return_metrics(self) -> dict[str, CallMetrics]:
+        """Returns a copy of the metrics of each class."""
+        with self._lock:
+            return {
+                name: CallMetrics(**asdict(metrics))
+                for name, metrics in self._metrics.items()
+            }
+
+    def reset(self) -> None:
+        """Removes all recorded metrics."""
+        with self._lock:
+            self._metrics = {}
+
+    def to_json(self) -> str:
+        """Returns the metrics as a JSON string."""
+        data = {
+            "latency_buckets": list(LATENCY_BUCKETS),
+            "metrics": {
+                name: asdict(metrics)
+                for name, metrics in sorted(self.return_metrics().items())
+            },
+        }
+
+        return json.dumps(data, indent=4)
+
+    def to_prometheus(self) -> str:
+        """Returns the metrics in the Prometheus text format."""
+        lines = []
+        metrics = sorted(self.return_metrics().items())
+
+        counters = (
+            ("calls", "Number of calls."),
+            ("errors", "Number of calls which raised an exception."),
+            ("queries", "Number of SQL statements sent."),
+            ("rows_changed", "Number of rows added, updated or removed."),
+            ("rows_returned", "Number of items returned."),
+        )
+        for attribute, description in counters:
+            metric_name = f"narcotics_tracker_command_{attribute}_total"
+            lines.append(f"# HELP {metric_name} {description}")
+            lines.append(f"# TYPE {metric_name} counter")
+            for name, call_metrics in metrics:
+                value = getattr(call_metrics, attribute)
+                lines.append(f'{metric_name}{{command="{name}"}} {value}')
+
+        metric_name = "narcotics_tracker_command_duration_seconds"
+        lines.append(f"# HELP {metric_name} Time spent in each call.")
+        lines.append(f"# TYPE {metric_name} histogram")
+        for name, call_metrics in metrics:
+            cumulative = 0
+            bounds = [str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+            for bound, count in zip(bounds, call_metrics.latency_buckets):
+                cumulative += count
+                lines.append(
+                    f'{metric_name}_bucket{{command="{name}",le="{bound}"}} '
+                    f"{cumulative}"
+                )
+            lines.append(
+                f'{metric_name}_sum{{command="{name}"}} {call_metrics.total_seconds}'
+            )
+            lines.append(
+                f'{metric_name}_count{{command="{name}"}} {call_metrics.calls}'
+            )
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self, filename: str, format: str = "json") -> None:
+        """Writes the metrics to a file.
+
+        Args:
+            filename (str): The path of the file.
+
+            format (str, optional): Either 'json' or 'prometheus'. Defaults to
+                'json'.
+
+        Raises:
+            ValueError: The format is not supported.
+        """
+        if format == "json":
+            contents = self.to_json()
+        elif format == "prometheus":
+            contents = self.to_prometheus()
+        else:
+            raise ValueError(f"Metrics format '{format}' is not supported.")
+
+        with open(filename, "w") as metrics_file:
+            metrics_file.write(contents)
+
+    def _record_call(
+        self, cls_name: str, method: Callable, args: tuple, kwargs: dict
+    ) -> any:
+        """Calls the method and records its metrics."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        active_call = _ActiveCall()
+        stack.append(active_call)
+        failed = False
+        result = None
+        start = time.perf_counter()
+
+        try:
+            result = method(*args, **kwargs)
+            return result
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            self._store(cls_name, active_call, duration, failed, result)
+
+    def _store(
+        self,
+        cls_name: str,
+        active_call: _ActiveCall,
+        duration: float,
+        failed: bool,
+        result: any,
+    ) -> None:
+        """Adds the results of a call to the metrics of its class."""
+        rows_returned = 0
+        if isinstance(result, (list, tuple, dict)):
+            rows_returned = len(result)
+
+        with self._lock:
+            metrics = self._metrics.get(cls_name)
+            if metrics is None:
+                metrics = self._metrics[cls_name] = CallMetrics()
+
+            metrics.calls += 1
+            metrics.errors += failed
+            metrics.total_seconds += duration
+            metrics.queries += active_call.queries
+            metrics.rows_changed += active_call.rows_changed
+            metrics.rows_returned += rows_returned
+            metrics.latency_buckets[bisect.bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,221 @@
+"""Manages communication with a database split into yearly partitions.
+
+Every adjustment saved to the inventory stays in the database file, which
+makes backups, VACUUM and full scans of the inventory slower each year. The
+adjustments of closed reporting periods can be moved into a partition file
+for the year the period started, named after the database file, for example
+'inventory_2022.db' for 'inventory.db'. The database file then only holds the
+adjustments of recent periods.
+
+The PartitionedSQLiteManager attaches the partition files of its database
+when it connects. Reads of the 'inventory' table are sent to a view which
+combines the inventory of the database and of every partition, so commands
+and reports return the same results as before the adjustments were moved.
+A single partition can be targeted instead by passing its year, in which
+case only that partition is attached. All other tables and all writes use
+the database file as usual.
+
+SQLite attaches at most ten databases to a connection unless it was compiled
+with a higher limit, and one of them is kept free for the partition being
+written by MovePeriodToPartition. A database with more partitions than can
+be attached raises ValueError instead of returning part of its inventory.
+Target the partitions one at a time to read them.
+
+Classes:
+    PartitionedSQLiteManager: Sends and receives information from a database
+        and its partitions.
+
+Functions:
+    return_partition_filename: Returns the filename of a partition.
+
+    return_schema_name: Returns the name a partition is attached as.
+"""
+
+import os
+import re
+import sqlite3
+
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+
+def return_partition_filename(filename: str, year: int) -> str:
+    """Returns the filename of a partition.
+
+    Args:
+        filename (str): The filename of the database in the data directory.
+
+        year (int): The year of the partition.
+    """
+    name, extension = os.path.splitext(filename)
+
+    return f"{name}_{year}{extension}"
+
+
+def return_schema_name(year: int) -> str:
+    """Returns the name a partition is attached as.
+
+    Args:
+        year (int): The year of the partition.
+    """
+    return f"partition_{year}"
+
+
+class PartitionedSQLiteManager(SQLiteManager):
+    """Sends and receives information from a database and its partitions.
+
+    This class inherits methods and attributes from the SQLiteManager.
+    Review the documentation for more information.
+
+    Attributes:
+        partition (int): The year of the partition whose inventory is read.
+            The inventory of the database and all partitions is read when
+            None.
+
+        union_view (str): The name of the temporary view which combines the
+            inventory of the database and its partitions.
+
+    Methods:
+        return_partitions: Returns the years of the partition files.
+    """
+
+    union_view: str = "inventory_all"
+
+    def __init__(self, filename: str, partition: int = None, **kwargs) -> None:
+        """Initializes the manager and attaches the partitions of the database.
+
+        Args:
+            filename (str): The filename of the database file.
+
+            partition (int, optional): The year of the partition whose
+                inventory is read. Defaults to reading the inventory of the
+                database and all partitions.
+
+            **kwargs: Passed to the SQLiteManager.
+
+        Raises:
+            ValueError: No partition file exists for the year, or the
+                database has more partitions than can be attached.
+        """
+        self.partition = partition
+        super().__init__(filename, **kwargs)
+
+    def read(self, table_name: str, criteria: dict[str] = {}, order_by: str = None):
+        """Returns a cursor containing data from the database.
+
+        Reads of the 'inventory' table return the inventory of the targeted
+        partition, or of the database and all partitions.
+        """
+        if table_name == "inventory":
+            table_name = self._return_inventory_source()
+
+        return super().read(table_name, criteria, order_by)
+
+    def read_totals(
+        self,
+        table_name: str,
+        group_by: tuple[str],
+        total_column: str,
+        criteria: dict[str] = {},
+    ):
+        """Returns the total of a column for each group of rows.
+
+        Totals of the 'inventory' table include the targeted partition, or
+        the database and all partitions.
+        """
+        if table_name == "inventory":
+            table_name = self._return_inventory_source()
+
+        return super().read_totals(table_name, group_by, total_column, criteria)
+
+    def attach(self, filename: str, schema_name: str) -> None:
+        """Attaches another database file and adds it to the union view."""
+        super().attach(filename, schema_name)
+        self._create_union_view()
+
+    def detach(self, schema_name: str) -> None:
+        """Detaches a database and removes it from the union view."""
+        super().detach(schema_name)
+        self._create_union_view()
+
+    def return_partitions(self) -> list[int]:
+        """Returns the years of the partition files in sorted order.
+
+        Partition files are returned whether or not they are attached.
+        """
+        directory, basename = os.path.split(os.path.join("data", self.filename))
+        name, extension = os.path.splitext(basename)
+        pattern = re.compile(rf"{re.escape(name)}_(\d{{4}}){re.escape(extension)}")
+
+        years = []
+        for entry in os.listdir(directory or "."):
+            match = pattern.fullmatch(entry)
+            if match:
+                years.append(int(match.group(1)))
+
+        return sorted(years)
+
+    def _return_inventory_source(self) -> str:
+        """Returns the table or view which holds the inventory being read."""
+        if self.partition is None:
+            return self.union_view
+
+        return f"{return_schema_name(self.partition)}.inventory"
+
+    def _create_union_view(self) -> None:
+        """Creates the view combining the inventory of every database."""
+        column_names = ", ".join(self.return_columns("inventory"))
+        if not column_names:
+            return
+
+        schema_names = ["main"] + [
+            schema_name
+            for schema_name in self.return_attached()
+            if self._has_inventory(schema_name)
+        ]
+        selects = " UNION ALL ".join(
+            f"SELECT {column_names} FROM {schema_name}.inventory"
+            for schema_name in schema_names
+        )
+
+        self.execute_script(
+            [
+                f"DROP VIEW IF EXISTS temp.{self.union_view};",
+                f"CREATE TEMP VIEW {self.union_view} AS {selects};",
+            ]
+        )
+
+    def _has_inventory(self, schema_name: str) -> bool:
+        """Returns True if the attached database contains an inventory."""
+        cursor = self._execute(
+            f"SELECT 1 FROM {schema_name}.sqlite_master "
+            "WHERE type = 'table' AND name = 'inventory';"
+        )
+
+        return cursor.fetchone() is not None
+
+    def _connect(self) -> None:
+        """Connects to the database file and attaches its partitions."""
+        super()._connect()
+
+        years = self.return_partitions()
+        if self.partition is not None:
+            if self.partition not in years:
+                self.connection.close()
+                raise ValueError(f"No partition exists for {self.partition}.")
+            years = [self.partition]
+
+        available = self.connection.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED) - 1
+        if len(years) > available:
+            self.connection.close()
+            raise ValueError(
+                f"{self.filename} has {len(years)} partitions but only "
+                f"{available} can be attached. Pass the year of a partition "
+                "to read it."
+            )
+
+        for year in years:
+            super().attach(
+                return_partition_filename(self.filename, year), return_schema_name(year)
+            )
+
+        self._create_union_view()
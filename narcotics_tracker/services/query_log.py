@@ -0,0 +1,178 @@
+"""Times SQL statements and logs the slow ones.
+
+The QueryLog is used by the SQLiteManager to find out which statements take
+too long. When a QueryLog is assigned to the SQLiteManager every statement it
+executes is timed, including bulk inserts and each statement of a script. A
+bulk insert is recorded once with the parameters of its first row.
+Statements which take longer than the threshold are written to a rotating log
+file along with the shape of their parameters, their duration and the query
+plan SQLite used to run them.
+
+Classes:
+    QueryLog: Times SQL statements and logs the slow ones.
+"""
+
+import logging
+import sqlite3
+from logging.handlers import RotatingFileHandler
+
+
+class QueryLog:
+    """Times SQL statements and logs the slow ones.
+
+    Attributes:
+        threshold (float): The number of seconds after which a statement is
+            considered slow.
+
+        filename (str): The path of the log file.
+
+        explain (bool): Whether the query plan of slow statements is logged.
+
+        statement_count (int): The number of statements recorded.
+
+        slow_count (int): The number of slow statements recorded.
+
+        total_time (float): The total number of seconds spent executing the
+            recorded statements.
+
+    Methods:
+        record: Records the duration of a statement and logs it if slow.
+
+        describe_parameters: Returns a description of the parameters of a
+            statement without their values.
+
+        return_query_plan: Returns the query plan for a statement.
+
+        close: Closes the log file.
+    """
+
+    _explainable = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        filename: str = "data/slow_queries.log",
+        max_bytes: int = 1_000_000,
+        backup_count: int = 3,
+        explain: bool = True,
+    ) -> None:
+        """Initializes the QueryLog and opens the log file.
+
+        Args:
+            threshold (float, optional): The number of seconds after which a
+                statement is considered slow. Defaults to 0.1.
+
+            filename (str, optional): The path of the log file. Defaults to
+                'data/slow_queries.log'.
+
+            max_bytes (int, optional): The size at which the log file is
+                rotated. Defaults to 1,000,000.
+
+            backup_count (int, optional): The number of rotated log files
+                which are kept. Defaults to 3.
+
+            explain (bool, optional): Whether the query plan of slow
+                statements is logged. Defaults to True.
+        """
+        self.threshold = threshold
+        self.filename = filename
+        self.explain = explain
+        self.statement_count = 0
+        self.slow_count = 0
+        self.total_time = 0.0
+
+        self._handler = RotatingFileHandler(
+            filename, maxBytes=max_bytes, backupCount=backup_count
+        )
+        self._handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        self._logger = logging.getLogger(f"{__name__}.{id(self)}")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.WARNING)
+        self._logger.addHandler(self._handler)
+
+    def record(
+        self,
+        connection: sqlite3.Connection,
+        sql_statement: str,
+        values: tuple,
+        duration: float,
+    ) -> None:
+        """Records the duration of a statement and logs it if slow.
+
+        Args:
+            connection (sqlite3.Connection): The connection which executed the
+                statement. Used to look up the query plan.
+
+            sql_statement (str): The SQL statement which was executed.
+
+            values (tuple): The parameters of the statement.
+
+            duration (float): The number of seconds the statement took.
+        """
+        self.statement_count += 1
+        self.total_time += duration
+
+        if duration < self.threshold:
+            return
+
+        self.slow_count += 1
+        message = (
+            f"Slow query ({duration * 1000:.1f} ms): {sql_statement} "
+            f"Parameters: {self.describe_parameters(values)}."
+        )
+
+        if self.explain:
+            query_plan = self.return_query_plan(connection, sql_statement, values)
+            if query_plan:
+                message += " Query plan: " + "; ".join(query_plan) + "."
+
+        self._logger.warning(message)
+
+    @staticmethod
+    def describe_parameters(values: tuple) -> str:
+        """Returns a description of the parameters of a statement.
+
+        Only the number and types of the parameters are described so that
+        the log does not contain the stored data.
+
+        Args:
+            values (tuple): The parameters of the statement.
+        """
+        if not values:
+            return "none"
+
+        types = ", ".join(type(value).__name__ for value in values)
+
+        return f"{len(values)} ({types})"
+
+    def return_query_plan(
+        self, connection: sqlite3.Connection, sql_statement: str, values: tuple
+    ) -> list[str]:
+        """Returns the query plan for a statement.
+
+        Statements which cannot be explained, such as table definitions,
+        return an empty list.
+
+        Args:
+            connection (sqlite3.Connection): The connection to the database.
+
+            sql_statement (str): The SQL statement to be explained.
+
+            values (tuple): The parameters of the statement.
+        """
+        if not sql_statement.lstrip().upper().startswith(self._explainable):
+            return []
+
+        try:
+            cursor = connection.execute(
+                f"EXPLAIN QUERY PLAN {sql_statement}", values or []
+            )
+        except sqlite3.Error:
+            return []
+
+        return [row[-1] for row in cursor.fetchall()]
+
+    def close(self) -> None:
+        """Closes the log file."""
+        self._logger.removeHandler(self._handler)
+        self._handler.close()
@@ -0,0 +1,91 @@
+"""Manages read-only communication with the SQLite3 database.
+
+Reports only read from the database. The ReadOnlySQLiteManager opens the
+database file in read-only mode and sets the connection to query only, so a
+report can never take a write lock or change the inventory by mistake. When
+the database uses write-ahead logging, reports using it run in parallel with
+writers. Its page cache is larger than the SQLiteManager's because reports
+read many rows.
+
+The manager can also be pointed at a snapshot copy of the database. A
+snapshot which is never changed can be opened as immutable, which skips
+locking altogether.
+
+Classes:
+    ReadOnlySQLiteManager: Reads information from the SQLite database.
+"""
+
+import pathlib
+import sqlite3
+
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+
+class ReadOnlySQLiteManager(SQLiteManager):
+    """Reads information from the SQLite database.
+
+    This class inherits methods and attributes from the SQLiteManager.
+    Review the documentation for more information. Methods which change the
+    database raise sqlite3.OperationalError.
+
+    Attributes:
+        cache_size (int): The size of the page cache in kibibytes.
+
+        immutable (bool): Whether the database file is treated as a snapshot
+            which never changes.
+    """
+
+    cache_size: int = 65_536
+    immutable: bool = False
+
+    def __init__(
+        self,
+        filename: str,
+        cache_size: int = None,
+        immutable: bool = None,
+        **kwargs,
+    ) -> None:
+        """Initializes the ReadOnlySQLiteManager and stores the filename.
+
+        The database file must exist.
+
+        Args:
+            filename (str): The filename of the database file or snapshot in
+                the data directory.
+
+            cache_size (int, optional): The size of the page cache in
+                kibibytes. Defaults to the cache_size class attribute.
+
+            immutable (bool, optional): Whether the database file is treated
+                as a snapshot which never changes. Defaults to the immutable
+                class attribute.
+
+            **kwargs: Passed to the SQLiteManager.
+        """
+        if cache_size is not None:
+            self.cache_size = cache_size
+        if immutable is not None:
+            self.immutable = immutable
+
+        super().__init__(filename, **kwargs)
+
+    def delete_database(self) -> None:
+        """Raises sqlite3.OperationalError, the database is read-only."""
+        raise sqlite3.OperationalError("Cannot delete a read-only database.")
+
+    def _return_uri(self) -> str:
+        """Returns the URI which opens the database file read-only."""
+        uri = pathlib.Path("data", self.filename).absolute().as_uri() + "?mode=ro"
+
+        if self.immutable:
+            uri += "&immutable=1"
+
+        return uri
+
+    def _connect(self) -> None:
+        """Connects to the database file in read-only, query only mode."""
+        self.connection = sqlite3.connect(
+            self._return_uri(), uri=True, cached_statements=self.cached_statements
+        )
+        self.connection.execute("PRAGMA query_only = ON;")
+        self.connection.execute(f"PRAGMA cache_size = -{int(self.cache_size)};")
@@ -1,8 +1,33 @@
+"""Provides access to the services used by the Narcotics Tracker.
+
+The persistence service defaults to the SQLiteManager. It can be replaced for
+all ServiceManagers by setting the NARCOTICS_TRACKER_PERSISTENCE environment
+variable to one of the names in PERSISTENCE_SERVICES before the Narcotics
+Tracker is imported. The in-memory services let tests and benchmarks run
+without writing database files. The partitioned service also reads the
+adjustments which were moved into yearly partition files.
+
+Reports use the report persistence service. When the persistence service is
+the SQLiteManager, reports read through a ReadOnlySQLiteManager. Other
+persistence services are used by reports as they are.
+
+Classes:
+    ServiceManager: Provides access to the services used by the Narcotics
+        Tracker.
+"""
+
+import os
 from typing import TYPE_CHECKING
 
 from narcotics_tracker.services.conversion_manager import ConversionManager
 from narcotics_tracker.services.datetime_manager import DateTimeManager
+from narcotics_tracker.services.dictionary_manager import DictionaryManager
 from narcotics_tracker.services.interfaces.service_provider import ServiceProvider
+from narcotics_tracker.services.memory_sqlite_manager import MemorySQLiteManager
+from narcotics_tracker.services.partitioned_sqlite_manager import (
+    PartitionedSQLiteManager,
+)
+from narcotics_tracker.services.read_only_sqlite_manager import ReadOnlySQLiteManager
 from narcotics_tracker.services.sqlite_manager import SQLiteManager
 
 if TYPE_CHECKING:
@@ -10,6 +35,15 @@ if TYPE_CHECKING:
     from narcotics_tracker.services.interfaces.datetime import DateTimeService
     from narcotics_tracker.services.interfaces.persistence import PersistenceService
 
+PERSISTENCE_SERVICES = {
+    "sqlite": SQLiteManager,
+    "memory": MemorySQLiteManager,
+    "dictionary": DictionaryManager,
+    "partitioned": PartitionedSQLiteManager,
+}
+
+REPORT_PERSISTENCE_SERVICES = {SQLiteManager: ReadOnlySQLiteManager}
+
 
 class ServiceManager(ServiceProvider):
     """Provides access to the services used by the Narcotics Tracker.
@@ -18,6 +52,9 @@ class ServiceManager(ServiceProvider):
         persistence: Assigns and returns an instance of the persistence
             service.
 
+        report_persistence: Assigns and returns an instance of the
+            persistence service used by reports.
+
         database: Assigns and returns the filename of the database file if
             used.
 
@@ -26,7 +63,10 @@ class ServiceManager(ServiceProvider):
         conversion: Returns an instance of the conversion service.
     """
 
-    _persistence: "PersistenceService" = SQLiteManager
+    _persistence: "PersistenceService" = PERSISTENCE_SERVICES[
+        os.environ.get("NARCOTICS_TRACKER_PERSISTENCE", "sqlite")
+    ]
+    _report_persistence: "PersistenceService" = None
     _database: str = "inventory.db"
     _datetime: "DateTimeService" = DateTimeManager
     _conversion: "ConversionService" = ConversionManager
@@ -40,6 +80,19 @@ class ServiceManager(ServiceProvider):
     def persistence(self, value: "PersistenceService"):
         self._persistence = value
 
+    @property
+    def report_persistence(self) -> "PersistenceService":
+        """Returns an instance of the persistence service used by reports."""
+        report_persistence = self._report_persistence or (
+            REPORT_PERSISTENCE_SERVICES.get(self._persistence, self._persistence)
+        )
+
+        return report_persistence(self._database)
+
+    @report_persistence.setter
+    def report_persistence(self, value: "PersistenceService"):
+        self._report_persistence = value
+
     @property
     def database(self) -> str:
         """Assigns and returns the filename of the database file if used."""
@@ -4,14 +4,33 @@ All information about controlled substance medications and their activities
 are stored within an SQLite3 database. This module contains the objects 
 responsible for communicating with the database.
 
+SQL statements are built from the table name and the column names being used.
+Each statement is built once and cached so that every call with the same table 
+and columns sends sqlite3 the exact same string, which allows sqlite3 to reuse 
+its compiled version of the statement.
+
 Classes:
     SQLiteManager: Sends and receives information from the SQlite database.
 """
 
+import contextlib
+import itertools
 import os
 import sqlite3
+import threading
+import time
+from dataclasses import fields
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Callable, ContextManager, Iterable, Iterator
 
 from narcotics_tracker.services.interfaces.persistence import PersistenceService
+from narcotics_tracker.services.metrics import metrics_registry
+
+if TYPE_CHECKING:
+    from narcotics_tracker.items.interfaces.dataitem_interface import DataItem
+    from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
+    from narcotics_tracker.services.query_log import QueryLog
 
 
 class SQLiteManager(PersistenceService):
@@ -22,33 +41,112 @@ class SQLiteManager(PersistenceService):
 
         filename (str): The name of the database file.
 
+        cached_statements (int): The number of compiled statements sqlite3
+            keeps for each connection.
+
+        query_log (QueryLog): Times each statement and logs the slow ones.
+            Statements are not timed when set to None.
+
     Methods:
         add: Adds a new row to the database.
 
+        insert: Adds a serialized DataItem to the database.
+
+        insert_many: Adds many serialized DataItems in a single transaction.
+
         read: Returns a cursor containing data from the database.
 
+        read_items: Returns a list of DataItems built from the database.
+
+        read_totals: Returns the total of a column for each group of rows.
+
+        return_row_factory: Returns a row factory which builds DataItems.
+
         update: Updates a row in the database.
 
         remove: Removes a row from the database.
 
         create_table: Adds a table to the database.
 
+        return_columns: Returns the column names of a table.
+
+        return_table_names: Returns the names of the tables in the database.
+
+        count_rows: Returns the number of rows in a table.
+
+        execute_script: Executes multiple statements in a single transaction.
+
+        transaction: Runs all statements within the context in a single 
+            transaction.
+
         delete_database: Deletes the database file.
+
+        backup: Copies the database to another file while it remains in use.
+
+        attach: Attaches another database file to the connection.
+
+        detach: Detaches a database from the connection.
+
+        return_attached: Returns the schema names of the attached databases.
+
+        return_data_version: Returns a value which changes whenever the
+            database is changed.
+
+        close: Closes the database connection.
+
+        statement_cache_info: Returns the hits and misses of the statement
+            cache.
+
+        clear_statement_cache: Removes all cached statements.
     """
 
-    def __init__(self, filename: str) -> None:
+    cached_statements: int = 128
+    query_log: "QueryLog" = None
+
+    _write_counts: dict[str, int] = {}
+    _write_counts_lock = threading.Lock()
+
+    def __init__(
+        self,
+        filename: str,
+        cached_statements: int = None,
+        query_log: "QueryLog" = None,
+    ) -> None:
         """Initialize the SQLiteManager and stores the database filename.
 
         If the database files doe not exist, it will be created.
 
         Args:
             filename (str): The filename of the database file.
+
+            cached_statements (int, optional): The number of compiled
+                statements sqlite3 keeps for the connection. Defaults to the
+                cached_statements class attribute.
+
+            query_log (QueryLog, optional): Times each statement and logs the
+                slow ones. Defaults to the query_log class attribute.
         """
-        self.connection = sqlite3.connect("data/" + filename)
+        if cached_statements is not None:
+            self.cached_statements = cached_statements
+
+        if query_log is not None:
+            self.query_log = query_log
+
         self.filename = filename
+        self._transaction_depth = 0
+        self._connect()
 
     def __del__(self) -> None:
         """Closes the database connection upon exiting the context manager."""
+        try:
+            self.connection.close()
+        except sqlite3.ProgrammingError:  # Connection belongs to another thread.
+            pass
+        except AttributeError:  # The connection could not be opened.
+            pass
+
+    def close(self) -> None:
+        """Closes the database connection."""
         self.connection.close()
 
     def add(self, table_name: str, data: dict[str]):
@@ -59,16 +157,49 @@ class SQLiteManager(PersistenceService):
 
             data (dict[str]): A dictionary mapping column names to the values.
         """
-        placeholders = ", ".join("?" for key in data.keys())
-        column_names = ", ".join(data.keys())
+        sql_statement = self._return_statement("INSERT", table_name, tuple(data))
 
-        sql_statement = (
-            f"""INSERT INTO {table_name} ({column_names}) VALUES ({placeholders});"""
-        )
+        self._execute(sql_statement, tuple(data.values()))
+        self._record_write()
+
+    def insert(self, serializer: "DataItemSerializer", values: tuple) -> None:
+        """Adds a serialized DataItem to the database.
+
+        Args:
+            serializer (DataItemSerializer): The serializer of the DataItem's
+                class which contains the insert statement.
+
+            values (tuple): The column values of the DataItem.
+        """
+        self._execute(serializer.insert_statement, values)
+        self._record_write()
+
+    def insert_many(
+        self, serializer: "DataItemSerializer", rows: Iterable[tuple]
+    ) -> int:
+        """Adds many serialized DataItems in a single transaction.
+
+        Args:
+            serializer (DataItemSerializer): The serializer of the DataItems'
+                class which contains the insert statement.
+
+            rows (Iterable[tuple]): The column values of each DataItem.
+
+        Returns:
+            int: The number of rows added.
+        """
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is not None:
+            rows = itertools.chain((first_row,), rows)
 
-        column_values = tuple(data.values())
+        start = time.perf_counter()
+        with self._commit_scope():
+            cursor = self.connection.executemany(serializer.insert_statement, rows)
+        self._record_write()
+        self._record_statement(serializer.insert_statement, first_row, start, cursor)
 
-        self._execute(sql_statement, column_values)
+        return cursor.rowcount
 
     def read(
         self, table_name: str, criteria: dict[str] = {}, order_by: str = None
@@ -87,17 +218,114 @@ class SQLiteManager(PersistenceService):
         Returns:
             sqlite3.Cursor: A cursor contains the returned data.
         """
-        sql_query = f"""SELECT * FROM {table_name}"""
+        criteria_columns, criteria_values = self._sort_criteria(criteria)
 
-        if criteria:
-            placeholders = [f"{column} = ?" for column in criteria.keys()]
-            criteria_columns = " AND ".join(placeholders)
-            sql_query += f" WHERE {criteria_columns}"
+        sql_query = self._return_statement(
+            "SELECT", table_name, (), criteria_columns, order_by
+        )
 
-        if order_by:
-            sql_query += f" ORDER BY {order_by}"
+        return self._execute(sql_query, criteria_values)
 
-        return self._execute(sql_query, tuple(criteria.values()))
+    def read_totals(
+        self,
+        table_name: str,
+        group_by: tuple[str],
+        total_column: str,
+        criteria: dict[str] = {},
+    ) -> sqlite3.Cursor:
+        """Returns the total of a column for each group of rows.
+
+        Args:
+            table_name (str): The name of the table.
+
+            group_by (tuple[str]): The names of the columns whose values form
+                the groups.
+
+            total_column (str): The name of the column which is totalled.
+
+            criteria (dict[str], optional): A dictionary mapping column names
+                to values used to select the rows which are grouped.
+
+        Returns:
+            sqlite3.Cursor: A cursor containing the values of the group
+                columns followed by the total of each group, ordered by the
+                group columns.
+        """
+        criteria_columns, criteria_values = self._sort_criteria(criteria)
+
+        sql_query = self._return_statement(
+            "TOTAL", table_name, tuple(group_by) + (total_column,), criteria_columns
+        )
+
+        return self._execute(sql_query, criteria_values)
+
+    def read_items(
+        self,
+        table_name: str,
+        item_class: type,
+        criteria: dict[str] = {},
+        order_by: str = None,
+    ) -> list["DataItem"]:
+        """Returns a list of DataItems built from the database.
+
+        Args:
+            table_name (str): The name of the table.
+
+            item_class (type): The DataItem class to be built from each row.
+
+            criteria (dict[str], optional): A dictionary mapping column names
+                to values used to select rows from which to pull the data.
+
+            order_by (str, optional): The name of the column by which to order
+                the data.
+
+        Returns:
+            list[DataItem]: The DataItems built from the selected rows.
+        """
+        cursor = self.read(table_name, criteria, order_by)
+        columns = [description[0] for description in cursor.description]
+        cursor.row_factory = self.return_row_factory(item_class, table_name, columns)
+
+        return cursor.fetchall()
+
+    @staticmethod
+    def return_row_factory(
+        item_class: type, table_name: str, columns: list[str]
+    ) -> Callable[[sqlite3.Cursor, tuple], "DataItem"]:
+        """Returns a row factory which builds DataItems.
+
+        Rows are matched to the attributes of the DataItem by column name.
+        Columns which do not match an attribute are ignored. The factory can
+        be assigned to the row_factory attribute of a cursor or called
+        directly.
+
+        Args:
+            item_class (type): The DataItem class to be built from each row.
+
+            table_name (str): The name of the table the rows were read from.
+                Assigned to the table attribute of DataItems which store it.
+
+            columns (list[str]): The column names of the values in each row.
+        """
+        attributes = [field.name for field in fields(item_class)]
+        stores_table = "table" in attributes
+        if stores_table:
+            attributes.remove("table")
+
+        positions = [columns.index(attribute) for attribute in attributes]
+        return_values = itemgetter(*positions)
+
+        if stores_table:
+
+            def row_factory(cursor: sqlite3.Cursor, row: tuple) -> "DataItem":
+                return item_class(table_name, *return_values(row))
+
+        else:
+
+            def row_factory(cursor: sqlite3.Cursor, row: tuple) -> "DataItem":
+                return item_class(*return_values(row))
+
+        return row_factory
 
     def update(self, table_name: str, data: dict[str], criteria: dict[str]) -> None:
         """Updates a row in the database.
@@ -110,22 +338,21 @@ class SQLiteManager(PersistenceService):
 
             criteria (dict[str]): A dictionary mapping column names to values
                 used to select which row to update.
-        """
-        sql_statement = f"""UPDATE {table_name} SET """
-
-        data_placeholders = ", ".join([f"{column} = ?" for column in data.keys()])
-        criteria_placeholders = [f"{column} = ?" for column in criteria.keys()]
-        criteria_columns = " AND ".join(criteria_placeholders)
 
-        sql_statement += f"{data_placeholders} WHERE {criteria_columns};"
+        Raises:
+            ValueError: No criteria were passed.
+        """
+        if not criteria:
+            raise ValueError("Criteria are required to update rows.")
 
-        values = [item for item in data.values()]
-        for item in criteria.values():
-            values.append(item)
+        criteria_columns, criteria_values = self._sort_criteria(criteria)
 
-        values = tuple(values)
+        sql_statement = self._return_statement(
+            "UPDATE", table_name, tuple(data), criteria_columns
+        )
 
-        self._execute(sql_statement, values)
+        self._execute(sql_statement, tuple(data.values()) + criteria_values)
+        self._record_write()
 
     def remove(self, table_name: str, criteria: dict[str]):
         """Removes a row from the database.
@@ -135,15 +362,21 @@ class SQLiteManager(PersistenceService):
 
             criteria (dict[str]): A dictionary mapping column names to values
                 used to select rows for deletion.
+
+        Raises:
+            ValueError: No criteria were passed.
         """
-        placeholders = [f"{column} = ?" for column in criteria.keys()]
-        criteria_columns = " AND ".join(placeholders)
+        if not criteria:
+            raise ValueError("Criteria are required to remove rows.")
 
-        sql_statement = f"""DELETE FROM {table_name} WHERE {criteria_columns};"""
+        criteria_columns, criteria_values = self._sort_criteria(criteria)
 
-        criteria_values = tuple(criteria.values())
+        sql_statement = self._return_statement(
+            "DELETE", table_name, (), criteria_columns
+        )
 
         self._execute(sql_statement, criteria_values)
+        self._record_write()
 
     def create_table(
         self,
@@ -177,26 +410,334 @@ class SQLiteManager(PersistenceService):
         )
 
         self._execute(sql_statement)
+        self._record_write()
+
+    def return_columns(self, table_name: str) -> list[str]:
+        """Returns the column names of a table.
+
+        Args:
+            table_name (str): The name of the table.
+
+        Returns:
+            list[str]: The column names in the order they were defined. Empty
+                if the table does not exist.
+        """
+        cursor = self._execute(f"""PRAGMA table_info({table_name});""")
+
+        return [column[1] for column in cursor.fetchall()]
+
+    def return_table_names(self) -> list[str]:
+        """Returns the names of the tables in the database in sorted order."""
+        cursor = self._execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name;"
+        )
+
+        return [row[0] for row in cursor.fetchall()]
+
+    def count_rows(self, table_name: str) -> int:
+        """Returns the number of rows in a table.
+
+        Args:
+            table_name (str): The name of the table.
+        """
+        cursor = self._execute(f"SELECT COUNT(*) FROM {table_name};")
+
+        return cursor.fetchone()[0]
+
+    def execute_script(self, sql_statements: list[str]) -> None:
+        """Executes multiple statements in a single transaction.
+
+        The changes are rolled back if any of the statements fail. Within an
+        open transaction the statements become part of that transaction.
+
+        Args:
+            sql_statements (list[str]): The SQL statements to be executed.
+        """
+        with self._commit_scope():
+            cursor = self.connection.cursor()
+            if not self._transaction_depth:
+                cursor.execute("BEGIN")
+            for sql_statement in sql_statements:
+                start = time.perf_counter()
+                cursor.execute(sql_statement)
+                self._record_statement(sql_statement, None, start, cursor)
+
+        self._record_write()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["SQLiteManager"]:
+        """Runs all statements within the context in a single transaction.
+
+        Statements are committed together when the context exits and are
+        rolled back if an exception is raised. Nested transactions become
+        part of the outermost transaction.
+
+        Yields:
+            SQLiteManager: This SQLiteManager.
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        self._transaction_depth = 1
+        try:
+            with self.connection:
+                self._begin()
+                yield self
+        finally:
+            self._transaction_depth = 0
+
+    def _begin(self) -> None:
+        """Starts a transaction on the connection."""
+        self.connection.execute("BEGIN")
+
+    def _commit_scope(self) -> ContextManager:
+        """Returns the context which commits a statement.
+
+        Statements are committed individually unless a transaction is open.
+        """
+        if self._transaction_depth:
+            return contextlib.nullcontext()
+
+        return self.connection
 
     def _execute(self, sql_statement: str, values: tuple[str] = None) -> sqlite3.Cursor:
         """Executes the sql statement, returns a cursor with any results.
 
+        When a QueryLog is assigned the statement is timed and passed to it.
+        The time taken to fetch rows from the returned cursor is not included.
+        The statement is counted by the metrics registry when it is enabled.
+
         Args:
             sql_statement (str): The SQL statement to be executed.
             values (tuple[str], optional): Any value required to execute the
                 sql statement.
         """
-        with self.connection:
+        start = time.perf_counter()
+        with self._commit_scope():
             cursor = self.connection.cursor()
             cursor.execute(sql_statement, values or [])
+        self._record_statement(sql_statement, values, start, cursor)
+
+        return cursor
+
+    def _record_statement(
+        self,
+        sql_statement: str,
+        values: tuple,
+        start: float,
+        cursor: sqlite3.Cursor,
+    ) -> None:
+        """Passes an executed statement to the QueryLog and metrics registry.
+
+        Args:
+            sql_statement (str): The SQL statement which was executed.
+
+            values (tuple): The parameters of the statement. For statements
+                executed with many rows, the parameters of the first row.
+
+            start (float): The value of time.perf_counter() when the
+                statement started.
+
+            cursor (sqlite3.Cursor): The cursor which executed the statement.
+        """
+        if self.query_log is not None:
+            duration = time.perf_counter() - start
+            self.query_log.record(self.connection, sql_statement, values, duration)
 
-            return cursor
+        if metrics_registry.enabled:
+            metrics_registry.record_query(cursor.rowcount)
 
     def delete_database(self) -> None:
         """Deletes the database file."""
         os.remove(f"data/{self.filename}")
         self.connection.close()
 
+    def backup(
+        self,
+        target_filename: str,
+        pages: int = 1024,
+        sleep: float = 0.05,
+        progress: Callable[[int, int, int], None] = None,
+    ) -> None:
+        """Copies the database to another file while it remains in use.
+
+        The pages are copied in steps. The database is only locked while a
+        step is copied, so other connections can write between the steps.
+
+        Args:
+            target_filename (str): The filename of the copy in the data
+                directory. Missing directories are created.
+
+            pages (int, optional): The number of pages copied in each step.
+                Defaults to 1024.
+
+            sleep (float, optional): The number of seconds waited between the
+                steps. Defaults to 0.05.
+
+            progress (Callable, optional): Called after each step with the
+                status, the number of pages remaining and the total number of
+                pages.
+        """
+        target_path = os.path.join("data", target_filename)
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+
+        def pause_between_steps(status: int, remaining: int, total: int) -> None:
+            if remaining > 0 and sleep > 0:
+                time.sleep(sleep)
+
+            if progress:
+                progress(status, remaining, total)
+
+        target = sqlite3.connect(target_path)
+        try:
+            self.connection.backup(
+                target, pages=pages, progress=pause_between_steps, sleep=sleep
+            )
+        finally:
+            target.close()
+
+    def attach(self, filename: str, schema_name: str) -> None:
+        """Attaches another database file to the connection.
+
+        Its tables are read and written as '{schema_name}.{table_name}'. The
+        database file is created if it does not exist.
+
+        Args:
+            filename (str): The filename of the database file in the data
+                directory.
+
+            schema_name (str): The name the attached database is known by.
+        """
+        self._execute(f"ATTACH DATABASE ? AS {schema_name};", ("data/" + filename,))
+
+    def detach(self, schema_name: str) -> None:
+        """Detaches a database from the connection.
+
+        Args:
+            schema_name (str): The name the attached database is known by.
+        """
+        self._execute(f"DETACH DATABASE {schema_name};")
+
+    def return_attached(self) -> list[str]:
+        """Returns the schema names of the attached databases."""
+        cursor = self._execute("PRAGMA database_list;")
+
+        return [row[1] for row in cursor.fetchall() if row[1] not in ("main", "temp")]
+
+    def return_data_version(self) -> tuple[int, int]:
+        """Returns a value which changes whenever the database is changed.
+
+        SQLite's data version changes when another connection commits a
+        change to the database, but not when this connection changes it. The
+        number of writes made through the managers of this process covers
+        those changes.
+
+        Returns:
+            tuple[int, int]: The data version of the connection and the number
+                of writes made to the database file by this process.
+        """
+        data_version = self._execute("PRAGMA data_version;").fetchone()[0]
+
+        return data_version, self._write_counts.get(self.filename, 0)
+
+    def _record_write(self) -> None:
+        """Counts a write made to the database file."""
+        with self._write_counts_lock:
+            count = self._write_counts.get(self.filename, 0)
+            self._write_counts[self.filename] = count + 1
+
+    @classmethod
+    def statement_cache_info(cls) -> tuple:
+        """Returns the hits and misses of the statement cache.
+
+        Returns:
+            tuple: A named tuple containing the hits, misses, maxsize and
+                currsize of the cache.
+        """
+        return cls._return_statement.cache_info()
+
+    @classmethod
+    def clear_statement_cache(cls) -> None:
+        """Removes all cached statements and resets the counters."""
+        cls._return_statement.cache_clear()
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _return_statement(
+        operation: str,
+        table_name: str,
+        columns: tuple[str] = (),
+        criteria_columns: tuple[str] = (),
+        order_by: str = None,
+    ) -> str:
+        """Builds and caches the SQL statement for an operation.
+
+        Args:
+            operation (str): One of 'INSERT', 'SELECT', 'UPDATE', 'DELETE' or
+                'TOTAL'.
+
+            table_name (str): The name of the table.
+
+            columns (tuple[str], optional): The columns receiving values. For
+                'TOTAL' the columns grouped by followed by the totalled column.
+
+            criteria_columns (tuple[str], optional): The columns used to
+                select rows.
+
+            order_by (str, optional): The name of the column by which to order
+                the data.
+        """
+        where_clause = ""
+        if criteria_columns:
+            conditions = " AND ".join(f"{column} = ?" for column in criteria_columns)
+            where_clause = f" WHERE {conditions}"
+
+        if operation == "INSERT":
+            placeholders = ", ".join("?" for _ in columns)
+            column_names = ", ".join(columns)
+            return f"INSERT INTO {table_name} ({column_names}) VALUES ({placeholders});"
+
+        if operation == "SELECT":
+            sql_query = f"SELECT * FROM {table_name}{where_clause}"
+            if order_by:
+                sql_query += f" ORDER BY {order_by}"
+            return sql_query
+
+        if operation == "UPDATE":
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            return f"UPDATE {table_name} SET {assignments}{where_clause};"
+
+        if operation == "DELETE":
+            return f"DELETE FROM {table_name}{where_clause};"
+
+        if operation == "TOTAL":
+            group_columns = ", ".join(columns[:-1])
+            return (
+                f"SELECT {group_columns}, SUM({columns[-1]}) FROM {table_name}"
+                f"{where_clause} GROUP BY {group_columns} ORDER BY {group_columns}"
+            )
+
+        raise ValueError(f"Unknown SQL operation '{operation}'.")
+
+    @staticmethod
+    def _sort_criteria(criteria: dict[str]) -> tuple[tuple[str], tuple]:
+        """Returns the criteria columns in a fixed order with their values.
+
+        Criteria listed in a different order select the same rows, sorting
+        them lets them share a single cached statement.
+        """
+        columns = tuple(sorted(criteria))
+
+        return columns, tuple(criteria[column] for column in columns)
+
     def _connect(self) -> None:
         """Connects to the database file."""
-        self.connection = sqlite3.connect("data/" + self.filename)
+        self.connection = sqlite3.connect(
+            "data/" + self.filename, cached_statements=self.cached_statements
+        )
@@ -0,0 +1,219 @@
+"""Manages communication with the SQLite3 database from many threads.
+
+The SQLiteManager holds a single connection which may only be used by the
+thread which created it. The ThreadedSQLiteManager opens a separate
+connection for each thread which uses it, so commands and reports can be run
+from a thread pool while another thread writes to the database.
+
+Each connection waits for locks held by other connections for up to the busy
+timeout. Statements which still fail because the database is busy are
+retried a limited number of times, waiting longer before each attempt. By
+default the database uses write-ahead logging so that reports can read while
+adjustments are being written.
+
+Classes:
+    ThreadedSQLiteManager: Sends and receives information from the SQLite
+        database using a connection for each thread.
+"""
+
+import random
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
+
+
+class ThreadedSQLiteManager(SQLiteManager):
+    """Sends and receives information from the SQLite database.
+
+    Uses a connection for each thread. This class inherits methods and
+    attributes from the SQLiteManager. Review the documentation for more
+    information.
+
+    Statements within a transaction are not retried because the transaction
+    has to be started again. Transactions acquire the write lock when they
+    begin instead, which is retried.
+
+    Attributes:
+        busy_timeout (float): The number of seconds a connection waits for a
+            lock held by another connection.
+
+        max_retries (int): The number of times a statement is retried when
+            the database is busy.
+
+        retry_delay (float): The number of seconds waited before the first
+            retry. The delay doubles for each following retry.
+
+        write_ahead_log (bool): Whether the database uses write-ahead logging.
+
+    Methods:
+        close: Closes the connections of all threads.
+    """
+
+    busy_timeout: float = 5.0
+    max_retries: int = 5
+    retry_delay: float = 0.05
+    write_ahead_log: bool = True
+
+    def __init__(
+        self,
+        filename: str,
+        busy_timeout: float = None,
+        max_retries: int = None,
+        retry_delay: float = None,
+        write_ahead_log: bool = None,
+        **kwargs,
+    ) -> None:
+        """Initializes the ThreadedSQLiteManager and stores the filename.
+
+        Args:
+            filename (str): The filename of the database file.
+
+            busy_timeout (float, optional): The number of seconds a connection
+                waits for a lock. Defaults to the busy_timeout class
+                attribute.
+
+            max_retries (int, optional): The number of times a statement is
+                retried when the database is busy. Defaults to the
+                max_retries class attribute.
+
+            retry_delay (float, optional): The number of seconds waited before
+                the first retry. Defaults to the retry_delay class attribute.
+
+            write_ahead_log (bool, optional): Whether the database uses
+                write-ahead logging. Defaults to the write_ahead_log class
+                attribute.
+
+            **kwargs: Passed to the SQLiteManager.
+        """
+        if busy_timeout is not None:
+            self.busy_timeout = busy_timeout
+        if max_retries is not None:
+            self.max_retries = max_retries
+        if retry_delay is not None:
+            self.retry_delay = retry_delay
+        if write_ahead_log is not None:
+            self.write_ahead_log = write_ahead_log
+
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        super().__init__(filename, **kwargs)
+
+    def __del__(self) -> None:
+        """Closes the connections of all threads."""
+        try:
+            self.close()
+        except sqlite3.Error:
+            pass
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Returns the connection of the current thread, opening it if needed."""
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None:
+            connection = self._open_connection()
+            self._local.connection = connection
+
+        return connection
+
+    @connection.setter
+    def connection(self, value: sqlite3.Connection) -> None:
+        self._local.connection = value
+
+    @property
+    def _transaction_depth(self) -> int:
+        """Returns the transaction depth of the current thread."""
+        return getattr(self._local, "transaction_depth", 0)
+
+    @_transaction_depth.setter
+    def _transaction_depth(self, value: int) -> None:
+        self._local.transaction_depth = value
+
+    def close(self) -> None:
+        """Closes the connections of all threads."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+
+        for connection in connections:
+            connection.close()
+
+        self._local = threading.local()
+
+    def insert_many(
+        self, serializer: "DataItemSerializer", rows: Iterable[tuple]
+    ) -> int:
+        """Adds many serialized DataItems, retrying while the database is busy."""
+        if self._transaction_depth:
+            return super().insert_many(serializer, rows)
+
+        rows = list(rows)
+        return self._retry(super().insert_many, serializer, rows)
+
+    def execute_script(self, sql_statements: list[str]) -> None:
+        """Executes multiple statements, retrying while the database is busy."""
+        if self._transaction_depth:
+            return super().execute_script(sql_statements)
+
+        return self._retry(super().execute_script, sql_statements)
+
+    def _execute(self, sql_statement: str, values: tuple[str] = None) -> sqlite3.Cursor:
+        """Executes the sql statement, retrying while the database is busy."""
+        if self._transaction_depth:
+            return super()._execute(sql_statement, values)
+
+        return self._retry(super()._execute, sql_statement, values)
+
+    def _begin(self) -> None:
+        """Starts a transaction holding the write lock."""
+        self._retry(self.connection.execute, "BEGIN IMMEDIATE")
+
+    def _retry(self, operation: Callable, *args) -> any:
+        """Runs the operation, retrying with backoff while the database is busy."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return operation(*args)
+            except sqlite3.OperationalError as error:
+                if attempt == self.max_retries or not self._is_busy(error):
+                    raise
+
+            delay = self.retry_delay * 2**attempt
+            time.sleep(delay + random.uniform(0, delay))
+
+    @staticmethod
+    def _is_busy(error: sqlite3.OperationalError) -> bool:
+        """Returns True if the error was caused by a lock on the database."""
+        error_code = getattr(error, "sqlite_errorcode", None)
+
+        if error_code is not None:
+            return error_code & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+
+        return "locked" in str(error) or "busy" in str(error)
+
+    def _connect(self) -> None:
+        """Connects the current thread to the database file."""
+        self._local.connection = self._open_connection()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Opens a connection for the current thread."""
+        connection = sqlite3.connect(
+            "data/" + self.filename,
+            timeout=self.busy_timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,
+        )
+
+        if self.write_ahead_log:
+            connection.execute("PRAGMA journal_mode = WAL;")
+
+        with self._connections_lock:
+            self._connections.append(connection)
+
+        return connection
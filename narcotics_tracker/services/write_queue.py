@@ -0,0 +1,253 @@
+"""Funnels changes from many threads through a single writer.
+
+SQLite allows one writer at a time. When several stations add adjustments at
+once, each committing its own statements, they compete for the lock on the
+database file and fail with 'database is locked'. The WriteQueue accepts
+commands from any number of threads and runs them on a single writer thread
+which owns its own connection. Waiting commands are committed together in
+one transaction (group commit) when enough rows are waiting or the oldest
+command has waited long enough.
+
+Each submitted command returns a Future which receives the command's result,
+or its exception, once the command has been committed. Commands whose futures
+are cancelled before the writer thread takes them are not run.
+
+Classes:
+    WriteQueue: Runs commands from many threads on a single writer thread.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import TYPE_CHECKING, Callable
+
+from narcotics_tracker import commands
+from narcotics_tracker.services.service_manager import ServiceManager
+
+if TYPE_CHECKING:
+    from narcotics_tracker.commands.interfaces.command import Command
+    from narcotics_tracker.items.adjustments import Adjustment
+    from narcotics_tracker.services.interfaces.persistence import PersistenceService
+
+
+class WriteQueue:
+    """Runs commands from many threads on a single writer thread.
+
+    Commands in a group are committed together. If the group fails, its
+    commands are run again one at a time so that only the futures of the
+    failing commands receive an exception.
+
+    Attributes:
+        max_rows (int): The number of waiting commands which causes a commit.
+
+        max_delay (float): The number of seconds the oldest waiting command
+            waits before a commit.
+
+    Methods:
+        submit: Queues a command with its arguments, returns a Future.
+
+        add_adjustment: Queues an AddAdjustment command, returns a Future.
+
+        update_adjustment: Queues an UpdateAdjustment command, returns a
+            Future.
+
+        flush: Waits until all submitted commands are committed.
+
+        close: Commits the waiting commands and stops the writer thread.
+    """
+
+    _stop = object()
+
+    def __init__(
+        self,
+        receiver_factory: Callable[[], "PersistenceService"] = None,
+        max_rows: int = 500,
+        max_delay: float = 0.05,
+    ) -> None:
+        """Starts the writer thread.
+
+        Args:
+            receiver_factory (Callable, optional): Returns the receiver used
+                by the writer thread. Called on the writer thread so that the
+                connection belongs to it. Defaults to the ServiceManager's
+                persistence service.
+
+            max_rows (int, optional): The number of waiting commands which
+                causes a commit. Defaults to 500.
+
+            max_delay (float, optional): The number of seconds the oldest
+                waiting command waits before a commit. Defaults to 0.05.
+        """
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self._receiver_factory = receiver_factory or (
+            lambda: ServiceManager().persistence
+        )
+        self._queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name="narcotics-tracker-writer", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "WriteQueue":
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.close()
+
+    def submit(self, command: type["Command"], *args, **kwargs) -> Future:
+        """Queues a command with its arguments, returns a Future.
+
+        Args:
+            command (type[Command]): The class of the command. It is created
+                with the writer thread's receiver.
+
+            *args, **kwargs: The arguments passed to the command's execute
+                method.
+
+        Raises:
+            RuntimeError: The WriteQueue has been closed.
+        """
+        future = Future()
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit commands to a closed WriteQueue.")
+
+            self._queue.put((future, command, args, kwargs))
+
+        return future
+
+    def add_adjustment(self, adjustment: "Adjustment") -> Future:
+        """Queues an AddAdjustment command, returns a Future.
+
+        Args:
+            adjustment (Adjustment): The Adjustment to be added.
+        """
+        return self.submit(commands.AddAdjustment, adjustment)
+
+    def update_adjustment(self, data: dict[str], criteria: dict[str]) -> Future:
+        """Queues an UpdateAdjustment command, returns a Future.
+
+        Args:
+            data (dict[str]): Maps column names to their updated values.
+
+            criteria (dict[str]): Maps column names to values used to select
+                the adjustments to update.
+        """
+        return self.submit(commands.UpdateAdjustment, data, criteria)
+
+    def flush(self) -> None:
+        """Waits until all submitted commands are committed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Commits the waiting commands and stops the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+
+            self._closed = True
+            self._queue.put(self._stop)
+
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Collects commands into groups and commits them until stopped."""
+        try:
+            receiver = self._receiver_factory()
+        except Exception as exception:
+            self._fail_all(exception)
+            return
+
+        stopping = False
+
+        while not stopping:
+            group = []
+            taken = 0
+            entry = self._queue.get()
+            deadline = time.monotonic() + self.max_delay
+
+            while entry is not self._stop:
+                taken += 1
+                if entry[0].set_running_or_notify_cancel():
+                    group.append(entry)
+                if len(group) >= self.max_rows:
+                    break
+
+                try:
+                    entry = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            else:
+                stopping = True
+
+            self._commit(receiver, group)
+
+            for _ in range(taken + stopping):
+                self._queue.task_done()
+
+        if hasattr(receiver, "close"):
+            receiver.close()  # The connection belongs to the writer thread.
+
+    def _commit(self, receiver: "PersistenceService", group: list[tuple]) -> None:
+        """Runs a group of commands, setting the results of their futures."""
+        if not group:
+            return
+
+        batch = commands.CommandBatch(receiver)
+        for _, command, args, kwargs in group:
+            batch.add(command, *args, **kwargs)
+
+        try:
+            results = batch.execute()
+        except Exception:
+            self._commit_individually(receiver, group)
+            return
+
+        for (future, *_), result in zip(group, results):
+            self._set_result(future, result)
+
+    def _commit_individually(
+        self, receiver: "PersistenceService", group: list[tuple]
+    ) -> None:
+        """Runs each command in its own transaction to isolate failures."""
+        for future, command, args, kwargs in group:
+            try:
+                with receiver.transaction():
+                    result = command(receiver).execute(*args, **kwargs)
+            except Exception as exception:
+                self._set_exception(future, exception)
+            else:
+                self._set_result(future, result)
+
+    def _fail_all(self, exception: Exception) -> None:
+        """Sets the exception on every submitted command until stopped."""
+        while True:
+            entry = self._queue.get()
+            self._queue.task_done()
+
+            if entry is self._stop:
+                return
+
+            if entry[0].set_running_or_notify_cancel():
+                self._set_exception(entry[0], exception)
+
+    @staticmethod
+    def _set_result(future: Future, result: any) -> None:
+        """Sets the result of a future unless it was already set."""
+        try:
+            future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    @staticmethod
+    def _set_exception(future: Future, exception: Exception) -> None:
+        """Sets the exception of a future unless it was already set."""
+        try:
+            future.set_exception(exception)
+        except InvalidStateError:
+            pass
@@ -11,6 +11,8 @@ Functions:
 import sqlite3
 
 from narcotics_tracker import commands
+from narcotics_tracker.items.adjustments import CompactAdjustment
+from narcotics_tracker.items.interfaces.dataitem_interface import return_column_data
 from narcotics_tracker.services.sqlite_manager import SQLiteManager
 
 
@@ -40,6 +42,11 @@ class Test_AdjustmentStorage:
         - Adjustments can be removed from the inventory table.
         - Adjustments can be read from the inventory table.
         - Adjustments can be updated.
+        - Compact Adjustments can be added to the inventory table.
+        - Adding an Adjustment does not modify it.
+        - Adjustments can be loaded into an AdjustmentFrame.
+        - Many Adjustments can be loaded from the database.
+        - Many Adjustments can be added to the inventory table.
     """
 
     def test_adjustments_can_be_added(self, reset_database, test_adjustment) -> None:
@@ -95,3 +102,64 @@ class Test_AdjustmentStorage:
         returned_adjustment = commands.ListAdjustments(sq_man).execute({"id": -77})[0]
 
         assert returned_adjustment[4] == 9999
+
+    def test_compact_adjustments_can_be_added(
+        self, reset_database, test_adjustment
+    ) -> None:
+        compact_adjustment = CompactAdjustment(**return_column_data(test_adjustment))
+        sq_man = SQLiteManager("data_item_storage_tests.db")
+        commands.CreateInventoryTable(sq_man).execute()
+
+        commands.AddAdjustment(sq_man).execute(compact_adjustment)
+
+        cursor = sq_man.read(table_name="inventory")
+        adjustment_ids = return_ids(cursor)
+        assert -77 in adjustment_ids
+
+    def test_adding_adjustments_does_not_modify_them(
+        self, reset_database, test_adjustment
+    ) -> None:
+        sq_man = SQLiteManager("data_item_storage_tests.db")
+        commands.CreateInventoryTable(sq_man).execute()
+
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        assert test_adjustment.table == "inventory"
+
+    def test_adjustments_can_be_loaded_into_adjustment_frame(
+        self, reset_database, test_adjustment
+    ) -> None:
+        sq_man = SQLiteManager("data_item_storage_tests.db")
+        commands.CreateInventoryTable(sq_man).execute()
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        frame = commands.LoadAdjustmentFrame(sq_man).execute({"event_code": "TEST"})
+
+        assert frame.group_sum("medication_code") == {"apap": 10}
+
+    def test_many_adjustments_can_be_loaded_from_db(
+        self, reset_database, test_adjustment
+    ) -> None:
+        sq_man = SQLiteManager("data_item_storage_tests.db")
+        commands.CreateInventoryTable(sq_man).execute()
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        adjustments = commands.LoadAdjustments(sq_man).execute()
+
+        assert adjustments == [test_adjustment]
+
+    def test_many_adjustments_can_be_added(
+        self, reset_database, test_adjustment
+    ) -> None:
+        compact_adjustment = CompactAdjustment(**return_column_data(test_adjustment))
+        compact_adjustment.id = -78
+        sq_man = SQLiteManager("data_item_storage_tests.db")
+        commands.CreateInventoryTable(sq_man).execute()
+
+        message = commands.AddAdjustments(sq_man).execute(
+            [test_adjustment, compact_adjustment]
+        )
+
+        cursor = sq_man.read(table_name="inventory")
+        assert return_ids(cursor) == [-78, -77]
+        assert message == "2 Adjustments added to the inventory table."
@@ -0,0 +1,147 @@
+"""Integration tests for the Async SQLite Manager and the async commands.
+
+Classes:
+    Test_AsyncSQLiteManager: Tests using the database from an event loop.
+
+    Test_AsyncCommands: Tests the async commands and reports.
+"""
+
+import asyncio
+import threading
+
+from pytest import raises
+
+from narcotics_tracker import commands, reports
+from narcotics_tracker.items.adjustments import Adjustment
+from narcotics_tracker.services.async_sqlite_manager import AsyncSQLiteManager
+from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+FILENAME = "data_item_storage_tests.db"
+
+
+def return_adjustment(id_number: int) -> Adjustment:
+    """Returns an Adjustment with the passed id."""
+    return Adjustment(
+        "inventory", id_number, 1, 1, "Test", 1, "USE", "fentanyl", -50, "PCR", 1
+    )
+
+
+def setup_database() -> None:
+    """Creates the inventory table in the test database."""
+    sq_man = SQLiteManager(FILENAME)
+    commands.CreateInventoryTable(sq_man).execute()
+
+
+class Test_AsyncSQLiteManager:
+    """Tests using the database from an event loop.
+
+    Behaviors Tested:
+        - Rows can be inserted and read.
+        - Statements run off the event loop's thread.
+        - Concurrent requests share the connections in the pool.
+        - Transactions commit their changes.
+        - Transactions roll back when an exception is raised.
+    """
+
+    def test_rows_can_be_inserted_and_read(self, reset_database) -> None:
+        setup_database()
+        adjustment = return_adjustment(1)
+        serializer = DataItemSerializer.for_item(adjustment)
+
+        async def insert_and_read() -> list[tuple]:
+            async with AsyncSQLiteManager(FILENAME) as receiver:
+                await receiver.insert(serializer, serializer.return_values(adjustment))
+                return await receiver.read("inventory")
+
+        rows = asyncio.run(insert_and_read())
+
+        assert len(rows) == 1 and rows[0][0] == 1
+
+    def test_statements_run_off_the_event_loop_thread(self, reset_database) -> None:
+        setup_database()
+
+        async def return_thread_name() -> str:
+            async with AsyncSQLiteManager(FILENAME, connections=1) as receiver:
+                return await receiver.run(lambda _: threading.current_thread().name)
+
+        assert asyncio.run(return_thread_name()) != threading.current_thread().name
+
+    def test_concurrent_requests_share_connections(self, reset_database) -> None:
+        setup_database()
+
+        async def run_requests() -> set[int]:
+            async with AsyncSQLiteManager(FILENAME, connections=2) as receiver:
+                connections = await asyncio.gather(
+                    *(receiver.run(lambda manager: id(manager)) for _ in range(20))
+                )
+            return set(connections)
+
+        assert len(asyncio.run(run_requests())) == 2
+
+    def test_transactions_commit_changes(self, reset_database) -> None:
+        setup_database()
+
+        async def add_in_transaction() -> list[tuple]:
+            async with AsyncSQLiteManager(FILENAME) as receiver:
+                async with receiver.transaction():
+                    for id_number in (1, 2, 3):
+                        await commands.AsyncAddAdjustment(receiver).execute(
+                            return_adjustment(id_number)
+                        )
+                return await receiver.read("inventory")
+
+        assert len(asyncio.run(add_in_transaction())) == 3
+
+    def test_transactions_roll_back_on_exception(self, reset_database) -> None:
+        setup_database()
+
+        async def fail_in_transaction() -> list[tuple]:
+            async with AsyncSQLiteManager(FILENAME) as receiver:
+                with raises(ValueError):
+                    async with receiver.transaction():
+                        await commands.AsyncAddAdjustment(receiver).execute(
+                            return_adjustment(1)
+                        )
+                        raise ValueError("Stop.")
+                return await receiver.read("inventory")
+
+        assert asyncio.run(fail_in_transaction()) == []
+
+
+class Test_AsyncCommands:
+    """Tests the async commands and reports.
+
+    Behaviors Tested:
+        - Async List commands return the same results as the commands.
+        - Async reports return the same results as the reports.
+    """
+
+    def test_async_list_commands_return_same_results(
+        self, setup_integration_db
+    ) -> None:
+        expected = commands.ListMedications(
+            SQLiteManager("integration_test.db")
+        ).execute()
+
+        async def list_medications() -> list[tuple]:
+            async with AsyncSQLiteManager("integration_test.db") as receiver:
+                return await commands.AsyncListMedications(receiver).execute()
+
+        assert asyncio.run(list_medications()) == expected
+
+    def test_async_reports_return_same_results(self, setup_integration_db) -> None:
+        expected = reports.ReturnCurrentInventory(
+            SQLiteManager("integration_test.db")
+        ).run()
+
+        async def run_reports() -> list:
+            async with AsyncSQLiteManager("integration_test.db") as receiver:
+                return await asyncio.gather(
+                    reports.AsyncReturnCurrentInventory(receiver).run(),
+                    reports.AsyncReturnMedicationStock(receiver).run("fentanyl"),
+                )
+
+        inventory, fentanyl_stock = asyncio.run(run_reports())
+
+        assert inventory == expected and fentanyl_stock > 0
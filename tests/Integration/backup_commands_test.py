@@ -0,0 +1,140 @@
+"""Integration tests for the Backup Commands.
+
+Classes:
+    Test_BackupDatabase: Tests backing up the database.
+
+    Test_VerifyBackup: Tests comparing a backup with the database.
+"""
+
+import os
+import sqlite3
+import time
+
+from pytest import fixture
+
+from narcotics_tracker import commands
+from narcotics_tracker.scripts import backup_database
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+BACKUP_FILENAME = "backups/integration_test_backup.db"
+
+
+@fixture
+def receiver(setup_integration_db) -> SQLiteManager:
+    """Returns a receiver for the integration database and removes the backup."""
+    if os.path.exists(f"data/{BACKUP_FILENAME}"):
+        os.remove(f"data/{BACKUP_FILENAME}")
+
+    yield SQLiteManager("integration_test.db")
+
+    if os.path.exists(f"data/{BACKUP_FILENAME}"):
+        os.remove(f"data/{BACKUP_FILENAME}")
+
+
+class Test_BackupDatabase:
+    """Tests backing up the database.
+
+    Behaviors Tested:
+        - The backup contains the rows of the database.
+        - Pages are copied in steps, reporting progress after each step.
+        - The database can be written to between the steps.
+        - The backup pauses between the steps.
+        - The script backs up and verifies the database.
+    """
+
+    def test_backup_contains_rows(self, receiver) -> None:
+        commands.BackupDatabase(receiver).execute(BACKUP_FILENAME, sleep=0)
+
+        backup = SQLiteManager(BACKUP_FILENAME)
+
+        assert commands.ListAdjustments(backup).execute() == (
+            commands.ListAdjustments(receiver).execute()
+        )
+
+    def test_pages_are_copied_in_steps(self, receiver) -> None:
+        steps = []
+
+        commands.BackupDatabase(receiver).execute(
+            BACKUP_FILENAME,
+            pages=1,
+            sleep=0,
+            progress=lambda status, remaining, total: steps.append(remaining),
+        )
+
+        assert len(steps) > 1 and steps[-1] == 0
+
+    def test_database_can_be_written_between_steps(self, receiver) -> None:
+        writer = sqlite3.connect("data/integration_test.db", timeout=0)
+        written = []
+
+        def write(status: int, remaining: int, total: int) -> None:
+            if not written:
+                writer.execute("UPDATE medications SET modified_by = 'Backup'")
+                writer.commit()
+                written.append(True)
+
+        commands.BackupDatabase(receiver).execute(
+            BACKUP_FILENAME, pages=1, sleep=0, progress=write
+        )
+        writer.close()
+
+        assert written == [True]
+
+    def test_backup_pauses_between_steps(self, receiver) -> None:
+        steps = []
+
+        start = time.perf_counter()
+        commands.BackupDatabase(receiver).execute(
+            BACKUP_FILENAME,
+            pages=1,
+            sleep=0.01,
+            progress=lambda status, remaining, total: steps.append(remaining),
+        )
+        elapsed = time.perf_counter() - start
+
+        pauses = len([remaining for remaining in steps if remaining > 0])
+        assert pauses > 1 and elapsed >= pauses * 0.01
+
+    def test_script_backs_up_and_verifies(self, receiver, monkeypatch) -> None:
+        monkeypatch.setattr(
+            "narcotics_tracker.services.service_manager.ServiceManager._database",
+            "integration_test.db",
+        )
+
+        status = backup_database.main(["--target", BACKUP_FILENAME, "--sleep", "0"])
+
+        assert status == 0 and os.path.exists(f"data/{BACKUP_FILENAME}")
+
+
+class Test_VerifyBackup:
+    """Tests comparing a backup with the database.
+
+    Behaviors Tested:
+        - A complete backup is verified.
+        - Row counts of each table are compared.
+        - Differing stock totals fail the verification.
+    """
+
+    def test_complete_backup_is_verified(self, receiver) -> None:
+        commands.BackupDatabase(receiver).execute(BACKUP_FILENAME, sleep=0)
+
+        comparison = commands.VerifyBackup(receiver).execute(BACKUP_FILENAME)
+
+        assert comparison["verified"] is True
+
+    def test_row_counts_are_compared(self, receiver) -> None:
+        commands.BackupDatabase(receiver).execute(BACKUP_FILENAME, sleep=0)
+        expected = receiver.count_rows("inventory")
+
+        comparison = commands.VerifyBackup(receiver).execute(BACKUP_FILENAME)
+
+        assert comparison["row_counts"]["inventory"] == (expected, expected)
+
+    def test_differing_stock_totals_fail_verification(self, receiver) -> None:
+        commands.BackupDatabase(receiver).execute(BACKUP_FILENAME, sleep=0)
+        backup = SQLiteManager(BACKUP_FILENAME)
+        backup.update("inventory", {"amount": 1}, {"medication_code": "fentanyl"})
+
+        comparison = commands.VerifyBackup(receiver).execute(BACKUP_FILENAME)
+
+        assert comparison["verified"] is False
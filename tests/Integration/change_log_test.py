@@ -0,0 +1,125 @@
+"""Integration tests for the Change Log Commands and the incremental report.
+
+Classes:
+    Test_ChangeLog: Tests recording changes to the inventory.
+
+    Test_IncrementalBiAnnualNarcoticsInventory: Tests the Bi-Annual report
+        built from the running totals.
+"""
+
+from pytest import fixture
+
+from narcotics_tracker import commands, reports
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+PERIOD_ID = 2200001
+
+
+@fixture
+def receiver(setup_integration_db) -> SQLiteManager:
+    """Returns a receiver for the integration database with the change log."""
+    receiver = SQLiteManager("integration_test.db")
+    commands.EnableChangeLog(receiver).execute()
+
+    return receiver
+
+
+def add_fentanyl_use(receiver: SQLiteManager, test_adjustment) -> None:
+    """Adds a use of fentanyl to the test reporting period."""
+    test_adjustment.event_code = "USE"
+    test_adjustment.medication_code = "fentanyl"
+    test_adjustment.reporting_period_id = PERIOD_ID
+    commands.AddAdjustment(receiver).execute(test_adjustment)
+
+
+class Test_ChangeLog:
+    """Tests recording changes to the inventory.
+
+    Behaviors Tested:
+        - Totals are calculated when the change log is enabled.
+        - Added adjustments are recorded.
+        - Updated adjustments are recorded as a removal and an addition.
+        - Changes to other columns are not recorded.
+        - Applying the change log empties it.
+        - Changes are recorded after migrating to integer keys.
+    """
+
+    def test_totals_are_calculated(self, receiver) -> None:
+        assert receiver.count_rows("inventory_totals") == 8
+
+    def test_added_adjustments_are_recorded(self, receiver, test_adjustment) -> None:
+        add_fentanyl_use(receiver, test_adjustment)
+
+        changes = receiver.read("inventory_changes").fetchall()
+
+        assert len(changes) == 1 and changes[0][2:4] == ("USE", "fentanyl")
+
+    def test_updated_adjustments_are_recorded(self, receiver) -> None:
+        receiver.update("inventory", {"amount": -1}, {"id": 1})
+
+        assert receiver.count_rows("inventory_changes") == 2
+
+    def test_other_columns_are_not_recorded(self, receiver) -> None:
+        receiver.update("inventory", {"modified_by": "Change Log"}, {"id": 1})
+
+        assert receiver.count_rows("inventory_changes") == 0
+
+    def test_applying_change_log_empties_it(self, receiver, test_adjustment) -> None:
+        add_fentanyl_use(receiver, test_adjustment)
+
+        commands.ApplyChangeLog(receiver).execute()
+
+        assert receiver.count_rows("inventory_changes") == 0
+
+    def test_changes_are_recorded_after_migration(
+        self, receiver, test_adjustment
+    ) -> None:
+        commands.MigrateInventoryKeys(receiver).execute(integer_keys=True)
+
+        add_fentanyl_use(receiver, test_adjustment)
+
+        changes = receiver.read("inventory_changes").fetchall()
+        assert len(changes) == 1 and changes[0][2:4] == ("USE", "fentanyl")
+
+
+class Test_IncrementalBiAnnualNarcoticsInventory:
+    """Tests the Bi-Annual report built from the running totals.
+
+    Behaviors Tested:
+        - The report matches the BiAnnualNarcoticsInventory.
+        - Recorded changes are included before they are applied.
+        - Applied changes are included.
+        - Deleted adjustments are removed from the report.
+    """
+
+    def test_report_matches_biannual_report(self, receiver) -> None:
+        expected = reports.BiAnnualNarcoticsInventory(receiver).run()
+
+        report = reports.IncrementalBiAnnualNarcoticsInventory(receiver).run()
+
+        assert report == expected
+
+    def test_recorded_changes_are_included(self, receiver, test_adjustment) -> None:
+        add_fentanyl_use(receiver, test_adjustment)
+        expected = reports.BiAnnualNarcoticsInventory(receiver).run()
+
+        report = reports.IncrementalBiAnnualNarcoticsInventory(receiver).run()
+
+        assert report == expected
+
+    def test_applied_changes_are_included(self, receiver, test_adjustment) -> None:
+        add_fentanyl_use(receiver, test_adjustment)
+        expected = reports.BiAnnualNarcoticsInventory(receiver).run()
+        commands.ApplyChangeLog(receiver).execute()
+
+        report = reports.IncrementalBiAnnualNarcoticsInventory(receiver).run()
+
+        assert report == expected
+
+    def test_deleted_adjustments_are_removed(self, receiver) -> None:
+        commands.DeleteAdjustment(receiver).execute(1)
+        expected = reports.BiAnnualNarcoticsInventory(receiver).run()
+
+        report = reports.IncrementalBiAnnualNarcoticsInventory(receiver).run()
+
+        assert report == expected
@@ -0,0 +1,140 @@
+"""Integration tests for running commands in a batch.
+
+Classes:
+    Test_CommandBatch: Tests running queued commands in one transaction.
+
+    CountingSQLiteManager: Counts the calls to insert_many.
+"""
+
+import sqlite3
+
+from pytest import raises
+
+from narcotics_tracker import commands
+from narcotics_tracker.items.units import Unit
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+
+class CountingSQLiteManager(SQLiteManager):
+    """Counts the calls to insert_many."""
+
+    insert_many_calls = 0
+
+    def insert_many(self, serializer, rows) -> int:
+        self.insert_many_calls += 1
+        return super().insert_many(serializer, rows)
+
+
+def return_units(count: int) -> list[Unit]:
+    """Returns Units with unique codes."""
+    return [
+        Unit("units", None, 1, 1, "Test", f"u{number}", f"unit {number}", 2)
+        for number in range(count)
+    ]
+
+
+class Test_CommandBatch:
+    """Tests running queued commands in one transaction.
+
+    Behaviors Tested:
+        - Returns the result of each command.
+        - Saves consecutive inserts of the same item together.
+        - Passes other commands to the receiver.
+        - Rolls back all commands when one fails.
+        - Accepts commands passed to execute.
+        - Changed codes are returned after the batch.
+        - Codes of a failed batch are not returned.
+    """
+
+    def test_batch_returns_result_of_each_command(
+        self, reset_database, test_event, test_unit
+    ) -> None:
+        sq_man = SQLiteManager("data_item_storage_tests.db")
+        commands.CreateEventsTable(sq_man).execute()
+        commands.CreateUnitsTable(sq_man).execute()
+
+        results = (
+            commands.CommandBatch(sq_man)
+            .add(commands.AddEvent, test_event)
+            .add(commands.AddUnit, test_unit)
+            .execute()
+        )
+
+        assert results == ["Event added to events table.", "Unit added to units table."]
+
+    def test_batch_saves_consecutive_inserts_together(self, reset_database) -> None:
+        sq_man = CountingSQLiteManager("data_item_storage_tests.db")
+        commands.CreateUnitsTable(sq_man).execute()
+        batch = commands.CommandBatch(sq_man)
+
+        for unit in return_units(5):
+            batch.add(commands.AddUnit, unit)
+        batch.execute()
+
+        assert sq_man.insert_many_calls == 1
+        assert len(commands.ListUnits(sq_man).execute()) == 5
+
+    def test_batch_passes_other_commands_to_receiver(self, reset_database) -> None:
+        sq_man = SQLiteManager("data_item_storage_tests.db")
+        commands.CreateUnitsTable(sq_man).execute()
+        unit = return_units(1)[0]
+
+        results = (
+            commands.CommandBatch(sq_man)
+            .add(commands.AddUnit, unit)
+            .add(commands.ListUnits, {"unit_code": "u0"})
+            .execute()
+        )
+
+        assert results[1][0][1] == "u0"
+
+    def test_batch_rolls_back_when_command_fails(self, reset_database) -> None:
+        sq_man = SQLiteManager("data_item_storage_tests.db")
+        commands.CreateUnitsTable(sq_man).execute()
+        duplicate_units = return_units(2) + return_units(1)
+        batch = commands.CommandBatch(sq_man)
+
+        for unit in duplicate_units:
+            batch.add(commands.AddUnit, unit)
+
+        with raises(sqlite3.IntegrityError):
+            batch.execute()
+
+        assert commands.ListUnits(sq_man).execute() == []
+
+    def test_batch_accepts_commands_passed_to_execute(self, reset_database) -> None:
+        sq_man = SQLiteManager("data_item_storage_tests.db")
+        commands.CreateUnitsTable(sq_man).execute()
+        queued_commands = [(commands.AddUnit, unit) for unit in return_units(3)]
+
+        results = commands.CommandBatch(sq_man).execute(queued_commands)
+
+        assert len(results) == 3
+
+    def test_changed_codes_are_returned_after_batch(self, setup_integration_db) -> None:
+        sq_man = SQLiteManager("integration_test.db")
+        commands.MigrateInventoryKeys(sq_man).execute(integer_keys=True)
+        commands.ListAdjustments(sq_man).execute()
+
+        commands.CommandBatch(sq_man).add(
+            commands.UpdateEvent, {"event_code": "USED"}, {"event_code": "USE"}
+        ).execute()
+
+        event_codes = {row[2] for row in commands.ListAdjustments(sq_man).execute()}
+        assert "USED" in event_codes and "USE" not in event_codes
+
+    def test_codes_of_failed_batch_are_not_returned(self, setup_integration_db) -> None:
+        sq_man = SQLiteManager("integration_test.db")
+        commands.MigrateInventoryKeys(sq_man).execute(integer_keys=True)
+        batch = (
+            commands.CommandBatch(sq_man)
+            .add(commands.UpdateEvent, {"event_code": "USED"}, {"event_code": "USE"})
+            .add(commands.ListAdjustments)
+            .add(commands.UpdateAdjustment, {"event_code": "nope"}, {"id": 1})
+        )
+
+        with raises(ValueError):
+            batch.execute()
+
+        event_codes = {row[2] for row in commands.ListAdjustments(sq_man).execute()}
+        assert "USE" in event_codes and "USED" not in event_codes
@@ -0,0 +1,108 @@
+"""Integration tests for the Consolidated Report.
+
+Classes:
+    Test_ConsolidatedReport: Tests running a report for many databases.
+"""
+
+import os
+import shutil
+
+from pytest import fixture, raises
+
+from narcotics_tracker import reports
+from narcotics_tracker.scripts import run_county_report
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+AGENCY_FILENAMES = ["agency_a_test.db", "agency_b_test.db"]
+
+
+@fixture
+def agency_databases(setup_integration_db) -> list[str]:
+    """Copies the integration database for each agency."""
+    for filename in AGENCY_FILENAMES:
+        shutil.copy("data/integration_test.db", f"data/{filename}")
+
+    yield AGENCY_FILENAMES
+
+    for filename in AGENCY_FILENAMES:
+        if os.path.exists(f"data/{filename}"):
+            os.remove(f"data/{filename}")
+
+
+class Test_ConsolidatedReport:
+    """Tests running a report for many databases.
+
+    Behaviors Tested:
+        - The result of each agency is returned.
+        - Stock is added up across the agencies.
+        - BiAnnual amounts are added up by medication.
+        - Progress is reported for each database.
+        - A database which fails does not stop the others.
+        - Reports which cannot be consolidated raise ValueError.
+        - The script exits with status 1 when a database fails.
+    """
+
+    def test_result_of_each_agency_is_returned(self, agency_databases) -> None:
+        expected = reports.ReturnCurrentInventory(
+            SQLiteManager("integration_test.db")
+        ).run()
+
+        results = reports.ConsolidatedReport(
+            agency_databases, reports.ReturnCurrentInventory, max_workers=2
+        ).run()
+
+        assert results["agencies"] == {
+            filename: expected for filename in agency_databases
+        }
+
+    def test_stock_is_added_up(self, agency_databases) -> None:
+        expected = reports.ReturnCurrentInventory(
+            SQLiteManager("integration_test.db")
+        ).run()
+
+        results = reports.ConsolidatedReport(
+            agency_databases, reports.ReturnCurrentInventory, max_workers=2
+        ).run()
+
+        amounts = [medication["amount"] for medication in results["summary"]]
+        assert amounts == [round(med["amount"] * 2, 2) for med in expected]
+
+    def test_biannual_amounts_are_added_up(self, agency_databases) -> None:
+        expected = reports.BiAnnualNarcoticsInventory(
+            SQLiteManager("integration_test.db")
+        ).run()
+        figures = list(expected.values())[0]["fentanyl"]
+
+        results = reports.ConsolidatedReport(agency_databases, max_workers=2).run()
+
+        summary = results["summary"]["fentanyl"]
+        assert summary["amount_used"] == round(figures["amount_used"] * 2, 2)
+        assert summary["name"] == figures["name"]
+
+    def test_progress_is_reported(self, agency_databases) -> None:
+        steps = []
+
+        reports.ConsolidatedReport(
+            agency_databases, reports.ReturnCurrentInventory, max_workers=2
+        ).run(lambda finished, total, filename: steps.append((finished, total)))
+
+        assert steps == [(1, 2), (2, 2)]
+
+    def test_failed_database_does_not_stop_others(self, agency_databases) -> None:
+        filenames = agency_databases + ["missing_agency_test.db"]
+
+        results = reports.ConsolidatedReport(
+            filenames, reports.ReturnCurrentInventory, max_workers=2
+        ).run()
+
+        assert list(results["agencies"]) == agency_databases
+        assert "OperationalError" in results["errors"]["missing_agency_test.db"]
+
+    def test_unsupported_reports_raise_value_error(self) -> None:
+        with raises(ValueError):
+            reports.ConsolidatedReport(AGENCY_FILENAMES, reports.ReturnMedicationStock)
+
+    def test_script_exits_with_error_status(self, agency_databases) -> None:
+        arguments = agency_databases + ["missing_agency_test.db", "--workers", "2"]
+
+        assert run_county_report.main(arguments) == 1
@@ -0,0 +1,68 @@
+"""Integration tests for the Generate Load Data Script.
+
+Classes:
+    Test_GenerateLoadData: Tests the databases created by the generator.
+"""
+
+from narcotics_tracker import commands
+from narcotics_tracker.scripts import generate_load_data
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+
+class Test_GenerateLoadData:
+    """Tests the databases created by the generator.
+
+    Behaviors Tested:
+        - Creates a database for each agency.
+        - Adds the requested number of adjustments.
+        - Leaves only the last reporting period open.
+        - Generates the same data from the same seed.
+    """
+
+    arguments = [
+        "--prefix",
+        "generator_test",
+        "--agencies",
+        "2",
+        "--medications",
+        "4",
+        "--years",
+        "2",
+        "--adjustments",
+        "1000",
+        "--batch-size",
+        "300",
+    ]
+
+    def test_generator_creates_database_for_each_agency(self) -> None:
+        filenames = generate_load_data.main(self.arguments)
+
+        assert filenames == ["generator_test_01.db", "generator_test_02.db"]
+
+    def test_generator_adds_requested_number_of_adjustments(self) -> None:
+        generate_load_data.main(self.arguments)
+        sq_man = SQLiteManager("generator_test_01.db")
+
+        adjustments = commands.ListAdjustments(sq_man).execute()
+        imports = commands.ListAdjustments(sq_man).execute({"event_code": "IMPORT"})
+
+        assert len(adjustments) == 1004 and len(imports) == 4
+
+    def test_generator_leaves_last_reporting_period_open(self) -> None:
+        generate_load_data.main(self.arguments)
+        sq_man = SQLiteManager("generator_test_01.db")
+
+        periods = commands.ListReportingPeriods(sq_man).execute({"status": "OPEN"})
+
+        assert len(periods) == 1 and periods[0][0] == 4
+
+    def test_generator_is_repeatable(self) -> None:
+        generate_load_data.main(self.arguments)
+        sq_man = SQLiteManager("generator_test_02.db")
+        first_run = sq_man.read("inventory").fetchall()
+
+        generate_load_data.main(self.arguments)
+        sq_man = SQLiteManager("generator_test_02.db")
+        second_run = sq_man.read("inventory").fetchall()
+
+        assert [row[:7] for row in first_run] == [row[:7] for row in second_run]
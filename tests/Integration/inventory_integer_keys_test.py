@@ -0,0 +1,202 @@
+"""Integration tests for storing integer keys in the inventory table.
+
+Classes:
+    Test_InventoryIntegerKeys: Tests the inventory table using integer keys.
+
+Functions:
+    setup_database: Returns an SQLiteManager with the events and medications
+        tables populated.
+"""
+
+import os
+
+from pytest import raises
+
+from narcotics_tracker import commands
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+
+def setup_database(test_event, test_medication) -> SQLiteManager:
+    """Returns an SQLiteManager with the events and medications tables populated."""
+    if os.path.exists("data/integer_keys_tests.db"):
+        os.remove("data/integer_keys_tests.db")
+
+    sq_man = SQLiteManager("integer_keys_tests.db")
+    commands.CreateEventsTable(sq_man).execute()
+    commands.CreateMedicationsTable(sq_man).execute()
+    commands.AddEvent(sq_man).execute(test_event)
+    commands.AddMedication(sq_man).execute(test_medication)
+
+    return sq_man
+
+
+class Test_InventoryIntegerKeys:
+    """Tests the inventory table using integer keys.
+
+    Behaviors Tested:
+        - Inventory table can be created with integer keys.
+        - Adjustments are stored using integer keys.
+        - Many Adjustments are stored using integer keys.
+        - Adjustments are returned with codes.
+        - Adjustments can be selected using codes.
+        - Adjustments can be updated using codes.
+        - Selecting unknown codes returns no Adjustments.
+        - Totalling unknown codes returns no totals.
+        - Updating with unknown codes raises ValueError.
+        - Adjustments are loaded into AdjustmentFrames with codes.
+        - Adjustments are loaded as Objects with codes.
+        - Inventory table can be migrated to integer keys.
+        - Inventory table can be migrated back to codes.
+    """
+
+    def test_inventory_table_can_be_created_with_integer_keys(
+        self, test_event, test_medication
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+
+        columns = sq_man.return_columns("inventory")
+        assert "event_id" in columns and "medication_id" in columns
+
+    def test_adjustments_are_stored_using_integer_keys(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        raw_data = sq_man.read("inventory").fetchall()[0]
+        assert raw_data[2] == -77 and raw_data[3] == -1
+
+    def test_many_adjustments_are_stored_using_integer_keys(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+
+        commands.AddAdjustments(sq_man).execute([test_adjustment])
+
+        raw_data = sq_man.read("inventory").fetchall()[0]
+        assert raw_data[2] == -77 and raw_data[3] == -1
+
+    def test_adjustments_are_returned_with_codes(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        adjustment = commands.ListAdjustments(sq_man).execute()[0]
+
+        assert adjustment[2] == "TEST" and adjustment[3] == "apap"
+
+    def test_adjustments_can_be_selected_using_codes(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        criteria = {"event_code": "TEST", "medication_code": "apap"}
+        adjustments = commands.ListAdjustments(sq_man).execute(criteria)
+
+        assert adjustments[0][0] == -77
+
+    def test_adjustments_can_be_updated_using_codes(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        commands.UpdateAdjustment(sq_man).execute(
+            {"amount": 9999}, {"medication_code": "apap"}
+        )
+
+        adjustment = commands.ListAdjustments(sq_man).execute({"id": -77})[0]
+        assert adjustment[4] == 9999
+
+    def test_selecting_unknown_codes_returns_no_adjustments(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        adjustments = commands.ListAdjustments(sq_man).execute({"event_code": "LOSS"})
+
+        assert adjustments == []
+
+    def test_totalling_unknown_codes_returns_no_totals(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        totals = commands.ListAdjustmentTotals(sq_man).execute(
+            criteria={"medication_code": "nope"}
+        )
+
+        assert totals == []
+
+    def test_updating_with_unknown_codes_raises_value_error(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        with raises(ValueError):
+            commands.UpdateAdjustment(sq_man).execute(
+                {"event_code": "LOSS"}, {"medication_code": "apap"}
+            )
+
+    def test_adjustments_are_loaded_into_adjustment_frames_with_codes(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        frame = commands.LoadAdjustmentFrame(sq_man).execute({"event_code": "TEST"})
+
+        assert frame.group_sum("medication_code") == {"apap": 10}
+
+    def test_adjustments_are_loaded_as_objects_with_codes(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        adjustment = commands.LoadAdjustments(sq_man).execute(compact=True)[0]
+
+        assert adjustment.event_code == "TEST" and adjustment.medication_code == "apap"
+
+    def test_inventory_table_can_be_migrated_to_integer_keys(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute()
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        commands.MigrateInventoryKeys(sq_man).execute()
+
+        raw_data = sq_man.read("inventory").fetchall()[0]
+        adjustment = commands.ListAdjustments(sq_man).execute()[0]
+        assert raw_data[2] == -77 and adjustment[2] == "TEST"
+
+    def test_inventory_table_can_be_migrated_back_to_codes(
+        self, test_event, test_medication, test_adjustment
+    ) -> None:
+        sq_man = setup_database(test_event, test_medication)
+        commands.CreateInventoryTable(sq_man).execute(integer_keys=True)
+        commands.AddAdjustment(sq_man).execute(test_adjustment)
+
+        commands.MigrateInventoryKeys(sq_man).execute(integer_keys=False)
+
+        raw_data = sq_man.read("inventory").fetchall()[0]
+        assert raw_data[2] == "TEST" and raw_data[3] == "apap"
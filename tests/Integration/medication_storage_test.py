@@ -42,6 +42,7 @@ class Test_MedicationStorage:
         - Medications can be updated.
         - Medication's preferred unit can be returned.
         - Medication can be loaded from data.
+        - Many Medications can be loaded from the database.
     """
 
     def test_medications_can_be_added_to_db(self, test_medication) -> None:
@@ -132,3 +133,11 @@ class Test_MedicationStorage:
         expected = "Medication #1: Fentanyl (fentanyl) 100.0 mcg in 2.0 ml."
 
         assert str(medication) == expected
+
+    def test_many_medications_can_be_loaded_from_db(self, setup_integration_db):
+        sq_man = SQLiteManager("integration_test.db")
+
+        medications = commands.LoadMedications(sq_man).execute(order_by="id")
+
+        expected = "Medication #1: Fentanyl (fentanyl) 100.0 mcg in 2.0 ml."
+        assert len(medications) == 3 and str(medications[0]) == expected
@@ -0,0 +1,165 @@
+"""Integration tests for the in-memory persistence services.
+
+Classes:
+    Test_InMemoryPersistence: Tests the commands and reports using the
+        MemorySQLiteManager and the DictionaryManager.
+"""
+
+import os
+import sqlite3
+
+from pytest import fixture, mark, raises
+
+from narcotics_tracker import commands, reports
+from narcotics_tracker.services.dictionary_manager import DictionaryManager
+from narcotics_tracker.services.memory_sqlite_manager import MemorySQLiteManager
+from narcotics_tracker.services.service_manager import ServiceManager
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+from tests.conftest import (
+    build_reporting_periods,
+    build_test_meds,
+    construct_adjustments,
+    create_tables,
+    populate_standard_items,
+    return_adjustments_data,
+)
+
+FILENAME = "memory_persistence_tests.db"
+
+
+@fixture(params=[MemorySQLiteManager, DictionaryManager])
+def memory_receiver(request, setup_integration_db):
+    """Returns an in-memory receiver holding the integration test data."""
+    receiver = request.param(FILENAME)
+    create_tables(receiver)
+    populate_standard_items(receiver)
+
+    for medication in build_test_meds():
+        commands.AddMedication(receiver).execute(medication)
+
+    for period in build_reporting_periods(ServiceManager().datetime):
+        commands.AddReportingPeriod(receiver).execute(period)
+
+    for adjustment in construct_adjustments(return_adjustments_data()):
+        commands.AddAdjustment(receiver).execute(adjustment)
+
+    yield receiver
+
+    receiver.delete_database()
+
+
+def return_stable_columns(rows: list[tuple]) -> list[tuple]:
+    """Returns the rows without the created and modified dates."""
+    return [row[:7] for row in rows]
+
+
+class Test_InMemoryPersistence:
+    """Tests the commands and reports using the in-memory services.
+
+    Behaviors Tested:
+        - No database file is written.
+        - Managers with the same filename share the data.
+        - Selected and ordered rows match the SQLiteManager.
+        - Reports return the same results as with the SQLiteManager.
+        - A criterion of None selects no rows.
+        - Unique constraints raise IntegrityError.
+        - Rows can be updated and removed.
+        - Transactions are rolled back when an exception is raised.
+        - Rows cannot be updated or removed without criteria.
+        - Commands running SQL scripts reject the DictionaryManager.
+    """
+
+    def test_no_database_file_is_written(self, memory_receiver) -> None:
+        assert not os.path.exists(f"data/{FILENAME}")
+
+    def test_managers_share_data(self, memory_receiver) -> None:
+        other_receiver = type(memory_receiver)(FILENAME)
+
+        medications = commands.ListMedications(other_receiver).execute()
+
+        assert medications == commands.ListMedications(memory_receiver).execute()
+
+    def test_selected_rows_match_sqlite(self, memory_receiver) -> None:
+        sq_man = SQLiteManager("integration_test.db")
+        criteria = {"medication_code": "fentanyl", "event_code": "USE"}
+
+        expected = commands.ListAdjustments(sq_man).execute(criteria, "amount")
+        results = commands.ListAdjustments(memory_receiver).execute(criteria, "amount")
+
+        assert return_stable_columns(results) == return_stable_columns(expected)
+
+    def test_reports_match_sqlite(self, memory_receiver) -> None:
+        sq_man = SQLiteManager("integration_test.db")
+
+        expected = reports.ReturnCurrentInventory(sq_man).run()
+        results = reports.ReturnCurrentInventory(memory_receiver).run()
+
+        assert results == expected
+
+    def test_biannual_report_matches_sqlite(self, memory_receiver) -> None:
+        sq_man = SQLiteManager("integration_test.db")
+
+        expected = reports.BiAnnualNarcoticsInventory(sq_man).run()
+        results = reports.BiAnnualNarcoticsInventory(memory_receiver).run()
+
+        assert results == expected
+
+    def test_none_criterion_selects_no_rows(self, memory_receiver) -> None:
+        results = memory_receiver.read("reporting_periods", {"end_date": None})
+
+        assert results.fetchall() == []
+
+    def test_unique_constraints_raise_integrity_error(self, memory_receiver) -> None:
+        medication = build_test_meds()[0]
+
+        with raises(sqlite3.IntegrityError):
+            commands.AddMedication(memory_receiver).execute(medication)
+
+    def test_rows_can_be_updated_and_removed(self, memory_receiver) -> None:
+        criteria = {"medication_code": "morphine"}
+        memory_receiver.update("medications", {"medication_name": "MS"}, criteria)
+        updated = commands.ListMedications(memory_receiver).execute(criteria)
+
+        memory_receiver.remove("medications", criteria)
+        removed = commands.ListMedications(memory_receiver).execute(criteria)
+
+        assert updated[0][2] == "MS" and removed == []
+
+    def test_transactions_roll_back_on_exception(self, memory_receiver) -> None:
+        with raises(ValueError):
+            with memory_receiver.transaction():
+                memory_receiver.remove("medications", {"medication_code": "morphine"})
+                raise ValueError("Stop.")
+
+        assert len(commands.ListMedications(memory_receiver).execute()) == 3
+
+    def test_rows_require_criteria_to_change(self, memory_receiver) -> None:
+        with raises(ValueError):
+            memory_receiver.update("medications", {"medication_name": "MS"}, {})
+
+        with raises(ValueError):
+            memory_receiver.remove("medications", {})
+
+        assert len(commands.ListMedications(memory_receiver).execute()) == 3
+
+    @mark.parametrize(
+        "command, arguments",
+        [
+            (commands.CreateInventoryArchiveTable, ()),
+            (commands.MigrateInventoryKeys, ()),
+            (commands.RollupReportingPeriod, (2100000,)),
+            (commands.RestoreReportingPeriod, (2100000,)),
+            (commands.MovePeriodToPartition, (2100000,)),
+            (commands.EnableChangeLog, ()),
+            (commands.ApplyChangeLog, ()),
+        ],
+    )
+    def test_sql_script_commands_reject_dictionary_manager(
+        self, command, arguments
+    ) -> None:
+        receiver = DictionaryManager(FILENAME)
+
+        with raises(sqlite3.NotSupportedError):
+            command(receiver).execute(*arguments)
+
+        receiver.delete_database()
@@ -0,0 +1,136 @@
+"""Integration tests for the multi-period Bi-Annual report.
+
+Classes:
+    Test_ListAdjustmentTotals: Tests totalling adjustments in groups.
+
+    Test_MultiPeriodBiAnnualNarcoticsInventory: Tests the Bi-Annual report for
+        many reporting periods.
+"""
+
+from pytest import fixture, raises
+
+from narcotics_tracker import commands, reports
+from narcotics_tracker.services.dictionary_manager import DictionaryManager
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+from tests.conftest import (
+    construct_adjustments,
+    create_tables,
+    return_adjustments_data,
+)
+
+PERIOD_ID = 2200001
+
+
+@fixture
+def receiver(setup_integration_db) -> SQLiteManager:
+    """Returns a receiver for the integration database."""
+    return SQLiteManager("integration_test.db")
+
+
+class Test_ListAdjustmentTotals:
+    """Tests totalling adjustments in groups.
+
+    Behaviors Tested:
+        - Amounts are totalled by period, event and medication.
+        - Adjustments can be grouped by other columns.
+        - Totals use codes when the inventory stores integer keys.
+        - The DictionaryManager returns the same totals.
+    """
+
+    def test_amounts_are_totalled_by_default_groups(self, receiver) -> None:
+        criteria = {"event_code": "USE", "medication_code": "fentanyl"}
+        uses = commands.ListAdjustments(receiver).execute(criteria)
+
+        totals = commands.ListAdjustmentTotals(receiver).execute()
+
+        expected = (PERIOD_ID, "USE", "fentanyl", sum(use[4] for use in uses))
+        assert len(totals) == 8 and expected in totals
+
+    def test_adjustments_can_be_grouped_by_other_columns(self, receiver) -> None:
+        totals = commands.ListAdjustmentTotals(receiver).execute(
+            ("medication_code",), {"event_code": "DESTROY"}
+        )
+
+        assert [total[0] for total in totals] == ["fentanyl", "midazolam", "morphine"]
+
+    def test_totals_use_codes_with_integer_keys(self, receiver) -> None:
+        expected = commands.ListAdjustmentTotals(receiver).execute()
+        commands.MigrateInventoryKeys(receiver).execute(integer_keys=True)
+
+        totals = commands.ListAdjustmentTotals(receiver).execute()
+
+        assert sorted(totals) == sorted(expected)
+
+    def test_dictionary_manager_returns_same_totals(self, receiver) -> None:
+        dictionary = DictionaryManager("multi_period_report_tests.db")
+        create_tables(dictionary)
+        for adjustment in construct_adjustments(return_adjustments_data()):
+            commands.AddAdjustment(dictionary).execute(adjustment)
+
+        totals = commands.ListAdjustmentTotals(dictionary).execute()
+
+        dictionary.delete_database()
+        assert totals == commands.ListAdjustmentTotals(receiver).execute()
+
+
+class Test_MultiPeriodBiAnnualNarcoticsInventory:
+    """Tests the Bi-Annual report for many reporting periods.
+
+    Behaviors Tested:
+        - The current period matches the BiAnnualNarcoticsInventory.
+        - All reporting periods are returned by default.
+        - Only the requested periods are returned.
+        - Periods without adjustments report zero amounts.
+        - Missing periods raise ValueError.
+        - Each medication's ending amount is calculated separately.
+        - Both reports total every IMPORT adjustment of the period.
+    """
+
+    def test_current_period_matches_biannual_report(self, receiver) -> None:
+        expected = reports.BiAnnualNarcoticsInventory(receiver).run()
+
+        report = reports.MultiPeriodBiAnnualNarcoticsInventory(receiver).run(
+            [PERIOD_ID]
+        )
+
+        assert report == expected
+
+    def test_all_periods_are_returned_by_default(self, receiver) -> None:
+        report = reports.MultiPeriodBiAnnualNarcoticsInventory(receiver).run()
+
+        assert list(report) == [2100000, 2100001, 2200000, PERIOD_ID]
+
+    def test_only_requested_periods_are_returned(self, receiver) -> None:
+        report = reports.MultiPeriodBiAnnualNarcoticsInventory(receiver).run(
+            [2100000, PERIOD_ID]
+        )
+
+        assert list(report) == [2100000, PERIOD_ID]
+
+    def test_periods_without_adjustments_report_zero(self, receiver) -> None:
+        report = reports.MultiPeriodBiAnnualNarcoticsInventory(receiver).run([2100000])
+
+        assert report[2100000]["fentanyl"]["ending_amount"] == 0
+
+    def test_missing_periods_raise_value_error(self, receiver) -> None:
+        with raises(ValueError):
+            reports.MultiPeriodBiAnnualNarcoticsInventory(receiver).run([-1])
+
+    def test_ending_amounts_are_calculated_per_medication(self, receiver) -> None:
+        report = reports.MultiPeriodBiAnnualNarcoticsInventory(receiver).run()
+
+        medications = report[PERIOD_ID]
+        assert medications["midazolam"]["ending_amount"] == 57.68
+        assert medications["morphine"]["ending_amount"] == 25
+
+    def test_reports_total_every_import_adjustment(self, receiver) -> None:
+        data = [None, "07-23-2022 17:00:00", "IMPORT", "fentanyl", 500, PERIOD_ID]
+        commands.AddAdjustment(receiver).execute(construct_adjustments([data])[0])
+
+        expected = reports.BiAnnualNarcoticsInventory(receiver).run()
+        report = reports.MultiPeriodBiAnnualNarcoticsInventory(receiver).run(
+            [PERIOD_ID]
+        )
+
+        assert expected[PERIOD_ID]["fentanyl"]["starting_amount"] == 159
+        assert report == expected
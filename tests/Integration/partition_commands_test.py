@@ -0,0 +1,194 @@
+"""Integration tests for the Partition Commands.
+
+Classes:
+    Test_MovePeriodToPartition: Tests moving closed periods into partitions.
+
+    Test_PartitionedSQLiteManager: Tests reading the inventory across
+        partitions.
+"""
+
+import os
+import sqlite3
+
+from pytest import fixture, raises
+
+from narcotics_tracker import commands, reports
+from narcotics_tracker.services.partitioned_sqlite_manager import (
+    PartitionedSQLiteManager,
+)
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+from tests.conftest import remove_autoincrement
+
+PERIOD_ID = 2200001
+PARTITION_FILENAME = "data/integration_test_2022.db"
+
+
+@fixture
+def receiver(setup_integration_db) -> SQLiteManager:
+    """Returns a receiver for the integration database and removes partitions."""
+    if os.path.exists(PARTITION_FILENAME):
+        os.remove(PARTITION_FILENAME)
+
+    yield SQLiteManager("integration_test.db")
+
+    if os.path.exists(PARTITION_FILENAME):
+        os.remove(PARTITION_FILENAME)
+
+
+@fixture
+def extra_partitions(receiver) -> list[str]:
+    """Creates more empty partition files than SQLite can attach."""
+    filenames = [f"data/integration_test_{year}.db" for year in range(2000, 2010)]
+    for filename in filenames:
+        sqlite3.connect(filename).close()
+
+    yield filenames
+
+    for filename in filenames:
+        os.remove(filename)
+
+
+@fixture
+def moved_receiver(receiver) -> SQLiteManager:
+    """Returns the receiver after the test period was moved to its partition."""
+    receiver.update("reporting_periods", {"status": "CLOSED"}, {"id": PERIOD_ID})
+    commands.MovePeriodToPartition(receiver).execute(PERIOD_ID)
+
+    return receiver
+
+
+class Test_MovePeriodToPartition:
+    """Tests moving closed periods into partitions.
+
+    Behaviors Tested:
+        - Adjustments are moved into the partition file of the year.
+        - The partition is detached afterwards.
+        - Open periods cannot be moved.
+        - Rolled up periods move their archived adjustments as well.
+    """
+
+    def test_adjustments_are_moved_into_partition_file(self, moved_receiver) -> None:
+        assert os.path.exists(PARTITION_FILENAME)
+        assert commands.ListAdjustments(moved_receiver).execute() == []
+
+    def test_partition_is_detached_afterwards(self, moved_receiver) -> None:
+        assert moved_receiver.return_attached() == []
+
+    def test_open_periods_cannot_be_moved(self, receiver) -> None:
+        with raises(ValueError):
+            commands.MovePeriodToPartition(receiver).execute(PERIOD_ID)
+
+    def test_archived_adjustments_are_moved(self, receiver) -> None:
+        receiver.update("reporting_periods", {"status": "CLOSED"}, {"id": PERIOD_ID})
+        commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+
+        commands.MovePeriodToPartition(receiver).execute(PERIOD_ID)
+
+        assert receiver.count_rows("inventory_archive") == 0
+        partition = SQLiteManager("integration_test_2022.db")
+        assert partition.count_rows("inventory_archive") > 0
+
+
+class Test_PartitionedSQLiteManager:
+    """Tests reading the inventory across partitions.
+
+    Behaviors Tested:
+        - Partition files of the database are found.
+        - Adjustments of the database and partitions are listed together.
+        - A single partition can be targeted.
+        - Targeting a missing partition raises ValueError.
+        - Reports return the same results after the move.
+        - New adjustments are added to the database file.
+        - New adjustments do not reuse the ids of moved adjustments.
+        - Tables without AUTOINCREMENT do not reuse the ids of moved
+            adjustments.
+        - Only the targeted partition is attached.
+        - Too many partitions raise ValueError.
+    """
+
+    def test_partition_files_are_found(self, moved_receiver) -> None:
+        partitioned = PartitionedSQLiteManager("integration_test.db")
+
+        assert partitioned.return_partitions() == [2022]
+
+    def test_adjustments_are_listed_together(self, receiver) -> None:
+        expected = commands.ListAdjustments(receiver).execute(order_by="id")
+        receiver.update("reporting_periods", {"status": "CLOSED"}, {"id": PERIOD_ID})
+        commands.MovePeriodToPartition(receiver).execute(PERIOD_ID)
+
+        partitioned = PartitionedSQLiteManager("integration_test.db")
+
+        assert commands.ListAdjustments(partitioned).execute(order_by="id") == expected
+
+    def test_single_partition_can_be_targeted(self, moved_receiver) -> None:
+        partitioned = PartitionedSQLiteManager("integration_test.db", partition=2022)
+        criteria = {"medication_code": "fentanyl"}
+
+        adjustments = commands.ListAdjustments(partitioned).execute(criteria)
+
+        assert len(adjustments) == 5
+
+    def test_missing_partition_raises_value_error(self, receiver) -> None:
+        with raises(ValueError):
+            PartitionedSQLiteManager("integration_test.db", partition=2021)
+
+    def test_reports_are_unchanged(self, receiver) -> None:
+        receiver.update("reporting_periods", {"status": "CLOSED"}, {"id": PERIOD_ID})
+        expected = reports.ReturnCurrentInventory(receiver).run()
+        commands.MovePeriodToPartition(receiver).execute(PERIOD_ID)
+
+        partitioned = PartitionedSQLiteManager("integration_test.db")
+
+        assert reports.ReturnCurrentInventory(partitioned).run() == expected
+
+    def test_new_adjustments_are_added_to_database_file(
+        self, moved_receiver, test_adjustment
+    ) -> None:
+        partitioned = PartitionedSQLiteManager("integration_test.db")
+        test_adjustment.medication_code = "fentanyl"
+
+        commands.AddAdjustment(partitioned).execute(test_adjustment)
+
+        assert moved_receiver.count_rows("inventory") == 1
+        assert len(commands.ListAdjustments(partitioned).execute()) == 13
+
+    def test_new_adjustments_do_not_reuse_moved_ids(
+        self, moved_receiver, test_adjustment
+    ) -> None:
+        test_adjustment.id = None
+        test_adjustment.medication_code = "fentanyl"
+        commands.AddAdjustment(moved_receiver).execute(test_adjustment)
+        new_id = moved_receiver.read("inventory").fetchone()[0]
+
+        partitioned = PartitionedSQLiteManager("integration_test.db")
+
+        assert len(commands.ListAdjustments(partitioned).execute({"id": new_id})) == 1
+
+    def test_tables_without_autoincrement_do_not_reuse_moved_ids(
+        self, receiver, test_adjustment
+    ) -> None:
+        remove_autoincrement(receiver)
+        receiver.update("reporting_periods", {"status": "CLOSED"}, {"id": PERIOD_ID})
+        commands.MovePeriodToPartition(receiver).execute(PERIOD_ID)
+        test_adjustment.id = None
+        test_adjustment.medication_code = "fentanyl"
+        commands.AddAdjustment(receiver).execute(test_adjustment)
+        new_id = receiver.read("inventory").fetchone()[0]
+
+        partitioned = PartitionedSQLiteManager("integration_test.db")
+
+        assert len(commands.ListAdjustments(partitioned).execute({"id": new_id})) == 1
+
+    def test_only_targeted_partition_is_attached(
+        self, moved_receiver, extra_partitions
+    ) -> None:
+        partitioned = PartitionedSQLiteManager("integration_test.db", partition=2022)
+
+        assert partitioned.return_attached() == ["partition_2022"]
+        assert len(commands.ListAdjustments(partitioned).execute()) == 12
+
+    def test_too_many_partitions_raise_value_error(
+        self, moved_receiver, extra_partitions
+    ) -> None:
+        with raises(ValueError):
+            PartitionedSQLiteManager("integration_test.db")
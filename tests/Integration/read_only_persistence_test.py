@@ -0,0 +1,109 @@
+"""Integration tests for the Read Only SQLite Manager.
+
+Classes:
+    Test_ReadOnlySQLiteManager: Tests reading the database in read-only mode.
+"""
+
+import os
+import sqlite3
+
+from pytest import fixture, raises
+
+from narcotics_tracker import commands, reports
+from narcotics_tracker.services.dictionary_manager import DictionaryManager
+from narcotics_tracker.services.read_only_sqlite_manager import ReadOnlySQLiteManager
+from narcotics_tracker.services.service_manager import ServiceManager
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+FILENAME = "read_only_tests.db"
+
+
+def remove_database_files() -> None:
+    """Removes the test database and its write-ahead log files."""
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(f"data/{FILENAME}{suffix}"):
+            os.remove(f"data/{FILENAME}{suffix}")
+
+
+@fixture
+def wal_database(setup_integration_db) -> str:
+    """Copies the integration database into a database using write-ahead logging."""
+    remove_database_files()
+    source = sqlite3.connect("data/integration_test.db")
+    copy = sqlite3.connect(f"data/{FILENAME}")
+    source.backup(copy)
+    copy.execute("PRAGMA journal_mode = WAL;")
+    source.close()
+    copy.close()
+
+    yield FILENAME
+
+    remove_database_files()
+
+
+class Test_ReadOnlySQLiteManager:
+    """Tests reading the database in read-only mode.
+
+    Behaviors Tested:
+        - Reports default to the report persistence service.
+        - The report persistence service is read-only for the SQLiteManager.
+        - Other persistence services are used by reports as they are.
+        - Changes raise OperationalError.
+        - Missing database files are not created.
+        - Reports run while another connection is writing.
+        - Reports can read an immutable snapshot.
+    """
+
+    def test_reports_default_to_report_persistence(self) -> None:
+        report = reports.ReturnMedicationStock()
+
+        assert isinstance(report._receiver, ReadOnlySQLiteManager)
+
+    def test_report_persistence_is_read_only_for_sqlite(self) -> None:
+        services = ServiceManager()
+        services.persistence = SQLiteManager
+
+        assert isinstance(services.report_persistence, ReadOnlySQLiteManager)
+
+    def test_other_persistence_services_are_used_as_they_are(self) -> None:
+        services = ServiceManager()
+        services.persistence = DictionaryManager
+
+        assert isinstance(services.report_persistence, DictionaryManager)
+
+    def test_changes_raise_operational_error(self, wal_database) -> None:
+        receiver = ReadOnlySQLiteManager(wal_database)
+
+        with raises(sqlite3.OperationalError):
+            receiver.remove("medications", {"medication_code": "fentanyl"})
+
+    def test_missing_database_files_are_not_created(self) -> None:
+        with raises(sqlite3.OperationalError):
+            ReadOnlySQLiteManager("missing_read_only_tests.db")
+
+        assert not os.path.exists("data/missing_read_only_tests.db")
+
+    def test_reports_run_while_another_connection_writes(self, wal_database) -> None:
+        expected = reports.ReturnCurrentInventory(SQLiteManager(wal_database)).run()
+        writer = sqlite3.connect(f"data/{wal_database}", isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        writer.execute("UPDATE inventory SET amount = 0")
+
+        try:
+            results = reports.ReturnCurrentInventory(
+                ReadOnlySQLiteManager(wal_database)
+            ).run()
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+
+        assert results == expected
+
+    def test_reports_can_read_immutable_snapshot(self, setup_integration_db) -> None:
+        expected = commands.ListAdjustments(
+            SQLiteManager("integration_test.db")
+        ).execute()
+
+        snapshot = ReadOnlySQLiteManager("integration_test.db", immutable=True)
+
+        assert commands.ListAdjustments(snapshot).execute() == expected
@@ -0,0 +1,124 @@
+"""Integration tests for the Report Cache.
+
+Classes:
+    Test_ReportCache: Tests caching report results until the database
+        changes.
+"""
+
+import collections
+import sqlite3
+
+from pytest import fixture
+
+from narcotics_tracker import reports
+from narcotics_tracker.services.dictionary_manager import DictionaryManager
+from narcotics_tracker.services.read_only_sqlite_manager import ReadOnlySQLiteManager
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+from tests.conftest import create_tables
+
+
+@fixture
+def cache(setup_integration_db) -> reports.ReportCache:
+    """Returns a cache reading the integration database."""
+    return reports.ReportCache(ReadOnlySQLiteManager("integration_test.db"))
+
+
+def change_medication_name(connection) -> None:
+    """Renames fentanyl in the database."""
+    connection.execute(
+        "UPDATE medications SET medication_name = 'Sublimaze' "
+        "WHERE medication_code = 'fentanyl';"
+    )
+    connection.commit()
+
+
+class Test_ReportCache:
+    """Tests caching report results until the database changes.
+
+    Behaviors Tested:
+        - Repeated runs return the cached result.
+        - Writes through a manager of this process invalidate the result.
+        - Commits from other connections invalidate the result.
+        - Reports run with different parameters are cached separately.
+        - Reports run with list parameters are cached.
+        - Reports run with unhashable parameters are not cached.
+        - Returned results are copies of the cached result.
+        - Receivers without a data version are not cached.
+        - The least recently used result is removed first.
+    """
+
+    def test_repeated_runs_return_cached_result(self, cache) -> None:
+        expected = cache.run(reports.ReturnCurrentInventory)
+
+        result = cache.run(reports.ReturnCurrentInventory)
+
+        assert result == expected and (cache.hits, cache.misses) == (1, 1)
+
+    def test_writes_through_manager_invalidate_result(self, cache) -> None:
+        cache.run(reports.ReturnCurrentInventory)
+        writer = SQLiteManager("integration_test.db")
+
+        writer.update("medications", {"medication_name": "Sublimaze"}, {"id": 1})
+        result = cache.run(reports.ReturnCurrentInventory)
+
+        assert result[0]["name"] == "Sublimaze" and cache.misses == 2
+
+    def test_commits_from_other_connections_invalidate_result(self, cache) -> None:
+        cache.run(reports.ReturnCurrentInventory)
+        connection = sqlite3.connect("data/integration_test.db")
+
+        change_medication_name(connection)
+        connection.close()
+        result = cache.run(reports.ReturnCurrentInventory)
+
+        assert result[0]["name"] == "Sublimaze" and cache.misses == 2
+
+    def test_parameters_are_cached_separately(self, cache) -> None:
+        fentanyl = cache.run(reports.ReturnMedicationStock, "fentanyl")
+        morphine = cache.run(reports.ReturnMedicationStock, "morphine")
+
+        assert fentanyl != morphine
+        assert cache.run(reports.ReturnMedicationStock, "fentanyl") == fentanyl
+
+    def test_list_parameters_are_cached(self, cache) -> None:
+        report = reports.MultiPeriodBiAnnualNarcoticsInventory
+
+        result = cache.run(report, [2200001])
+
+        assert cache.run(report, [2200001]) == result
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_unhashable_parameters_are_not_cached(self, cache) -> None:
+        report = reports.MultiPeriodBiAnnualNarcoticsInventory
+        period_ids = collections.UserList([2200001])
+
+        result = cache.run(report, period_ids)
+
+        assert cache.run(report, period_ids) == result
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_returned_results_are_copies(self, cache) -> None:
+        result = cache.run(reports.ReturnCurrentInventory)
+        result.clear()
+
+        assert cache.run(reports.ReturnCurrentInventory) != []
+
+    def test_receivers_without_data_version_are_not_cached(self) -> None:
+        receiver = DictionaryManager("report_cache_tests.db")
+        create_tables(receiver)
+        cache = reports.ReportCache(receiver)
+
+        cache.run(reports.ReturnCurrentInventory)
+        cache.run(reports.ReturnCurrentInventory)
+
+        receiver.delete_database()
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_least_recently_used_result_is_removed(self, cache) -> None:
+        cache.max_entries = 1
+
+        cache.run(reports.ReturnMedicationStock, "fentanyl")
+        cache.run(reports.ReturnMedicationStock, "morphine")
+        cache.run(reports.ReturnMedicationStock, "fentanyl")
+
+        assert cache.misses == 3
@@ -41,6 +41,8 @@ class Test_ReportingPeriodStorage:
         - ReportingPeriods can be read from the inventory table.
         - ReportingPeriods can be updated.
         - ReportingPeriods can be loaded from data.
+        - Many ReportingPeriods can be loaded from the database.
+        - Compact ReportingPeriods can be loaded from the database.
     """
 
     def test_ReportingPeriods_can_be_added_to_db(self, test_reporting_period) -> None:
@@ -108,3 +110,24 @@ class Test_ReportingPeriodStorage:
         period = commands.LoadReportingPeriod().execute(period_data)
         expected = "Reporting Period #2200001: Start Date: 07-23-2022 00:00:00, End Date: None, Current Status: OPEN."
         assert str(period) == expected
+
+    def test_many_reporting_periods_can_be_loaded_from_db(
+        self, setup_integration_db
+    ) -> None:
+        sq_man = SQLiteManager("integration_test.db")
+
+        periods = commands.LoadReportingPeriods(sq_man).execute({"status": "CLOSED"})
+
+        assert [period.id for period in periods] == [2100000, 2100001, 2200000]
+
+    def test_compact_reporting_periods_can_be_loaded_from_db(
+        self, setup_integration_db
+    ) -> None:
+        sq_man = SQLiteManager("integration_test.db")
+
+        period = commands.LoadReportingPeriods(sq_man).execute(
+            {"id": 2200001}, compact=True
+        )[0]
+
+        expected = "Reporting Period #2200001: Start Date: 07-23-2022 00:00:00, End Date: None, Current Status: OPEN."
+        assert str(period) == expected
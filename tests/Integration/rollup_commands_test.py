@@ -0,0 +1,161 @@
+"""Integration tests for the Rollup Commands.
+
+Classes:
+    Test_RollupReportingPeriod: Tests rolling up closed reporting periods.
+
+    Test_RestoreReportingPeriod: Tests restoring rolled up reporting periods.
+"""
+
+from pytest import fixture, raises
+
+from narcotics_tracker import commands, reports
+from narcotics_tracker.commands.rollup_commands import ROLLUP_REFERENCE
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+from tests.conftest import remove_autoincrement
+
+PERIOD_ID = 2200001
+
+
+def set_period_status(receiver: SQLiteManager, status: str) -> None:
+    """Sets the status of the reporting period holding the test adjustments."""
+    receiver.update("reporting_periods", {"status": status}, {"id": PERIOD_ID})
+
+
+@fixture
+def receiver(setup_integration_db) -> SQLiteManager:
+    """Returns a receiver for the integration database."""
+    return SQLiteManager("integration_test.db")
+
+
+class Test_RollupReportingPeriod:
+    """Tests rolling up closed reporting periods.
+
+    Behaviors Tested:
+        - Adjustments are moved into the archive.
+        - One summary adjustment is added per medication and event.
+        - Current inventory is unchanged.
+        - The BiAnnual report is unchanged.
+        - Open periods cannot be rolled up.
+        - Missing periods cannot be rolled up.
+        - Periods can be rolled up with integer keys.
+    """
+
+    def test_adjustments_are_moved_into_archive(self, receiver) -> None:
+        expected = commands.ListAdjustments(receiver).execute(order_by="id")
+        set_period_status(receiver, "CLOSED")
+
+        commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+
+        archived = commands.ListArchivedAdjustments(receiver).execute(order_by="id")
+        assert archived == expected
+
+    def test_summary_adjustment_added_per_medication_and_event(self, receiver) -> None:
+        criteria = {"event_code": "USE", "medication_code": "fentanyl"}
+        uses = commands.ListAdjustments(receiver).execute(criteria)
+        set_period_status(receiver, "CLOSED")
+
+        commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+
+        adjustments = commands.ListAdjustments(receiver).execute()
+        summary = commands.ListAdjustments(receiver).execute(criteria)
+        assert len(adjustments) == 8 and len(summary) == 1
+        assert summary[0][4] == sum(adjustment[4] for adjustment in uses)
+        assert {adjustment[6] for adjustment in adjustments} == {ROLLUP_REFERENCE}
+
+    def test_current_inventory_is_unchanged(self, receiver) -> None:
+        set_period_status(receiver, "CLOSED")
+        expected = reports.ReturnCurrentInventory(receiver).run()
+
+        commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+
+        assert reports.ReturnCurrentInventory(receiver).run() == expected
+
+    def test_biannual_report_is_unchanged(self, receiver) -> None:
+        expected = reports.BiAnnualNarcoticsInventory(receiver).run()
+        set_period_status(receiver, "CLOSED")
+
+        commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+        set_period_status(receiver, "OPEN")
+
+        assert reports.BiAnnualNarcoticsInventory(receiver).run() == expected
+
+    def test_open_periods_cannot_be_rolled_up(self, receiver) -> None:
+        with raises(ValueError):
+            commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+
+    def test_missing_periods_cannot_be_rolled_up(self, receiver) -> None:
+        with raises(ValueError):
+            commands.RollupReportingPeriod(receiver).execute(-1)
+
+    def test_periods_can_be_rolled_up_with_integer_keys(self, receiver) -> None:
+        commands.MigrateInventoryKeys(receiver).execute(integer_keys=True)
+        expected = commands.ListAdjustments(receiver).execute(order_by="id")
+        set_period_status(receiver, "CLOSED")
+
+        commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+
+        archived = commands.ListArchivedAdjustments(receiver).execute(order_by="id")
+        assert archived == expected
+
+
+class Test_RestoreReportingPeriod:
+    """Tests restoring rolled up reporting periods.
+
+    Behaviors Tested:
+        - Archived adjustments are moved back into the inventory.
+        - The archive is migrated along with the inventory.
+        - Adjustments added after a rollup do not reuse archived ids.
+        - Tables without AUTOINCREMENT do not reuse archived ids.
+    """
+
+    def test_archived_adjustments_are_moved_back(self, receiver) -> None:
+        expected = commands.ListAdjustments(receiver).execute(order_by="id")
+        set_period_status(receiver, "CLOSED")
+        commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+
+        commands.RestoreReportingPeriod(receiver).execute(PERIOD_ID)
+
+        assert commands.ListAdjustments(receiver).execute(order_by="id") == expected
+        assert commands.ListArchivedAdjustments(receiver).execute() == []
+
+    def test_archive_is_migrated_with_inventory(self, receiver) -> None:
+        set_period_status(receiver, "CLOSED")
+        commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+        expected = commands.ListArchivedAdjustments(receiver).execute(order_by="id")
+
+        commands.MigrateInventoryKeys(receiver).execute(integer_keys=True)
+
+        assert receiver.return_columns("inventory_archive")[2] == "event_id"
+        archived = commands.ListArchivedAdjustments(receiver).execute(order_by="id")
+        assert archived == expected
+
+    def test_added_adjustments_do_not_reuse_archived_ids(
+        self, receiver, test_adjustment
+    ) -> None:
+        set_period_status(receiver, "CLOSED")
+        commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+        test_adjustment.id = None
+        commands.AddAdjustment(receiver).execute(test_adjustment)
+
+        commands.RestoreReportingPeriod(receiver).execute(PERIOD_ID)
+
+        ids = [
+            adjustment[0] for adjustment in commands.ListAdjustments(receiver).execute()
+        ]
+        assert len(ids) == 13 and len(set(ids)) == 13
+
+    def test_tables_without_autoincrement_do_not_reuse_ids(
+        self, receiver, test_adjustment
+    ) -> None:
+        remove_autoincrement(receiver)
+        set_period_status(receiver, "CLOSED")
+        commands.RollupReportingPeriod(receiver).execute(PERIOD_ID)
+        test_adjustment.id = None
+        commands.AddAdjustment(receiver).execute(test_adjustment)
+
+        commands.RestoreReportingPeriod(receiver).execute(PERIOD_ID)
+
+        ids = [
+            adjustment[0] for adjustment in commands.ListAdjustments(receiver).execute()
+        ]
+        assert len(ids) == 13 and len(set(ids)) == 13
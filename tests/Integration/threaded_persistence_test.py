@@ -0,0 +1,157 @@
+"""Integration tests for the Threaded SQLite Manager.
+
+Classes:
+    Test_ThreadedSQLiteManager: Tests using the database from many threads.
+"""
+
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import fixture, raises
+
+from narcotics_tracker import commands
+from narcotics_tracker.items.adjustments import Adjustment
+from narcotics_tracker.services.threaded_sqlite_manager import ThreadedSQLiteManager
+
+FILENAME = "threaded_persistence_tests.db"
+
+
+def return_adjustment(id_number: int) -> Adjustment:
+    """Returns an Adjustment with the passed id."""
+    return Adjustment(
+        "inventory", id_number, 1, 1, "Test", 1, "USE", "fentanyl", -50, "PCR", 1
+    )
+
+
+@fixture
+def receiver() -> ThreadedSQLiteManager:
+    """Returns a ThreadedSQLiteManager connected to an empty inventory table."""
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(f"data/{FILENAME}{suffix}"):
+            os.remove(f"data/{FILENAME}{suffix}")
+
+    sq_man = ThreadedSQLiteManager(FILENAME, retry_delay=0.01)
+    commands.CreateInventoryTable(sq_man).execute()
+
+    yield sq_man
+
+    sq_man.close()
+
+
+def hold_write_lock(seconds: float) -> threading.Thread:
+    """Holds the write lock on the test database from another connection."""
+    locked = threading.Event()
+
+    def lock() -> None:
+        connection = sqlite3.connect(f"data/{FILENAME}", isolation_level=None)
+        connection.execute("BEGIN IMMEDIATE")
+        locked.set()
+        threading.Event().wait(seconds)
+        connection.execute("COMMIT")
+        connection.close()
+
+    thread = threading.Thread(target=lock)
+    thread.start()
+    locked.wait()
+
+    return thread
+
+
+class Test_ThreadedSQLiteManager:
+    """Tests using the database from many threads.
+
+    Behaviors Tested:
+        - Each thread uses its own connection.
+        - Commands can be executed from a thread pool.
+        - Reads run while another thread writes.
+        - The database uses write-ahead logging.
+        - Statements are retried while the database is busy.
+        - Busy errors are raised once the retries are used up.
+        - Transactions are tracked separately for each thread.
+    """
+
+    def test_each_thread_uses_its_own_connection(self, receiver) -> None:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            connections = set(
+                executor.map(lambda _: id(receiver.connection), range(20))
+            )
+
+        assert id(receiver.connection) not in connections
+
+    def test_commands_can_be_executed_from_a_thread_pool(self, receiver) -> None:
+        def add(id_number: int) -> None:
+            commands.AddAdjustment(receiver).execute(return_adjustment(id_number))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(add, range(1, 101)))
+
+        assert len(commands.ListAdjustments(receiver).execute()) == 100
+
+    def test_reads_run_while_another_thread_writes(self, receiver) -> None:
+        stop = threading.Event()
+
+        def write() -> None:
+            id_number = 0
+            while not stop.is_set():
+                id_number += 1
+                commands.AddAdjustment(receiver).execute(return_adjustment(id_number))
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                counts = list(
+                    executor.map(
+                        lambda _: len(commands.ListAdjustments(receiver).execute()),
+                        range(40),
+                    )
+                )
+        finally:
+            stop.set()
+            writer.join()
+
+        total = len(commands.ListAdjustments(receiver).execute())
+
+        assert len(counts) == 40 and max(counts) <= total
+
+    def test_database_uses_write_ahead_logging(self, receiver) -> None:
+        journal_mode = receiver.connection.execute("PRAGMA journal_mode;").fetchone()
+
+        assert journal_mode[0] == "wal"
+
+    def test_statements_are_retried_while_database_is_busy(self, receiver) -> None:
+        receiver.busy_timeout = 0
+        receiver.close()
+
+        thread = hold_write_lock(0.1)
+        commands.AddAdjustment(receiver).execute(return_adjustment(1))
+        thread.join()
+
+        assert len(commands.ListAdjustments(receiver).execute()) == 1
+
+    def test_busy_errors_are_raised_after_retries(self, receiver) -> None:
+        receiver.busy_timeout = 0
+        receiver.max_retries = 1
+        receiver.close()
+
+        thread = hold_write_lock(0.3)
+        try:
+            with raises(sqlite3.OperationalError):
+                commands.AddAdjustment(receiver).execute(return_adjustment(1))
+        finally:
+            thread.join()
+
+    def test_transactions_are_tracked_for_each_thread(self, receiver) -> None:
+        depths = []
+
+        with receiver.transaction():
+            thread = threading.Thread(
+                target=lambda: depths.append(receiver._transaction_depth)
+            )
+            thread.start()
+            thread.join()
+            depths.append(receiver._transaction_depth)
+
+        assert depths == [0, 1]
@@ -0,0 +1,142 @@
+"""Integration tests for the Write Queue.
+
+Classes:
+    Test_WriteQueue: Tests committing commands from many threads.
+"""
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import raises
+
+from narcotics_tracker import commands
+from narcotics_tracker.items.adjustments import Adjustment
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+from narcotics_tracker.services.write_queue import WriteQueue
+
+
+def return_adjustment(id_number: int) -> Adjustment:
+    """Returns an Adjustment with the passed id."""
+    return Adjustment(
+        "inventory", id_number, 1, 1, "Test", 1, "USE", "fentanyl", -50, "PCR", 1
+    )
+
+
+def setup_database() -> None:
+    """Creates the inventory table in the test database."""
+    sq_man = SQLiteManager("data_item_storage_tests.db")
+    commands.CreateInventoryTable(sq_man).execute()
+
+
+def return_receiver() -> SQLiteManager:
+    """Returns the receiver used by the writer thread."""
+    return SQLiteManager("data_item_storage_tests.db")
+
+
+class Test_WriteQueue:
+    """Tests committing commands from many threads.
+
+    Behaviors Tested:
+        - Futures receive the results of the commands.
+        - Commands from many threads are all committed.
+        - Commands are committed in groups.
+        - Only the failing command receives an exception.
+        - Adjustments can be updated.
+        - Closed queues reject commands.
+        - Cancelled commands are not run.
+    """
+
+    def test_futures_receive_command_results(self, reset_database) -> None:
+        setup_database()
+
+        with WriteQueue(return_receiver) as write_queue:
+            future = write_queue.add_adjustment(return_adjustment(1))
+
+        assert future.result() == "Adjustment added to inventory table."
+
+    def test_commands_from_many_threads_are_committed(self, reset_database) -> None:
+        setup_database()
+
+        with WriteQueue(return_receiver) as write_queue:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = list(
+                    pool.map(
+                        lambda number: write_queue.add_adjustment(
+                            return_adjustment(number)
+                        ),
+                        range(1, 201),
+                    )
+                )
+            write_queue.flush()
+
+        sq_man = return_receiver()
+        assert all(future.done() for future in futures)
+        assert len(commands.ListAdjustments(sq_man).execute()) == 200
+
+    def test_commands_are_committed_in_groups(self, reset_database) -> None:
+        setup_database()
+        commits = []
+
+        class CountingSQLiteManager(SQLiteManager):
+            def transaction(self):
+                commits.append(1)
+                return super().transaction()
+
+        receiver_factory = lambda: CountingSQLiteManager("data_item_storage_tests.db")
+        with WriteQueue(receiver_factory, max_rows=50, max_delay=5) as write_queue:
+            for number in range(1, 101):
+                write_queue.add_adjustment(return_adjustment(number))
+
+        assert len(commits) == 2
+
+    def test_only_failing_command_receives_exception(self, reset_database) -> None:
+        setup_database()
+
+        with WriteQueue(return_receiver, max_delay=5) as write_queue:
+            first = write_queue.add_adjustment(return_adjustment(1))
+            duplicate = write_queue.add_adjustment(return_adjustment(1))
+            last = write_queue.add_adjustment(return_adjustment(2))
+
+        assert first.result() and last.result()
+        with raises(sqlite3.IntegrityError):
+            duplicate.result()
+
+    def test_adjustments_can_be_updated(self, reset_database) -> None:
+        setup_database()
+
+        with WriteQueue(return_receiver) as write_queue:
+            write_queue.add_adjustment(return_adjustment(1))
+            write_queue.update_adjustment({"amount": -75}, {"id": 1})
+
+        adjustment = commands.ListAdjustments(return_receiver()).execute()[0]
+        assert adjustment[4] == -75
+
+    def test_closed_queues_reject_commands(self, reset_database) -> None:
+        write_queue = WriteQueue(return_receiver)
+        write_queue.close()
+
+        with raises(RuntimeError):
+            write_queue.add_adjustment(return_adjustment(1))
+
+    def test_cancelled_commands_are_not_run(self, reset_database) -> None:
+        setup_database()
+        started = threading.Event()
+
+        def receiver_factory() -> SQLiteManager:
+            started.wait()
+            return return_receiver()
+
+        with WriteQueue(receiver_factory, max_delay=0) as write_queue:
+            cancelled = write_queue.add_adjustment(return_adjustment(1))
+            kept = write_queue.add_adjustment(return_adjustment(2))
+            cancelled.cancel()
+            started.set()
+            write_queue.flush()
+
+            later = write_queue.add_adjustment(return_adjustment(3))
+            write_queue.flush()
+
+        adjustments = commands.ListAdjustments(return_receiver()).execute()
+        assert kept.result() and later.result()
+        assert [adjustment[0] for adjustment in adjustments] == [2, 3]
@@ -219,6 +219,16 @@ def create_tables(receiver):
         command(receiver).execute()
 
 
+def remove_autoincrement(receiver: SQLiteManager) -> None:
+    """Rebuilds the inventory table as it was created before AUTOINCREMENT."""
+    statements = commands.MigrateInventoryKeys._return_rebuild_statements(
+        "inventory", "inventory_migration", False, False
+    )
+    receiver.execute_script(
+        [statement.replace(" AUTOINCREMENT", "") for statement in statements]
+    )
+
+
 def populate_standard_items(receiver):
     try:
         events = None
@@ -0,0 +1,94 @@
+"""Contains unit tests for the Benchmark Comparison.
+
+Classes:
+
+    Test_BenchmarkCompare: Tests comparing results to a baseline.
+"""
+
+import json
+
+from benchmarks.compare import compare_results, create_baseline, main
+
+
+def return_results(p50: float) -> dict[str, dict]:
+    """Returns results for a single benchmark with the passed p50 time."""
+    return {"sqlite_read/small": {"p50": p50, "p95": p50 * 2, "throughput": 1 / p50}}
+
+
+class Test_BenchmarkCompare:
+    """Tests comparing results to a baseline.
+
+    Behaviors Tested:
+        - Baselines keep the tolerances of the previous baseline.
+        - Results within the tolerance pass.
+        - Results beyond the tolerance regress.
+        - Per benchmark tolerances replace the default.
+        - New and missing benchmarks are reported.
+        - The command exits non-zero on regression.
+        - The command runs the benchmarks on a freshly generated dataset.
+    """
+
+    def test_baselines_keep_previous_tolerances(self) -> None:
+        previous = create_baseline(return_results(0.001))
+        previous["benchmarks"]["sqlite_read/small"]["tolerance"] = 0.5
+
+        baseline = create_baseline(return_results(0.002), previous)
+
+        assert baseline["benchmarks"]["sqlite_read/small"]["tolerance"] == 0.5
+        assert baseline["benchmarks"]["sqlite_read/small"]["p50"] == 0.002
+
+    def test_results_within_tolerance_pass(self) -> None:
+        baseline = create_baseline(return_results(0.001))
+
+        comparison = compare_results(baseline, return_results(0.0012))[0]
+
+        assert comparison.status == "ok"
+
+    def test_results_beyond_tolerance_regress(self) -> None:
+        baseline = create_baseline(return_results(0.001))
+
+        comparison = compare_results(baseline, return_results(0.0013))[0]
+
+        assert comparison.status == "regressed"
+
+    def test_benchmark_tolerances_replace_default(self) -> None:
+        baseline = create_baseline(return_results(0.001))
+        baseline["benchmarks"]["sqlite_read/small"]["tolerance"] = 0.5
+
+        comparison = compare_results(baseline, return_results(0.0013))[0]
+
+        assert comparison.status == "ok"
+
+    def test_new_and_missing_benchmarks_are_reported(self) -> None:
+        baseline = create_baseline(return_results(0.001))
+        results = {"sqlite_add/small": return_results(0.001)["sqlite_read/small"]}
+
+        comparisons = compare_results(baseline, results)
+
+        assert [item.status for item in comparisons] == ["new", "missing"]
+
+    def test_command_exits_non_zero_on_regression(self, tmp_path) -> None:
+        baseline_file = tmp_path / "baseline.json"
+        results_file = tmp_path / "results.json"
+        baseline_file.write_text(json.dumps(create_baseline(return_results(0.001))))
+        results_file.write_text(json.dumps({"results": return_results(0.002)}))
+
+        status = main(
+            ["--baseline", str(baseline_file), "--results", str(results_file)]
+        )
+
+        assert status == 1
+
+    def test_command_runs_benchmarks_on_generated_dataset(
+        self, tmp_path, monkeypatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        arguments = ["--baseline", "baseline.json", "--samples", "2"]
+
+        update_status = main(arguments + ["--update"])
+        status = main(arguments + ["--tolerance", "100"])
+
+        baseline = json.loads((tmp_path / "baseline.json").read_text())
+        assert update_status == 0 and status == 0
+        assert "adjustment_builder/small" in baseline["benchmarks"]
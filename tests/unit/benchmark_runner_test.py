@@ -0,0 +1,41 @@
+"""Contains unit tests for the Benchmark Runner.
+
+Classes:
+
+    Test_BenchmarkRunner: Tests the functions which time the scenarios.
+"""
+
+from benchmarks.runner import format_results, percentile, run_scenario
+from benchmarks.scenarios import Scenario
+
+
+class Test_BenchmarkRunner:
+    """Tests the functions which time the scenarios.
+
+    Behaviors Tested:
+        - Percentiles use the nearest rank.
+        - Scenarios are called once per operation.
+        - Results can be formatted as a table.
+    """
+
+    def test_percentiles_use_nearest_rank(self) -> None:
+        samples = [5, 1, 4, 2, 3, 6, 7, 8, 9, 10]
+
+        assert percentile(samples, 50) == 5 and percentile(samples, 95) == 10
+
+    def test_scenarios_are_called_once_per_operation(self) -> None:
+        calls = []
+        scenario = Scenario("append", lambda: calls.append(1), number=5)
+
+        result = run_scenario(scenario, "tiny", samples=4, warmup=1)
+
+        assert len(calls) == 25 and result.operations == 20
+        assert result.name == "append/tiny"
+
+    def test_results_can_be_formatted_as_table(self) -> None:
+        scenario = Scenario("noop", lambda: None)
+        result = run_scenario(scenario, "tiny", samples=2, warmup=0)
+
+        table = format_results([result])
+
+        assert table.splitlines()[1].startswith("noop/tiny")
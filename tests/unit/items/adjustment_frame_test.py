@@ -0,0 +1,118 @@
+"""Unit tests the Adjustment Frame Module.
+
+Classes:
+
+    Test_AdjustmentFrame: Unit tests the AdjustmentFrame Class.
+"""
+
+import sqlite3
+
+from pytest import fixture
+
+from narcotics_tracker.items.adjustment_frame import AdjustmentFrame
+
+COLUMNS = [
+    "id",
+    "adjustment_date",
+    "event_code",
+    "medication_code",
+    "amount",
+    "reporting_period_id",
+    "reference_id",
+]
+
+ROWS = [
+    (1, 1666061200, "IMPORT", "fentanyl", 7450.0, 1, "ref"),
+    (2, 1666061300, "USE", "fentanyl", -50.0, 1, "ref"),
+    (3, 1666061400, "USE", "midazolam", -5.0, 1, "ref"),
+    (4, 1666061500, "WASTE", "fentanyl", -25.0, 2, "ref"),
+    (5, 1666061600, "USE", "fentanyl", -100.0, 2, "ref"),
+]
+
+
+@fixture
+def test_frame() -> AdjustmentFrame:
+    """Returns an AdjustmentFrame loaded with test data."""
+    return AdjustmentFrame.from_rows(COLUMNS, ROWS)
+
+
+class Test_AdjustmentFrame:
+    """Unit tests the AdjustmentFrame Class.
+
+    Behaviors Tested:
+        - AdjustmentFrames can be loaded from rows.
+        - AdjustmentFrames can be loaded from a cursor.
+        - AdjustmentFrames store codes as categories.
+        - AdjustmentFrames can be filtered by code.
+        - AdjustmentFrames can be filtered by reporting period.
+        - AdjustmentFrames return the total amount.
+        - AdjustmentFrames can sum amounts by a single column.
+        - AdjustmentFrames can sum amounts by multiple columns.
+        - Filtered AdjustmentFrames only sum the remaining codes.
+        - AdjustmentFrames can relabel categories.
+    """
+
+    def test_adjustment_frames_can_be_loaded_from_rows(self, test_frame) -> None:
+        assert len(test_frame) == 5
+
+    def test_adjustment_frames_can_be_loaded_from_a_cursor(self) -> None:
+        connection = sqlite3.connect(":memory:")
+        connection.execute(f"CREATE TABLE inventory ({', '.join(COLUMNS)})")
+        connection.executemany(
+            "INSERT INTO inventory VALUES (?, ?, ?, ?, ?, ?, ?)", ROWS
+        )
+        cursor = connection.execute("SELECT * FROM inventory")
+
+        frame = AdjustmentFrame.from_cursor(cursor, batch_size=2)
+
+        assert list(frame.ids) == [1, 2, 3, 4, 5]
+
+    def test_adjustment_frames_store_codes_as_categories(self, test_frame) -> None:
+        assert list(test_frame._codes["medication_code"]) == [0, 0, 1, 0, 0]
+
+    def test_adjustment_frames_can_be_filtered_by_code(self, test_frame) -> None:
+        used_fentanyl = test_frame.filter(event_code="USE", medication_code="fentanyl")
+
+        assert list(used_fentanyl.ids) == [2, 5]
+
+    def test_adjustment_frames_can_be_filtered_by_reporting_period(
+        self, test_frame
+    ) -> None:
+        second_period = test_frame.filter(reporting_period_id=2)
+
+        assert second_period.codes("event_code") == ["WASTE", "USE"]
+
+    def test_adjustment_frames_return_total_amount(self, test_frame) -> None:
+        assert test_frame.filter(medication_code="fentanyl").total() == 7275.0
+
+    def test_adjustment_frames_can_sum_by_single_column(self, test_frame) -> None:
+        assert test_frame.group_sum("event_code") == {
+            "IMPORT": 7450.0,
+            "USE": -155.0,
+            "WASTE": -25.0,
+        }
+
+    def test_adjustment_frames_can_sum_by_multiple_columns(self, test_frame) -> None:
+        totals = test_frame.group_sum(("reporting_period_id", "medication_code"))
+
+        assert totals == {
+            (1, "fentanyl"): 7400.0,
+            (1, "midazolam"): -5.0,
+            (2, "fentanyl"): -125.0,
+        }
+
+    def test_filtered_adjustment_frames_only_sum_remaining_codes(
+        self, test_frame
+    ) -> None:
+        frame = test_frame.filter(event_code="WASTE")
+
+        assert frame.group_sum("medication_code") == {"fentanyl": -25.0}
+        assert frame.group_sum("event_code") == {"WASTE": -25.0}
+
+    def test_adjustment_frames_can_relabel_categories(self, test_frame) -> None:
+        test_frame.relabel("medication_code", str.upper)
+
+        assert test_frame.group_sum("medication_code") == {
+            "FENTANYL": 7275.0,
+            "MIDAZOLAM": -5.0,
+        }
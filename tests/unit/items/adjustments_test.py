@@ -3,9 +3,11 @@
 Classes:
 
     Test_Adjustment: Unit tests the Adjustment Class.
+
+    Test_CompactAdjustment: Unit tests the CompactAdjustment Class.
 """
 
-from narcotics_tracker.items.adjustments import Adjustment
+from narcotics_tracker.items.adjustments import Adjustment, CompactAdjustment
 
 
 class Test_Adjustment:
@@ -94,3 +96,42 @@ class Test_Adjustment:
             "reference_id": "Tina's Mom",
             "reporting_period_id": -36,
         }
+
+
+class Test_CompactAdjustment:
+    """Unit tests the CompactAdjustment Class.
+
+    Behaviors Tested:
+        - CompactAdjustments return the table as a class constant.
+        - CompactAdjustments do not have an attribute dictionary.
+        - CompactAdjustments return expected adjustment_amount.
+        - CompactAdjustments return the same string as Adjustments.
+    """
+
+    test_adjustment = CompactAdjustment(
+        id=-1,
+        adjustment_date=524990800,
+        event_code="BIRTH",
+        medication_code="TINA",
+        amount=1,
+        reference_id="Tina's Mom",
+        reporting_period_id=-36,
+        created_date=1666061200,
+        modified_date=1666061200,
+        modified_by="SRK",
+    )
+
+    def test_compact_adjustments_return_table_as_class_constant(self) -> None:
+        assert CompactAdjustment.table == "inventory"
+
+    def test_compact_adjustments_do_not_have_attribute_dictionary(self) -> None:
+        assert hasattr(self.test_adjustment, "__dict__") == False
+
+    def test_compact_adjustments_return_expected_adjustment_amount(self) -> None:
+        assert self.test_adjustment.amount == 1
+
+    def test_compact_adjustments_return_expected_string(self) -> None:
+        assert (
+            str(self.test_adjustment)
+            == "Adjustment #-1: TINA adjusted by 1 due to BIRTH on 524990800."
+        )
@@ -0,0 +1,47 @@
+"""Unit tests the DataItem Interface Module.
+
+Classes:
+
+    Test_ReturnColumnData: Unit tests the return_column_data function.
+"""
+
+from narcotics_tracker.items.events import CompactEvent, Event
+from narcotics_tracker.items.interfaces.dataitem_interface import return_column_data
+
+
+class Test_ReturnColumnData:
+    """Unit tests the return_column_data function.
+
+    Behaviors Tested:
+        - Returns expected dictionary for DataItems.
+        - Returns expected dictionary for CompactDataItems.
+        - Does not modify the DataItem.
+    """
+
+    expected_dictionary = {
+        "id": -1,
+        "created_date": 1666061200,
+        "modified_date": 1666061200,
+        "modified_by": "SRK",
+        "event_code": "test_event",
+        "event_name": "Test Event",
+        "description": "An event used for testing.",
+        "modifier": 999,
+    }
+
+    def test_returns_expected_dictionary_for_dataitems(self) -> None:
+        test_event = Event(table="events", **self.expected_dictionary)
+
+        assert return_column_data(test_event) == self.expected_dictionary
+
+    def test_returns_expected_dictionary_for_compact_dataitems(self) -> None:
+        test_event = CompactEvent(**self.expected_dictionary)
+
+        assert return_column_data(test_event) == self.expected_dictionary
+
+    def test_does_not_modify_the_dataitem(self) -> None:
+        test_event = Event(table="events", **self.expected_dictionary)
+
+        return_column_data(test_event)
+
+        assert test_event.table == "events"
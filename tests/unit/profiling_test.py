@@ -0,0 +1,67 @@
+"""Contains unit tests for the Profiling Module.
+
+Classes:
+
+    Test_Profiling: Tests profiling the scripts.
+"""
+
+import sys
+
+from narcotics_tracker.scripts import profiling
+
+
+def outer_function() -> int:
+    """Calls inner_function so that it appears in a call stack."""
+    return sum(inner_function(number) for number in range(2000))
+
+
+def inner_function(number: int) -> int:
+    """Returns the square of a number."""
+    return number * number
+
+
+class Test_Profiling:
+    """Tests profiling the scripts.
+
+    Behaviors Tested:
+        - Scripts run normally without the profile option.
+        - The profile option writes the statistics and collapsed stacks.
+        - Collapsed stacks contain the callers of each function.
+        - The hot functions and peak memory are printed.
+    """
+
+    def test_scripts_run_normally_without_profile_option(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        monkeypatch.setattr(sys, "argv", ["script"])
+        monkeypatch.delenv(profiling.PROFILE_VARIABLE, raising=False)
+        monkeypatch.setenv(profiling.DIRECTORY_VARIABLE, str(tmp_path))
+
+        result = profiling.run(outer_function, "test_script")
+
+        assert result == outer_function() and list(tmp_path.iterdir()) == []
+
+    def test_profile_option_writes_output_files(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setattr(sys, "argv", ["script", "--profile"])
+        monkeypatch.setenv(profiling.DIRECTORY_VARIABLE, str(tmp_path))
+
+        profiling.run(outer_function, "test_script")
+
+        assert (tmp_path / "test_script.pstats").exists()
+        assert (tmp_path / "test_script.collapsed").exists()
+        assert sys.argv == ["script"]
+
+    def test_collapsed_stacks_contain_callers(self, tmp_path) -> None:
+        profiling.profile(outer_function, "test_script", str(tmp_path))
+
+        stacks = (tmp_path / "test_script.collapsed").read_text()
+
+        assert "outer_function (profiling_test.py:13);" in stacks
+        assert "inner_function (profiling_test.py:18)" in stacks
+
+    def test_hot_functions_and_peak_memory_are_printed(self, tmp_path, capsys) -> None:
+        profiling.profile(outer_function, "test_script", str(tmp_path))
+
+        output = capsys.readouterr().out
+
+        assert "inner_function" in output and "Peak memory traced" in output
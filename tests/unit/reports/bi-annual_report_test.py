@@ -401,3 +401,8 @@ class Test_BiAnnualNarcoticsInventory:
                 },
             }
         }
+
+        sq_man = SQLiteManager("integration_test.db")
+        report = BiAnnualNarcoticsInventory(sq_man).run()
+
+        assert report == expected_dict
@@ -0,0 +1,70 @@
+"""Contains classes to test the DataItem Serializer Module.
+
+Classes:
+
+    Test_DataItemSerializer: Tests the DataItemSerializer class.
+
+"""
+
+from narcotics_tracker.items.units import CompactUnit, Unit
+from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
+
+
+class Test_DataItemSerializer:
+    """Tests the DataItemSerializer class.
+
+    DataItemSerializer Behaviors Tested:
+        - Builds the expected insert statement.
+        - Returns the expected values.
+        - Does not modify the DataItem.
+        - Is shared between items of the same class and table.
+        - Serializes CompactDataItems.
+        - Can save attributes into differently named columns.
+    """
+
+    def test_DataItemSerializer_builds_expected_insert_statement(
+        self, test_unit
+    ) -> None:
+        serializer = DataItemSerializer.for_item(test_unit)
+
+        assert serializer.insert_statement == (
+            "INSERT INTO units (id, created_date, modified_date, modified_by, "
+            "unit_code, unit_name, decimals) VALUES (?, ?, ?, ?, ?, ?, ?);"
+        )
+
+    def test_DataItemSerializer_returns_expected_values(self, test_unit) -> None:
+        serializer = DataItemSerializer.for_item(test_unit)
+
+        values = serializer.return_values(test_unit)
+
+        assert values == (-1, 1666061200, 1666061200, "System", "dg", "decagrams", 7)
+
+    def test_DataItemSerializer_does_not_modify_dataitem(self, test_unit) -> None:
+        serializer = DataItemSerializer.for_item(test_unit)
+
+        serializer.return_values(test_unit)
+
+        assert test_unit.table == "units"
+
+    def test_DataItemSerializer_is_shared_between_items(self, test_unit) -> None:
+        other_unit = Unit("units", -2, 1, 1, "System", "cg", "centigrams", 6)
+
+        serializer = DataItemSerializer.for_item(test_unit)
+
+        assert serializer is DataItemSerializer.for_item(other_unit)
+
+    def test_DataItemSerializer_serializes_compact_dataitems(self) -> None:
+        compact_unit = CompactUnit(-2, 1, 1, "System", "cg", "centigrams", 6)
+
+        serializer = DataItemSerializer.for_item(compact_unit)
+
+        assert serializer.table_name == "units"
+        assert serializer.return_values(compact_unit)[4] == "cg"
+
+    def test_DataItemSerializer_can_rename_columns(self, test_unit) -> None:
+        serializer = DataItemSerializer.for_item(test_unit)
+        column_names = [column.upper() for column in serializer.columns]
+
+        renamed = serializer.with_column_names(column_names)
+
+        assert "(ID, CREATED_DATE," in renamed.insert_statement
@@ -24,6 +24,8 @@ class Test_DateTimeManager:
 
         - Can convert timestamp to string.
 
+        - Can return the year of a timestamp.
+
         - _date_is_invalid returns True when None is passed.
 
         - _date_is_invalid returns True when a string is passed.
@@ -48,6 +50,11 @@ class Test_DateTimeManager:
 
         assert pdt.convert_to_string(505077000) == "01-02-1986 14:10:00"
 
+    def test_DateTimeManager_can_return_year_of_timestamp(self) -> None:
+        pdt = DateTimeManager()
+
+        assert pdt.return_year(505077000) == 1986
+
     def test_assign_datetime_returns_current_timestamp(self) -> None:
         pdt = DateTimeManager()
         assert pdt._assign(None) == pdt._current_datetime().int_timestamp
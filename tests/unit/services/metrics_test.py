@@ -0,0 +1,92 @@
+"""Contains classes to test the Metrics Module.
+
+Classes:
+
+    Test_MetricsRegistry: Tests the MetricsRegistry class.
+
+"""
+
+import json
+
+from narcotics_tracker import commands
+from narcotics_tracker.services.metrics import MetricsRegistry, metrics_registry
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+
+class Test_MetricsRegistry:
+    """Tests the MetricsRegistry class.
+
+    MetricsRegistry Behaviors Tested:
+        - Does not record calls while disabled.
+        - Records calls, queries and rows of commands.
+        - Records histograms of call latency.
+        - Returns metrics as JSON.
+        - Returns metrics in the Prometheus text format.
+    """
+
+    def test_MetricsRegistry_does_not_record_while_disabled(
+        self, reset_database, test_unit
+    ) -> None:
+        metrics_registry.reset()
+        sq_man = SQLiteManager("test_database.db")
+        commands.CreateUnitsTable(sq_man).execute()
+
+        assert metrics_registry.return_metrics() == {}
+
+    def test_MetricsRegistry_records_commands(self, reset_database, test_unit) -> None:
+        metrics_registry.reset()
+        metrics_registry.enabled = True
+        sq_man = SQLiteManager("test_database.db")
+
+        try:
+            commands.CreateUnitsTable(sq_man).execute()
+            commands.AddUnit(sq_man).execute(test_unit)
+            commands.ListUnits(sq_man).execute()
+        finally:
+            metrics_registry.enabled = False
+
+        metrics = metrics_registry.return_metrics()
+        assert metrics["AddUnit"].calls == 1
+        assert metrics["AddUnit"].queries == 1
+        assert metrics["AddUnit"].rows_changed == 1
+        assert metrics["ListUnits"].rows_returned == 1
+
+    def test_MetricsRegistry_records_latency_histograms(self) -> None:
+        registry = MetricsRegistry(enabled=True)
+
+        class Sleeper:
+            def execute(self) -> None:
+                pass
+
+        registry.instrument(Sleeper, "execute")
+        Sleeper().execute()
+
+        metrics = registry.return_metrics()["Sleeper"]
+        assert sum(metrics.latency_buckets) == 1 and metrics.latency_buckets[0] == 1
+
+    def test_MetricsRegistry_returns_json(self) -> None:
+        registry = MetricsRegistry(enabled=True)
+
+        class Lister:
+            def execute(self) -> list:
+                return [1, 2, 3]
+
+        registry.instrument(Lister, "execute")
+        Lister().execute()
+
+        data = json.loads(registry.to_json())
+        assert data["metrics"]["Lister"]["rows_returned"] == 3
+
+    def test_MetricsRegistry_returns_prometheus_text(self) -> None:
+        registry = MetricsRegistry(enabled=True)
+
+        class Lister:
+            def execute(self) -> list:
+                return [1, 2, 3]
+
+        registry.instrument(Lister, "execute")
+        Lister().execute()
+
+        text = registry.to_prometheus()
+        assert 'narcotics_tracker_command_calls_total{command="Lister"} 1' in text
+        assert 'duration_seconds_bucket{command="Lister",le="+Inf"} 1' in text
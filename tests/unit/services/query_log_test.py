@@ -0,0 +1,92 @@
+"""Contains classes to test the Query Log Module.
+
+Classes:
+
+    Test_QueryLog: Tests the QueryLog class.
+
+"""
+
+import os
+
+from narcotics_tracker import commands
+from narcotics_tracker.services.dataitem_serializer import DataItemSerializer
+from narcotics_tracker.services.query_log import QueryLog
+from narcotics_tracker.services.sqlite_manager import SQLiteManager
+
+
+class Test_QueryLog:
+    """Tests the QueryLog class.
+
+    QueryLog Behaviors Tested:
+        - Counts and times statements.
+        - Times bulk inserts and the statements of scripts.
+        - Does not log fast statements.
+        - Logs slow statements with their query plan.
+        - Describes parameters without their values.
+    """
+
+    def test_QueryLog_counts_and_times_statements(self, reset_database) -> None:
+        query_log = QueryLog(threshold=10, filename="data/test_queries.log")
+        db = SQLiteManager("test_database.db", query_log=query_log)
+
+        db.create_table("test_table", {"number": "INTEGER"})
+        db.read("test_table")
+
+        assert query_log.statement_count == 2 and query_log.total_time > 0
+        query_log.close()
+
+    def test_QueryLog_times_bulk_inserts_and_scripts(
+        self, reset_database, test_unit
+    ) -> None:
+        if os.path.exists("data/test_queries.log"):
+            os.remove("data/test_queries.log")
+        query_log = QueryLog(threshold=0, filename="data/test_queries.log")
+        db = SQLiteManager("test_database.db", query_log=query_log)
+        commands.CreateUnitsTable(db).execute()
+        serializer = DataItemSerializer.for_item(test_unit)
+
+        db.insert_many(serializer, serializer.return_rows([test_unit]))
+        db.execute_script(
+            ["UPDATE units SET decimals = 2;", "DELETE FROM units WHERE id = -1;"]
+        )
+        query_log.close()
+
+        with open("data/test_queries.log") as log_file:
+            log = log_file.read()
+        assert query_log.statement_count == 4
+        assert "INSERT INTO units" in log and "Parameters: 7 (" in log
+        assert "DELETE FROM units WHERE id = -1;" in log
+
+    def test_QueryLog_does_not_log_fast_statements(self, reset_database) -> None:
+        if os.path.exists("data/test_queries.log"):
+            os.remove("data/test_queries.log")
+        query_log = QueryLog(threshold=10, filename="data/test_queries.log")
+        db = SQLiteManager("test_database.db", query_log=query_log)
+
+        db.create_table("test_table", {"number": "INTEGER"})
+        query_log.close()
+
+        assert query_log.slow_count == 0
+        assert os.path.getsize("data/test_queries.log") == 0
+
+    def test_QueryLog_logs_slow_statements_with_query_plan(
+        self, reset_database
+    ) -> None:
+        if os.path.exists("data/test_queries.log"):
+            os.remove("data/test_queries.log")
+        query_log = QueryLog(threshold=0, filename="data/test_queries.log")
+        db = SQLiteManager("test_database.db", query_log=query_log)
+        db.create_table("test_table", {"number": "INTEGER"})
+
+        db.read("test_table", {"number": 7})
+        query_log.close()
+
+        with open("data/test_queries.log") as log_file:
+            log = log_file.read()
+        assert "SELECT * FROM test_table WHERE number = ?" in log
+        assert "Parameters: 1 (int)" in log and "SCAN test_table" in log
+
+    def test_QueryLog_describes_parameters_without_values(self) -> None:
+        description = QueryLog.describe_parameters((7, "secret", None))
+
+        assert description == "3 (int, str, NoneType)"
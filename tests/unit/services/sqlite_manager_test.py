@@ -8,6 +8,9 @@ Classes:
 
 import os
 
+from pytest import raises
+
+from narcotics_tracker.items.units import CompactUnit, Unit
 from narcotics_tracker.services.sqlite_manager import SQLiteManager
 
 
@@ -24,6 +27,13 @@ class Test_SQLiteManager:
         - Can delete data.
         - Can order returned data.
         - Can update data.
+        - Can return column names.
+        - Can build DataItems from rows.
+        - Reuses statements for criteria in a different order.
+        - Can set the size of the sqlite3 statement cache.
+        - Rolls back all statements in a failed transaction.
+        - Refuses to update rows without criteria.
+        - Refuses to remove rows without criteria.
     """
 
     def test_SQLiteManager_object_can_be_instantiated(self):
@@ -102,3 +112,77 @@ class Test_SQLiteManager:
         cursor = db.read("test_table")
         results = cursor.fetchall()
         assert results == [(7, "Pig")]
+
+    def test_SQLiteManager_can_return_column_names(self, reset_database):
+        db = SQLiteManager("test_database.db")
+        db.create_table("test_table", {"number": "INTEGER", "word": "TEXT"})
+
+        assert db.return_columns("test_table") == ["number", "word"]
+
+    def test_SQLiteManager_can_build_dataitems_from_rows(self, test_unit):
+        columns = ["unit_name", "id", "unit_code", "decimals", "extra"]
+        columns += ["created_date", "modified_date", "modified_by"]
+        row = ("decagrams", -1, "dg", 7, "ignored", 1666061200, 1666061200, "System")
+
+        build_unit = SQLiteManager.return_row_factory(Unit, "units", columns)
+        build_compact_unit = SQLiteManager.return_row_factory(
+            CompactUnit, "units", columns
+        )
+
+        assert build_unit(None, row) == test_unit
+        assert build_compact_unit(None, row).unit_code == "dg"
+
+    def test_SQLiteManager_reuses_statements_for_reordered_criteria(
+        self, reset_database
+    ):
+        db = SQLiteManager("test_database.db")
+        db.create_table("test_table", {"number": "INTEGER", "word": "TEXT"})
+        db.add("test_table", {"number": 17, "word": "Cow"})
+        SQLiteManager.clear_statement_cache()
+
+        db.read("test_table", {"number": 17, "word": "Cow"})
+        data = db.read("test_table", {"word": "Cow", "number": 17}).fetchall()
+
+        cache_info = SQLiteManager.statement_cache_info()
+        assert data == [(17, "Cow")]
+        assert cache_info.hits == 1 and cache_info.misses == 1
+
+    def test_SQLiteManager_can_set_statement_cache_size(self, reset_database):
+        db = SQLiteManager("test_database.db", cached_statements=256)
+
+        assert db.cached_statements == 256
+        assert SQLiteManager.cached_statements == 128
+
+    def test_SQLiteManager_rolls_back_failed_transactions(self, reset_database):
+        db = SQLiteManager("test_database.db")
+        db.create_table("test_table", {"number": "INTEGER"})
+
+        try:
+            with db.transaction():
+                db.add("test_table", {"number": 1})
+                db.add("test_table", {"number": 2})
+                raise RuntimeError("Failed during the transaction.")
+        except RuntimeError:
+            pass
+
+        assert db.read("test_table").fetchall() == []
+
+    def test_SQLiteManager_refuses_to_update_without_criteria(self, reset_database):
+        db = SQLiteManager("test_database.db")
+        db.create_table("test_table", {"number": "INTEGER"})
+        db.add("test_table", {"number": 1})
+
+        with raises(ValueError):
+            db.update("test_table", {"number": 2}, {})
+
+        assert db.read("test_table").fetchall() == [(1,)]
+
+    def test_SQLiteManager_refuses_to_remove_without_criteria(self, reset_database):
+        db = SQLiteManager("test_database.db")
+        db.create_table("test_table", {"number": "INTEGER"})
+        db.add("test_table", {"number": 1})
+
+        with raises(ValueError):
+            db.remove("test_table", {})
+
+        assert db.read("test_table").fetchall() == [(1,)]